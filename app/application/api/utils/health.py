@@ -0,0 +1,24 @@
+from typing import Any
+
+from dishka.integrations.litestar import FromDishka, inject
+from litestar import Response, Router, get
+from litestar.status_codes import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
+
+from app.infrastructure.services.warmup import WarmupReport
+
+
+@get(path="/live", description="Process is up and serves requests")
+async def liveness() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@get(path="/ready", description="Application finished warm-up and can take traffic")
+@inject
+async def readiness(report: FromDishka[WarmupReport]) -> Response[dict[str, Any]]:
+    return Response(
+        content=report.as_dict(),
+        status_code=HTTP_200_OK if report.ready else HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
+router: Router = Router(path="/health", route_handlers=[liveness, readiness], tags=["health"])
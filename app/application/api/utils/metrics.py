@@ -0,0 +1,69 @@
+from typing import Any
+
+from dishka.integrations.litestar import FromDishka, inject
+from litestar import Router, get
+
+from app.infrastructure.adapters.alchemy.pool import DatabasePoolsMetrics
+from app.infrastructure.adapters.alchemy.routing import ReplicaRouter
+from app.infrastructure.cache.memory import CacheMetrics
+from app.infrastructure.outbox.relay import OutboxRelayMetrics
+from app.infrastructure.security.executor import HashingMetrics
+from app.infrastructure.services.coalescing import WriteCoalescingMetrics
+from app.logic.message_bus import MessageBusMetrics
+
+
+@get(path="/hashing", description="Queue depth and latency of password hashing pool")
+@inject
+async def hashing_metrics(metrics: FromDishka[HashingMetrics]) -> dict[str, Any]:
+    return metrics.as_dict()
+
+
+@get(path="/outbox", description="Throughput and lag of outbox relay")
+@inject
+async def outbox_metrics(metrics: FromDishka[OutboxRelayMetrics]) -> dict[str, Any]:
+    return metrics.as_dict()
+
+
+@get(path="/message-bus", description="Latency, failures and timeouts of event handlers")
+@inject
+async def message_bus_metrics(metrics: FromDishka[MessageBusMetrics]) -> dict[str, Any]:
+    return metrics.as_dict()
+
+
+@get(path="/users-cache", description="Hits, misses and evictions of users cache")
+@inject
+async def users_cache_metrics(metrics: FromDishka[CacheMetrics]) -> dict[str, Any]:
+    return metrics.as_dict()
+
+
+@get(path="/write-coalescing", description="Batches and fallbacks of coalesced user inserts")
+@inject
+async def write_coalescing_metrics(metrics: FromDishka[WriteCoalescingMetrics]) -> dict[str, Any]:
+    return metrics.as_dict()
+
+
+@get(path="/replicas", description="Routing of read-only sessions between primary and replicas")
+@inject
+async def replicas_metrics(router: FromDishka[ReplicaRouter]) -> dict[str, Any]:
+    return router.as_dict()
+
+
+@get(path="/database-pools", description="Checked out connections, overflow, wait time and timeouts of database pools")
+@inject
+async def database_pools_metrics(metrics: FromDishka[DatabasePoolsMetrics]) -> dict[str, Any]:
+    return metrics.as_dict()
+
+
+router: Router = Router(
+    path="/metrics",
+    route_handlers=[
+        hashing_metrics,
+        outbox_metrics,
+        message_bus_metrics,
+        users_cache_metrics,
+        write_coalescing_metrics,
+        replicas_metrics,
+        database_pools_metrics,
+    ],
+    tags=["metrics"],
+)
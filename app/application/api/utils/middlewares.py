@@ -0,0 +1,71 @@
+import math
+from typing import TYPE_CHECKING, Final, Optional
+
+from litestar.connection import ASGIConnection
+from litestar.datastructures import Cookie, MutableScopeHeaders
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+
+from app.infrastructure.adapters.alchemy.routing import ReadYourWrites, pinned_until
+
+if TYPE_CHECKING:
+    from contextvars import Token
+
+    from dishka import AsyncContainer
+    from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+WRITE_METHODS: Final[frozenset[str]] = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class ReadYourWritesMiddleware(ASGIMiddleware):
+    """
+    Pins the client to primary database after its successful write, so its next reads don't go to a lagging replica.
+
+    Pin is a short-lived cookie with time, until which the client is pinned. It's carried by the client,
+    so the next request is pinned by any worker or node, which gets it. Clients without cookies are never pinned.
+    """
+
+    scopes = (ScopeType.HTTP,)
+
+    def __init__(self, cookie: str) -> None:
+        self._cookie: str = cookie
+
+    async def handle(self, scope: "Scope", receive: "Receive", send: "Send", next_app: "ASGIApp") -> None:
+        token: Token[float] = pinned_until.set(self._get_pinned_until(scope))
+
+        try:
+            if scope["method"] not in WRITE_METHODS:
+                await next_app(scope, receive, send)
+                return
+
+            container: AsyncContainer = scope["app"].state.dishka_container
+            read_your_writes: ReadYourWrites = await container.get(ReadYourWrites)
+
+            if not read_your_writes.enabled:
+                await next_app(scope, receive, send)
+                return
+
+            async def send_wrapper(message: "Message") -> None:
+                if message["type"] == "http.response.start" and message["status"] < 400:
+                    cookie: Cookie = Cookie(
+                        key=self._cookie,
+                        value=f"{read_your_writes.pin():.3f}",
+                        max_age=math.ceil(read_your_writes.window),
+                        httponly=True,
+                        samesite="lax",
+                    )
+                    MutableScopeHeaders.from_message(message).add("set-cookie", cookie.to_header(header=""))
+
+                await send(message)
+
+            await next_app(scope, receive, send_wrapper)
+        finally:
+            pinned_until.reset(token)
+
+    def _get_pinned_until(self, scope: "Scope") -> float:
+        value: Optional[str] = ASGIConnection(scope).cookies.get(self._cookie)
+
+        try:
+            return float(value) if value is not None else 0.0
+        except ValueError:
+            return 0.0
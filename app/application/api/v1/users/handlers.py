@@ -3,19 +3,42 @@ from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.litestar import inject
-from litestar import Controller, delete, get, post, put
+from litestar import Controller, Request, delete, get, post, put
+from litestar.exceptions.http_exceptions import RequestEntityTooLarge
 from litestar.openapi.spec import Example
 from litestar.params import Body, Parameter
+from litestar.response import Stream
 from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
 
-from app.application.api.v1.users.schemas import CreateUserSchemaRequest, UpdateUserSchemaRequest, UserSchemaResponse
-from app.infrastructure.uow.users.base import UsersUnitOfWork
-from app.logic.commands.users import CreateUserCommand, DeleteUserCommand, UpdateUserCommand
+from app.application.api.v1.users.importing import limit_body_size, read_import_chunks
+from app.application.api.v1.users.schemas import (
+    CreateUserSchemaRequest,
+    ImportRowErrorSchema,
+    UpdateUserSchemaRequest,
+    UsersBatchSchemaResponse,
+    UserSchemaResponse,
+    UsersDeleteSchemaResponse,
+    UsersImportSchemaResponse,
+    UsersPageSchemaResponse,
+)
+from app.exceptions.logic import TooManyIdsError
+from app.logic.commands.users import (
+    CreateUserCommand,
+    DeleteUserCommand,
+    DeleteUsersCommand,
+    ImportUsersCommand,
+    UpdateUserCommand,
+    UpsertUserCommand,
+)
 from app.logic.message_bus import MessageBus
+from app.logic.types.formats import DataFormat
 from app.logic.views.users import UsersViews
+from app.settings.configs.app import Settings
 
 if TYPE_CHECKING:
     from app.domain.entities.user import UserEntity
+    from app.infrastructure.repositories.users.base import UserReadModel
+    from app.logic.views.pagination import Page
 
 
 class UserController(Controller):
@@ -39,7 +62,7 @@ class UserController(Controller):
         :param message_bus: MessageBus taken from IoC
         :return: schema that represents the user
         """
-        await message_bus.handle(
+        user: UserEntity = await message_bus.handle(
             CreateUserCommand(
                 surname=data.surname,
                 name=data.name,
@@ -47,24 +70,47 @@ class UserController(Controller):
             )
         )
 
-        return UserSchemaResponse.from_entity(message_bus.command_result)
+        return UserSchemaResponse.from_entity(user)
 
     @get(path="/{user_id:uuid}", description="HTTP handler for getting user by his id", status_code=HTTP_200_OK)
     @inject
     async def get_user(
         self,
         user_id: Annotated[UUID, Body(description="user ID", title="user ID")],
-        users_uow: FromDishka[UsersUnitOfWork],
+        view: FromDishka[UsersViews],
     ) -> UserSchemaResponse:
         """
         Handler for getting user by his id.
         :param user_id: UUID of the provided user
-        :param users_uow: UsersUnitOfWork taken from IoC
+        :param view: UsersViews taken from IoC
         :return: schema that represents the user
         """
-        view: UsersViews = UsersViews(users_uow)
-        user: UserEntity = await view.get_user_by_id(str(user_id))
-        return UserSchemaResponse.from_entity(user)
+        user: UserReadModel = await view.get_user_by_id(user_id)
+        return UserSchemaResponse.from_read_model(user)
+
+    @get(path="/batch", description="HTTP handler for getting several users by their ids", status_code=HTTP_200_OK)
+    @inject
+    async def get_users_batch(
+        self,
+        ids: Annotated[
+            list[UUID],
+            Parameter(title="users IDs", description="IDs of users, repeat parameter for each id", min_items=1),
+        ],
+        view: FromDishka[UsersViews],
+    ) -> UsersBatchSchemaResponse:
+        """
+        Handler for getting several users by one query.
+        :param ids: UUIDs of users
+        :param view: UsersViews taken from IoC
+        :return: found users in order of ids and ids which were not found
+        """
+        users: list[UserReadModel] = await view.get_users_by_ids(ids)
+        found_ids: set[UUID] = {user.oid for user in users}
+
+        return UsersBatchSchemaResponse(
+            items=[UserSchemaResponse.from_read_model(user) for user in users],
+            missing=[user_id for user_id in dict.fromkeys(ids) if user_id not in found_ids],
+        )
 
     @delete(
         path="/{user_id:uuid}",
@@ -83,9 +129,44 @@ class UserController(Controller):
         :param message_bus: MessageBus class from IoC
         :return: None
         """
-        await message_bus.handle(DeleteUserCommand(oid=str(user_id)))
+        return await message_bus.handle(DeleteUserCommand(oid=user_id))
 
-        return message_bus.command_result
+    @delete(
+        path="/",
+        description="HTTP handler for deleting several users by their ids",
+        status_code=HTTP_200_OK,
+    )
+    @inject
+    async def delete_users(
+        self,
+        ids: Annotated[
+            list[UUID],
+            Parameter(title="users IDs", description="IDs of users, repeat parameter for each id", min_items=1),
+        ],
+        message_bus: FromDishka[MessageBus],
+        settings: FromDishka[Settings],
+    ) -> UsersDeleteSchemaResponse:
+        """
+        Handler for deleting several users by one statement, unknown ids are skipped.
+        At most PAGINATION_MAX_PAGE_SIZE users can be deleted at once, as in getting users by ids.
+        :param ids: UUIDs of users
+        :param message_bus: MessageBus class from IoC
+        :param settings: settings of application from IoC
+        :return: ids of deleted users and ids which were not found
+        """
+        user_ids: list[UUID] = list(dict.fromkeys(ids))
+        max_page_size: int = settings.pagination.max_page_size
+
+        if len(user_ids) > max_page_size:
+            raise TooManyIdsError(f"Please delete at most {max_page_size} users at once")
+
+        deleted_ids: list[UUID] = await message_bus.handle(DeleteUsersCommand(oids=tuple(user_ids)))
+        deleted: set[UUID] = set(deleted_ids)
+
+        return UsersDeleteSchemaResponse(
+            deleted=[user_id for user_id in user_ids if user_id in deleted],
+            missing=[user_id for user_id in user_ids if user_id not in deleted],
+        )
 
     @put(
         path="/{user_id:uuid}",
@@ -98,24 +179,34 @@ class UserController(Controller):
         user_id: Annotated[UUID, Body(description="user ID", title="user ID")],
         data: Annotated[UpdateUserSchemaRequest, Body(title="Update User", description="Update a user.")],
         message_bus: FromDishka[MessageBus],
+        upsert: Annotated[
+            bool,
+            Parameter(
+                default=False,
+                title="upsert",
+                description="Create user with this id, if it doesn't exist, instead of returning 404",
+            ),
+        ] = False,
     ) -> UserSchemaResponse:
         """
-        Handler for updating user
+        Handler for updating user. With upsert it's idempotent: user is created or replaced by one statement.
         :param user_id: UUID of user which client must provide
         :param data: body that user must provide
         :param message_bus: MessageBus class from IoC
+        :param upsert: create user, if it doesn't exist
         :return: schema that represents the user
         """
-        await message_bus.handle(
-            UpdateUserCommand(
-                oid=str(user_id),
+        command_type: type[UpdateUserCommand | UpsertUserCommand] = UpsertUserCommand if upsert else UpdateUserCommand
+        user: UserEntity = await message_bus.handle(
+            command_type(
+                oid=user_id,
                 surname=data.surname,
                 name=data.name,
                 password=data.password,
             )
         )
 
-        return UserSchemaResponse.from_entity(message_bus.command_result)
+        return UserSchemaResponse.from_entity(user)
 
     @get(path="/", description="HTTP handler for getting users with pagination", status_code=HTTP_200_OK)
     @inject
@@ -137,15 +228,145 @@ class UserController(Controller):
                 default=1, ge=1, title="page size", description="Page size for pagination", examples=[Example(value=1)]
             ),
         ],
-        users_uow: FromDishka[UsersUnitOfWork],
+        view: FromDishka[UsersViews],
     ) -> list[UserSchemaResponse]:
         """
         Handler for getting users with pagination
-        :param users_uow: UsersUnitOfWork taken from IoC
+        :param view: UsersViews taken from IoC
         :param page_number: number of the page
         :param page_size: size of the page
         :return: list of schemas that represents the users
         """
-        view: UsersViews = UsersViews(users_uow)
-        users: list[UserEntity] = await view.get_all_users(page_number=page_number, page_size=page_size)
-        return [UserSchemaResponse.from_entity(user) for user in users]
+        users: list[UserReadModel] = await view.get_all_users(page_number=page_number, page_size=page_size)
+        return [UserSchemaResponse.from_read_model(user) for user in users]
+
+    @get(
+        path="/cursor",
+        description="HTTP handler for getting users with cursor (keyset) pagination",
+        status_code=HTTP_200_OK,
+    )
+    @inject
+    async def get_users_by_cursor(
+        self,
+        view: FromDishka[UsersViews],
+        page_size: Annotated[
+            int,
+            Parameter(
+                default=10,
+                ge=1,
+                title="page size",
+                description="Page size for pagination, limited by server",
+                examples=[Example(value=10)],
+            ),
+        ],
+        cursor: Annotated[
+            str | None,
+            Parameter(
+                default=None,
+                title="cursor",
+                description="Cursor of the page from next_cursor of the previous response, omit for the first page",
+            ),
+        ] = None,
+    ) -> UsersPageSchemaResponse:
+        """
+        Handler for getting users with cursor pagination, which doesn't slow down on deep pages
+        :param view: UsersViews taken from IoC
+        :param page_size: size of the page
+        :param cursor: opaque cursor of the page
+        :return: schema with users of the page and cursor of the next page
+        """
+        page: Page[UserReadModel] = await view.get_users_page(cursor=cursor, page_size=page_size)
+        return UsersPageSchemaResponse.from_page(page)
+
+    @get(
+        path="/export",
+        description="HTTP handler for streaming export of all users as NDJSON or CSV",
+        status_code=HTTP_200_OK,
+    )
+    @inject
+    async def export_users(
+        self,
+        view: FromDishka[UsersViews],
+        export_format: Annotated[
+            DataFormat,
+            Parameter(
+                query="format",
+                default=DataFormat.NDJSON,
+                title="format",
+                description="Format of export, ndjson or csv",
+            ),
+        ],
+    ) -> Stream:
+        """
+        Handler for exporting all users without loading them into memory at once
+        :param view: UsersViews taken from IoC
+        :param export_format: format of export
+        :return: streaming response with users
+        """
+        return Stream(
+            view.export_users(export_format),
+            media_type=export_format.media_type,
+            headers={"Content-Disposition": f'attachment; filename="users.{export_format}"'},
+        )
+
+    @post(
+        path="/import",
+        description="HTTP handler for bulk import of users from streamed NDJSON or CSV body",
+        status_code=HTTP_200_OK,
+        request_max_body_size=None,
+    )
+    @inject
+    async def import_users(
+        self,
+        request: Request,
+        message_bus: FromDishka[MessageBus],
+        settings: FromDishka[Settings],
+        import_format: Annotated[
+            DataFormat,
+            Parameter(
+                query="format",
+                default=DataFormat.NDJSON,
+                title="format",
+                description="Format of body, ndjson or csv with header: surname,name,password",
+            ),
+        ],
+    ) -> UsersImportSchemaResponse:
+        """
+        Handler for bulk import of users. Body is read by chunks, each chunk is created by one command,
+        so memory doesn't depend on size of body. Invalid rows and rows of chunks, which couldn't be saved,
+        are skipped and reported. Body larger than IMPORT_MAX_BODY_SIZE is rejected, chunks before it stay imported.
+        :param request: request with streamed body
+        :param message_bus: MessageBus class from IoC
+        :param settings: settings of application from IoC
+        :param import_format: format of body
+        :return: number of imported users and errors of rows
+        """
+        report: UsersImportSchemaResponse = UsersImportSchemaResponse()
+        max_reported_errors: int = settings.importing.max_reported_errors
+        max_body_size: int = settings.importing.max_body_size
+
+        if request.content_length is not None and request.content_length > max_body_size:
+            raise RequestEntityTooLarge
+
+        async for chunk in read_import_chunks(
+            limit_body_size(request.stream(), max_body_size),
+            import_format,
+            settings.importing.chunk_size,
+            settings.importing.max_line_size,
+        ):
+            errors: list[tuple[int, str]] = chunk.errors
+
+            if chunk.commands:
+                command_errors: dict[int, str] = await message_bus.handle(
+                    ImportUsersCommand(users=tuple(chunk.commands))
+                )
+                report.imported += len(chunk.commands) - len(command_errors)
+                errors += [(chunk.lines[index], message) for index, message in command_errors.items()]
+
+            report.failed += len(errors)
+            report.errors += [
+                ImportRowErrorSchema(line=line, message=message)
+                for line, message in sorted(errors)[: max_reported_errors - len(report.errors)]
+            ]
+
+        return report
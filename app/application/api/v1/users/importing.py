@@ -0,0 +1,141 @@
+import csv
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from litestar.exceptions.http_exceptions import RequestEntityTooLarge
+from pydantic import ValidationError
+
+from app.application.api.v1.users.schemas import CreateUserSchemaRequest
+from app.logic.commands.users import CreateUserCommand
+from app.logic.types.formats import DataFormat
+
+
+@dataclass
+class ImportChunk:
+    """
+    Chunk of import: commands of valid rows with their line numbers and errors of rows, which couldn't be parsed.
+    """
+
+    commands: list[CreateUserCommand] = field(default_factory=list)
+    lines: list[int] = field(default_factory=list)
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.commands) + len(self.errors)
+
+
+async def limit_body_size(body: AsyncIterator[bytes], max_body_size: int) -> AsyncIterator[bytes]:
+    """
+    Passes streamed body through, until it gets larger than max_body_size. Chunks before it are already consumed.
+    """
+    size: int = 0
+
+    async for data in body:
+        size += len(data)
+
+        if size > max_body_size:
+            raise RequestEntityTooLarge
+
+        yield data
+
+
+async def _read_lines(body: AsyncIterator[bytes], max_line_size: int) -> AsyncIterator[tuple[int, Optional[bytes]]]:
+    """
+    Splits streamed body into numbered lines, only parts of the current line are kept in memory.
+    Line longer than max_line_size is returned as None, its parts are dropped until the next line break.
+    """
+    parts: list[bytes] = []
+    size: int = 0
+    too_long: bool = False
+    number: int = 0
+
+    async for data in body:
+        *lines, tail = data.split(b"\n")
+
+        for line in lines:
+            number += 1
+
+            if too_long or size + len(line) > max_line_size:
+                yield number, None
+            else:
+                parts.append(line)
+                yield number, b"".join(parts)
+
+            parts, size, too_long = [], 0, False
+
+        if too_long:
+            continue
+
+        size += len(tail)
+
+        if size > max_line_size:
+            parts, too_long = [], True
+        elif tail:
+            parts.append(tail)
+
+    if too_long:
+        yield number + 1, None
+    elif parts:
+        yield number + 1, b"".join(parts)
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, detail['loc'])) or 'row'}: {detail['msg']}" for detail in error.errors())
+
+
+async def read_import_chunks(
+    body: AsyncIterator[bytes],
+    data_format: DataFormat,
+    chunk_size: int,
+    max_line_size: int = 4096,
+) -> AsyncIterator[ImportChunk]:
+    """
+    Parses NDJSON lines or CSV rows with header (surname, name, password) from streamed body and groups them into
+    chunks of chunk_size rows. Rows are validated by the same schema as single user creation.
+    Values of CSV must not contain line breaks. Rows longer than max_line_size bytes are reported as errors.
+    """
+    chunk: ImportChunk = ImportChunk()
+    header: list[str] | None = None
+
+    async for number, raw_line in _read_lines(body, max_line_size):
+        if raw_line is not None and not raw_line.strip():
+            continue
+
+        record: Any
+        try:
+            if raw_line is None:
+                raise ValueError(f"row is longer than {max_line_size} bytes")
+
+            line: str = raw_line.decode().rstrip("\r")
+
+            if data_format is DataFormat.CSV:
+                values: list[str] = next(csv.reader([line]))
+
+                if header is None:
+                    header = values
+                    continue
+
+                if len(values) != len(header):
+                    raise ValueError(f"expected {len(header)} values, got {len(values)}")
+
+                record = dict(zip(header, values, strict=True))
+            else:
+                record = json.loads(line)
+
+            schema: CreateUserSchemaRequest = CreateUserSchemaRequest.model_validate(record)
+        except ValidationError as error:
+            chunk.errors.append((number, _format_validation_error(error)))
+        except ValueError as error:
+            chunk.errors.append((number, f"Couldn't parse row: {error}"))
+        else:
+            chunk.commands.append(CreateUserCommand(surname=schema.surname, name=schema.name, password=schema.password))
+            chunk.lines.append(number)
+
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = ImportChunk()
+
+    if len(chunk):
+        yield chunk
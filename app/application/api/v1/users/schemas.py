@@ -1,15 +1,17 @@
-import uuid
-from typing import Annotated, Self
+from typing import TYPE_CHECKING, Self
+from uuid import UUID
 
-from pydantic import UUID4, AfterValidator, BaseModel, Field
+from pydantic import BaseModel, Field
 
 from app.domain.entities.user import UserEntity
 
+if TYPE_CHECKING:
+    from app.infrastructure.repositories.users.base import UserReadModel
+    from app.logic.views.pagination import Page
+
 
 class UserSchemaResponse(BaseModel):
-    oid: UUID4 | Annotated[str, AfterValidator(lambda x: uuid.UUID(x, version=4))] = Field(
-        ..., description="UUID of the user"
-    )
+    oid: UUID = Field(..., description="UUID of the user")
 
     name: str = Field(min_length=1, max_length=40, description="Name of the user")
     surname: str = Field(min_length=1, max_length=40, description="Surname of the user")
@@ -22,6 +24,32 @@ class UserSchemaResponse(BaseModel):
             oid=entity.oid,
         )
 
+    @classmethod
+    def from_read_model(cls, user: "UserReadModel") -> Self:
+        return cls(surname=user.surname, name=user.name, oid=user.oid)
+
+
+class UsersPageSchemaResponse(BaseModel):
+    items: list[UserSchemaResponse] = Field(..., description="Users of the page")
+    next_cursor: str | None = Field(None, description="Cursor of the next page, null on the last page")
+
+    @classmethod
+    def from_page(cls, page: "Page[UserReadModel]") -> Self:
+        return cls(
+            items=[UserSchemaResponse.from_read_model(user) for user in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+
+class UsersBatchSchemaResponse(BaseModel):
+    items: list[UserSchemaResponse] = Field(..., description="Found users in order of requested ids")
+    missing: list[UUID] = Field(default_factory=list, description="Requested ids, which were not found")
+
+
+class UsersDeleteSchemaResponse(BaseModel):
+    deleted: list[UUID] = Field(..., description="Ids of deleted users")
+    missing: list[UUID] = Field(default_factory=list, description="Requested ids, which were not found")
+
 
 class CreateUserSchemaRequest(BaseModel):
     surname: str = Field(min_length=2, max_length=40, description="Surname of user")
@@ -30,3 +58,14 @@ class CreateUserSchemaRequest(BaseModel):
 
 
 class UpdateUserSchemaRequest(CreateUserSchemaRequest): ...
+
+
+class ImportRowErrorSchema(BaseModel):
+    line: int = Field(..., description="Number of line in the imported body, starting from 1")
+    message: str = Field(..., description="Why row was not imported")
+
+
+class UsersImportSchemaResponse(BaseModel):
+    imported: int = Field(0, description="Number of created users")
+    failed: int = Field(0, description="Number of rows, which were not imported")
+    errors: list[ImportRowErrorSchema] = Field(default_factory=list, description="Errors of rows, may be truncated")
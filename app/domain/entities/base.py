@@ -1,6 +1,5 @@
 from abc import ABC
 from dataclasses import (
-    asdict,
     dataclass,
     field,
 )
@@ -12,50 +11,43 @@ from typing import (
     Any,
     Optional,
 )
-from uuid import uuid4
+from uuid import UUID
+
+from app.domain.entities.ids import new_id
+from app.domain.serializers import NO_FIELDS, get_serializer
 
 
 @dataclass(eq=False)
 class BaseEntity(ABC):  # noqa: B024
     """
     Base entity, from which any domain model should be inherited.
+    Unlike value objects, entities keep __dict__ and aren't frozen: imperative mapping of SQLAlchemy stores
+    state of instance and loaded columns in it.
     """
 
-    oid: str = field(default_factory=lambda: str(uuid4()), kw_only=True)
+    oid: UUID = field(default_factory=new_id, kw_only=True)
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC), kw_only=True)
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC), kw_only=True)
 
-    async def to_dict(
+    def to_dict(
         self,
         exclude: Optional[set[str]] = None,
         include: Optional[dict[str, Any]] = None,
         save_classes_value_objects: bool = False,
     ) -> dict[str, Any]:
         """
-        Create a dictionary representation of the entity.
+        Create a dictionary representation of the entity. Values aren't copied, the entity isn't changed.
 
         exclude: set of model fields, which should be excluded from dictionary representation.
         include: set of model fields, which should be included into dictionary representation.
+        save_classes_value_objects: keep value objects instead of their values.
         """
+        data: dict[str, Any] = get_serializer(
+            type(self),
+            frozenset(exclude) if exclude else NO_FIELDS,
+            not save_classes_value_objects,
+        )(self)
 
-        if save_classes_value_objects:
-            data: dict[str, Any] = vars(self)
-        else:
-            data: dict[str, Any] = asdict(self)
-
-            for key, value in data.items():
-                if isinstance(value, dict) and "value" in value:
-                    data[key] = value["value"]
-
-        # For sqlalchemy
-        data.pop("_sa_instance_state", None)
-
-        # Handle exclude set
-        if exclude:
-            for key in exclude:
-                data.pop(key, None)
-
-        # Handle include dictionary
         if include:
             data.update(include)
 
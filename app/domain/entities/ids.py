@@ -0,0 +1,102 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import UTC, datetime
+from typing import Final, override
+from uuid import UUID, uuid4
+
+_UUID7_VERSION: Final[int] = 0x7 << 76
+_UUID_VARIANT: Final[int] = 0b10 << 62
+_UUID7_MAX_COUNTER: Final[int] = 0xFFF
+_UUID7_RANDOM_MASK: Final[int] = (1 << 62) - 1
+
+
+class BaseIdGenerator(ABC):
+    """
+    Generator of oids for new entities and other stored records.
+    """
+
+    @abstractmethod
+    def __call__(self) -> UUID:
+        raise NotImplementedError
+
+
+class UUID4Generator(BaseIdGenerator):
+    """
+    Random ids, new rows land on random pages of primary key index.
+    """
+
+    @override
+    def __call__(self) -> UUID:
+        return uuid4()
+
+
+class UUID7Generator(BaseIdGenerator):
+    """
+    Time-ordered ids of RFC 9562: 48 bits of unix time in milliseconds, then 12 bits of counter and 62 random bits.
+    New rows are appended to the end of primary key index instead of random pages.
+
+    Ids are monotonic within the process: counter is started from random value every millisecond
+    and incremented for ids of the same millisecond, on its overflow or when clock goes back
+    the time of the previous id is advanced by one millisecond.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._last_timestamp: int = 0
+        self._counter: int = 0
+
+    @override
+    def __call__(self) -> UUID:
+        timestamp: int = time.time_ns() // 1_000_000
+
+        with self._lock:
+            if timestamp > self._last_timestamp:
+                self._last_timestamp = timestamp
+                # Upper half of counter is left for ids of the same millisecond
+                self._counter = int.from_bytes(os.urandom(2)) & (_UUID7_MAX_COUNTER >> 1)
+            elif self._counter < _UUID7_MAX_COUNTER:
+                self._counter += 1
+            else:
+                self._last_timestamp += 1
+                self._counter = 0
+
+            timestamp, counter = self._last_timestamp, self._counter
+
+        random: int = int.from_bytes(os.urandom(8)) & _UUID7_RANDOM_MASK
+        return UUID(int=(timestamp << 80) | _UUID7_VERSION | (counter << 64) | _UUID_VARIANT | random)
+
+
+def uuid7_bound(moment: datetime) -> UUID:
+    """
+    The smallest UUIDv7 of the millisecond of moment, ids created since moment are greater or equal to it.
+    It allows to select rows by time range of their ids, e.g. oid >= uuid7_bound(start) AND oid < uuid7_bound(end).
+    """
+    timestamp: int = int(moment.timestamp() * 1000)
+    return UUID(int=(timestamp << 80) | _UUID7_VERSION | _UUID_VARIANT)
+
+
+def uuid7_created_at(oid: UUID) -> datetime:
+    """
+    Time of creation encoded in UUIDv7 with millisecond precision.
+    """
+    if oid.version != 7:
+        raise ValueError(f"{oid} is not UUIDv7")
+
+    return datetime.fromtimestamp((oid.int >> 80) / 1000, tz=UTC)
+
+
+_id_generator: BaseIdGenerator = UUID7Generator()
+
+
+def set_id_generator(generator: BaseIdGenerator) -> None:
+    """
+    Replaces generator of oids for new entities, e.g. by settings at start of application.
+    """
+    global _id_generator
+    _id_generator = generator
+
+
+def new_id() -> UUID:
+    return _id_generator()
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from app.domain.entities.base import BaseEntity
 from app.domain.values.user import Password, UserName, UserSurname
@@ -8,4 +8,4 @@ from app.domain.values.user import Password, UserName, UserSurname
 class UserEntity(BaseEntity):
     name: UserName
     surname: UserSurname
-    password: Password
+    password: Password = field(repr=False)
@@ -0,0 +1,56 @@
+import dataclasses
+import typing
+from collections.abc import Callable
+from typing import Any, Final
+
+from app.domain.values.base import BaseValueObject
+
+Serializer = Callable[[Any], dict[str, Any]]
+
+NO_FIELDS: Final[frozenset[str]] = frozenset()
+
+_serializers: dict[tuple[type, frozenset[str], bool], Serializer] = {}
+
+
+def get_serializer(cls: type, exclude: frozenset[str] = NO_FIELDS, unwrap_value_objects: bool = False) -> Serializer:
+    """
+    Returns serializer of dataclass, it's generated once for every class and set of excluded fields.
+    Plain dict is cheaper than functools.cache here, which builds its key from arguments on every call.
+    """
+    key: tuple[type, frozenset[str], bool] = (cls, exclude, unwrap_value_objects)
+
+    if (serializer := _serializers.get(key)) is None:
+        serializer = _serializers[key] = _generate_serializer(cls, exclude, unwrap_value_objects)
+
+    return serializer
+
+
+def _generate_serializer(cls: type, exclude: frozenset[str], unwrap_value_objects: bool) -> Serializer:
+    """
+    Generates function, which returns dict of dataclass fields of cls by one dict display, the same way as
+    dataclasses generate __init__.
+
+    Values aren't copied and the instance isn't changed. With unwrap_value_objects fields, which are annotated
+    by value objects, are replaced by values of value objects.
+    """
+    hints: dict[str, Any] = typing.get_type_hints(cls)
+    items: list[str] = []
+
+    for field in dataclasses.fields(cls):
+        if field.name in exclude:
+            continue
+
+        hint: Any = hints.get(field.name)
+        accessor: str = f"instance.{field.name}"
+
+        if unwrap_value_objects and isinstance(hint, type) and issubclass(hint, BaseValueObject):
+            accessor += ".value"
+
+        items.append(f"{field.name!r}: {accessor}")
+
+    source: str = f"def serialize(instance):\n    return {{{', '.join(items)}}}\n"
+    namespace: dict[str, Any] = {}
+    # Source is built only from names of dataclass fields, which are identifiers
+    exec(compile(source, f"<serializer of {cls.__qualname__}>", "exec"), namespace)
+
+    return namespace["serialize"]
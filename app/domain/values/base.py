@@ -6,16 +6,19 @@ from dataclasses import dataclass
 from typing import (
     Any,
     Generic,
+    Self,
     TypeVar,
 )
 
 T = TypeVar("T", bound=Any)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BaseValueObject(ABC, Generic[T]):
     """
     Base value object, from which any domain value object should be inherited.
+    Value objects are immutable and slotted (without __dict__), so subclasses must be declared
+    with the same dataclass parameters, otherwise their instances get __dict__ back.
     """
 
     value: T
@@ -23,6 +26,16 @@ class BaseValueObject(ABC, Generic[T]):
     def __post_init__(self) -> None:
         self.validate()
 
+    @classmethod
+    def from_trusted(cls, value: T) -> Self:
+        """
+        Creates value object without validation. Only for values, which were validated before they were saved,
+        e.g. read back from our database. Input of users must be passed to constructor.
+        """
+        instance: Self = object.__new__(cls)
+        object.__setattr__(instance, "value", value)
+        return instance
+
     @abstractmethod
     def validate(self) -> None:
         """
@@ -5,7 +5,7 @@ from app.domain.values.base import BaseValueObject
 from app.exceptions.domain import CantBeNumberError, EmptyFieldError, EmptyPasswordError, WrongTypeError
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserName(BaseValueObject[str]):
     value: str
 
@@ -25,11 +25,11 @@ class UserName(BaseValueObject[str]):
         return str(self.value)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserSurname(UserName): ...
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Password(BaseValueObject[bytes]):
     value: bytes
 
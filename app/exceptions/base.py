@@ -32,9 +32,9 @@ class BaseAppError(Exception, ABC):
         """
         Headers for exception.
         For example, you can write here information about bearer token and etc.
-        :return: dictionary of headers
+        :return: dictionary of headers or None, if error has no headers
         """
-        raise NotImplementedError
+        return None
 
     def __str__(self) -> str:
         """
@@ -29,3 +29,22 @@ class UnknownTopicError(InfrastructureError): ...
 
 @dataclass(eq=False)
 class TopicNotFoundInFactoryError(InfrastructureError): ...
+
+
+@dataclass(eq=False)
+class BatchedEventError(InfrastructureError): ...
+
+
+@dataclass(eq=False)
+class PasswordHashingOverloadedError(InfrastructureError):
+    @property
+    def status(self) -> int:
+        return HTTPStatus.SERVICE_UNAVAILABLE.value
+
+
+@dataclass(eq=False)
+class UnitOfWorkNotStartedError(InfrastructureError): ...
+
+
+@dataclass(eq=False)
+class ReadOnlyUnitOfWorkError(InfrastructureError): ...
@@ -14,3 +14,17 @@ class MessageBusMessageError(LogicError):
     @property
     def status(self) -> int:
         return HTTPStatus.INTERNAL_SERVER_ERROR.value
+
+
+@dataclass(eq=False)
+class InvalidCursorError(LogicError):
+    @property
+    def status(self) -> int:
+        return HTTPStatus.BAD_REQUEST.value
+
+
+@dataclass(eq=False)
+class TooManyIdsError(LogicError):
+    @property
+    def status(self) -> int:
+        return HTTPStatus.BAD_REQUEST.value
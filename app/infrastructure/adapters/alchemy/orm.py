@@ -1,10 +1,9 @@
-from sqlalchemy import Column, DateTime, MetaData, Table
-from sqlalchemy.orm import registry
+from sqlalchemy import JSON, UUID, Column, DateTime, Index, MetaData, String, Table
+from sqlalchemy.orm import deferred, registry
 from sqlalchemy.sql import func
 
 from app.infrastructure.adapters.alchemy.type_decorators import (
     PasswordTypeDecorator,
-    StringUUID,
     UserNameTypeDecorator,
     UserSurnameTypeDecorator,
 )
@@ -15,12 +14,23 @@ mapper_registry: registry = registry(metadata=metadata)
 users_table: Table = Table(
     "users",
     metadata,
-    Column("id", StringUUID(), primary_key=True, key="oid"),
+    Column("id", UUID(as_uuid=True), primary_key=True, key="oid"),
     Column("surname", UserSurnameTypeDecorator(100)),
     Column("name", UserNameTypeDecorator(100), nullable=False),
     Column("password", PasswordTypeDecorator(100), nullable=False),
     Column("created_at", DateTime(timezone=True), default=func.now()),
     Column("updated_at", DateTime(timezone=True), default=func.now(), onupdate=func.now()),
+    Index("ix_users_created_at_id", "created_at", "oid"),
+)
+
+outbox_table: Table = Table(
+    "outbox",
+    metadata,
+    Column("id", UUID(as_uuid=True), primary_key=True, key="oid"),
+    Column("topic", String(255), nullable=False),
+    Column("payload", JSON, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Index("ix_outbox_created_at", "created_at"),
 )
 
 
@@ -28,6 +38,8 @@ def start_mappers() -> None:
     """
     Map all domain models to ORM models, for purpose of using domain models directly during work with the database,
     according to DDD.
+    Password of user is deferred, so it isn't selected, unless it's requested explicitly, and access to it on
+    a user loaded without it raises instead of lazy loading.
     """
     from app.domain.entities.user import UserEntity
 
@@ -36,5 +48,6 @@ def start_mappers() -> None:
         local_table=users_table,
         properties={
             "oid": users_table.c.oid,
+            "password": deferred(users_table.c.password, raiseload=True),
         },
     )
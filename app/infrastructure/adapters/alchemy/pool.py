@@ -0,0 +1,156 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional, override
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, PoolProxiedConnection, QueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue
+
+from app.infrastructure.metrics.base import LatencyHistogram
+
+
+@dataclass
+class PoolMetrics:
+    """
+    Counters of one connection pool from pool events. Size, checked out and overflow are read from the pool itself,
+    so they are always current.
+    """
+
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    invalidations: int = 0
+    timeouts: int = 0
+    wait_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+    engine: Optional[Engine] = field(default=None, repr=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        pool_status: dict[str, Any] = {}
+
+        # Engine may recreate its pool, e.g. on dispose, so the pool is taken from engine every time
+        if self.engine is not None and isinstance(pool := self.engine.pool, QueuePool):
+            pool_status = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+            }
+
+        return {
+            **pool_status,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_time": self.wait_time.as_dict(),
+        }
+
+
+@dataclass
+class DatabasePoolsMetrics:
+    """
+    Metrics of pools of all engines by their names, e.g. primary and replicas.
+    """
+
+    pools: dict[str, PoolMetrics] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {name: metrics.as_dict() for name, metrics in self.pools.items()}
+
+
+class _InstrumentedQueue(AsyncAdaptedQueue[ConnectionPoolEntry]):
+    """
+    Queue of idle connections of pool, which measures time of taking a connection out of it. It's the wait for
+    a connection returned to the pool, opening of new connections and pre-ping are done by pool after it.
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    @override
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> ConnectionPoolEntry:
+        if self.metrics is None:
+            return super().get(block, timeout)
+
+        started: float = time.perf_counter()
+
+        try:
+            return super().get(block, timeout)
+        finally:
+            self.metrics.wait_time.observe(time.perf_counter() - started)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool, which measures time of waiting for a connection by its queue and counts checkout timeouts.
+    There is no pool event before checkout, so timeouts are counted by wrapping of connect().
+    """
+
+    _queue_class = _InstrumentedQueue
+    _pool: _InstrumentedQueue
+
+    @property
+    def metrics(self) -> Optional[PoolMetrics]:
+        return self._pool.metrics
+
+    @metrics.setter
+    def metrics(self, metrics: Optional[PoolMetrics]) -> None:
+        self._pool.metrics = metrics
+
+    @override
+    def connect(self) -> PoolProxiedConnection:
+        if self.metrics is None:
+            return super().connect()
+
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+
+    @override
+    def dispose(self) -> None:
+        # Idle connections are taken out of the queue to be closed, it's not a wait for connection
+        metrics: Optional[PoolMetrics] = self.metrics
+        self.metrics = None
+
+        try:
+            super().dispose()
+        finally:
+            self.metrics = metrics
+
+    @override
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        pool: InstrumentedAsyncAdaptedQueuePool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def instrument_engine(engine: AsyncEngine, metrics: PoolMetrics) -> None:
+    """
+    Collects metrics of pool of the engine. Listeners are kept by engine, when its pool is recreated.
+    """
+    sync_engine: Engine = engine.sync_engine
+    metrics.engine = sync_engine
+
+    if isinstance(sync_engine.pool, InstrumentedAsyncAdaptedQueuePool):
+        sync_engine.pool.metrics = metrics
+
+    def on_checkout(*_: Any) -> None:
+        metrics.checkouts += 1
+
+    def on_checkin(*_: Any) -> None:
+        metrics.checkins += 1
+
+    def on_connect(*_: Any) -> None:
+        metrics.connects += 1
+
+    def on_invalidate(*_: Any) -> None:
+        metrics.invalidations += 1
+
+    event.listen(sync_engine, "checkout", on_checkout)
+    event.listen(sync_engine, "checkin", on_checkin)
+    event.listen(sync_engine, "connect", on_connect)
+    event.listen(sync_engine, "invalidate", on_invalidate)
@@ -0,0 +1,125 @@
+import itertools
+import time
+from collections.abc import Iterator, Sequence
+from contextvars import ContextVar
+from typing import Any, Literal, Optional, override
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+RoutingStrategy = Literal["round_robin", "least_connections"]
+
+# Wall clock time, until which client of the current request is pinned to primary, it's set by middleware of API
+pinned_until: ContextVar[float] = ContextVar("pinned_until", default=0.0)
+
+
+class ReadYourWrites:
+    """
+    Pins clients, which wrote recently, so their reads go to primary for window seconds,
+    until replicas have most likely caught up. Pin is carried by the client itself (by cookie of API),
+    so it's honoured by every worker and node. Wall clock is used, as pins cross processes.
+    """
+
+    def __init__(self, window: float) -> None:
+        self._window: float = window
+
+    @property
+    def enabled(self) -> bool:
+        return self._window > 0
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    def pin(self) -> float:
+        """
+        :return: time, until which client, which has just written, must be pinned
+        """
+        return time.time() + self._window
+
+    def is_pinned(self) -> bool:
+        """
+        Pins further than window from now weren't given by this service (or its window was shortened),
+        so they are ignored and client can't pin itself forever.
+        """
+        now: float = time.time()
+        return now < pinned_until.get() <= now + self._window
+
+
+class ReplicaRouter:
+    """
+    Chooses engine for read-only session: primary, if there are no replicas or client is pinned by read-your-writes,
+    otherwise one of replicas by round-robin or by least number of checked out connections.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        strategy: RoutingStrategy = "round_robin",
+        read_your_writes: Optional[ReadYourWrites] = None,
+    ) -> None:
+        self._primary: AsyncEngine = primary
+        self._replicas: tuple[AsyncEngine, ...] = tuple(replicas)
+        self._strategy: RoutingStrategy = strategy
+        self._read_your_writes: Optional[ReadYourWrites] = read_your_writes
+        self._cycle: Iterator[int] = itertools.cycle(range(len(self._replicas)))
+        self._in_use: list[int] = [0] * len(self._replicas)
+        self._routed: list[int] = [0] * len(self._replicas)
+        self._routed_to_primary: int = 0
+
+        for index, replica in enumerate(self._replicas):
+            self._track_connections(replica, index)
+
+    @property
+    def replicas(self) -> tuple[AsyncEngine, ...]:
+        return self._replicas
+
+    def choose(self) -> AsyncEngine:
+        if not self._replicas or (self._read_your_writes is not None and self._read_your_writes.is_pinned()):
+            self._routed_to_primary += 1
+            return self._primary
+
+        if self._strategy == "least_connections":
+            index: int = min(range(len(self._replicas)), key=self._in_use.__getitem__)
+        else:
+            index = next(self._cycle)
+
+        self._routed[index] += 1
+        return self._replicas[index]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "strategy": self._strategy,
+            "routed_to_primary": self._routed_to_primary,
+            "replicas": [
+                {"url": replica.url.render_as_string(hide_password=True), "routed": routed, "in_use": in_use}
+                for replica, routed, in_use in zip(self._replicas, self._routed, self._in_use, strict=True)
+            ],
+        }
+
+    def _track_connections(self, engine: AsyncEngine, index: int) -> None:
+        def on_checkout(*_: Any) -> None:
+            self._in_use[index] += 1
+
+        def on_checkin(*_: Any) -> None:
+            self._in_use[index] -= 1
+
+        event.listen(engine.sync_engine, "checkout", on_checkout)
+        event.listen(engine.sync_engine, "checkin", on_checkin)
+
+
+class RoutingSessionMaker(async_sessionmaker[AsyncSession]):
+    """
+    Session maker for read-only unit of work, every new session is bound to engine chosen by router.
+    The session keeps its engine until it's closed, so all reads of one unit of work see the same database.
+    """
+
+    def __init__(self, router: ReplicaRouter, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._router: ReplicaRouter = router
+
+    @override
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        local_kw.setdefault("bind", self._router.choose())
+        return super().__call__(**local_kw)
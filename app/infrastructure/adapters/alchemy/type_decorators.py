@@ -39,7 +39,7 @@ class UserNameTypeDecorator(TypeDecorator):
     @override
     def process_result_value(self, value: str, dialect: Dialect) -> UserName:
         if value is not None:
-            return UserName(value)
+            return UserName.from_trusted(value)
         raise ConvertingError(f"{self.__class__.__name__}, method: process_result_value, value: {value}")
 
 
@@ -56,7 +56,7 @@ class UserSurnameTypeDecorator(TypeDecorator):
     @override
     def process_result_value(self, value: str, dialect: Dialect) -> UserSurname:
         if value is not None:
-            return UserSurname(value)
+            return UserSurname.from_trusted(value)
         raise ConvertingError(f"{self.__class__.__name__}, method: process_result_value, value: {value}")
 
 
@@ -73,5 +73,5 @@ class PasswordTypeDecorator(TypeDecorator):
     @override
     def process_result_value(self, column: bytes, dialect: Dialect) -> Password:
         if column is not None:
-            return Password(column)
+            return Password.from_trusted(column)
         raise ConvertingError(f"{self.__class__.__name__}, method: process_result_value, column: {column}")
@@ -0,0 +1,36 @@
+from dishka.integrations.faststream import FromDishka
+from faststream.kafka import KafkaBroker
+
+from app.infrastructure.brokers.schemas.users import UserDeleteSchema
+from app.infrastructure.cache.users import UsersCache
+from app.settings.configs.app import BrokerKafkaSettings
+
+
+async def invalidate_users_cache(messages: list[UserDeleteSchema], users_cache: FromDishka[UsersCache]) -> None:
+    """
+    Evicts users, which were changed on any node. Messages of every users topic have oid,
+    so all of them are parsed by the smallest schema.
+    """
+    for message in messages:
+        users_cache.invalidate(message.oid)
+
+
+def setup_users_cache_consumers(broker: KafkaBroker, settings: BrokerKafkaSettings) -> None:
+    """
+    Subscribes batch consumer of users topics to broker. Must be called before broker start.
+
+    Every process has its own users cache, so it must see every invalidation. By default consumer isn't in any
+    consumer group, it's assigned to all partitions of topics and doesn't commit offsets, so nothing is left on brokers
+    after restart. Configured group id must be unique per node, it must be stable too, otherwise restarts leave
+    orphaned groups. Consumer starts from the latest offset, because new process starts with empty cache.
+    """
+    broker.subscriber(
+        settings.user_create_topic,
+        settings.user_update_topic,
+        settings.user_delete_topic,
+        group_id=settings.cache_consumer_group_id,
+        batch=True,
+        max_records=settings.cache_consumer_max_records,
+        batch_timeout_ms=settings.cache_consumer_batch_timeout_ms,
+        auto_offset_reset="latest",
+    )(invalidate_users_cache)
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from typing import Any
 
 from pydantic import BaseModel
 
@@ -7,5 +9,26 @@ from app.infrastructure.brokers.publishers.base import BaseMessageBrokerPublishe
 
 class BaseKafkaMessageBrokerPublisher(BaseMessageBrokerPublisher, ABC):
     @abstractmethod
-    async def send_message(self, topic: str, value: BaseModel) -> None:
+    async def send_message(self, topic: str, value: BaseModel | Mapping[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def send_messages(self, topic: str, values: Sequence[BaseModel | Mapping[str, Any]]) -> None:
+        """
+        Sends several messages to one topic, keeping their order.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """
+        Publishes all messages, which were accepted, but are not sent to broker yet.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def warm_up(self) -> None:
+        """
+        Fetches metadata of all topics, so the first messages aren't delayed by metadata requests.
+        """
         raise NotImplementedError
@@ -1,7 +1,10 @@
+import asyncio
 import logging
-from collections.abc import Mapping
-from typing import Final, override
+from collections.abc import Mapping, Sequence
+from functools import partial
+from typing import Any, Final, Optional, override
 
+from aiokafka import AIOKafkaProducer
 from faststream.kafka import KafkaBroker
 from faststream.kafka.publisher.asyncapi import AsyncAPIBatchPublisher, AsyncAPIDefaultPublisher
 from pydantic import BaseModel
@@ -11,6 +14,17 @@ from app.infrastructure.brokers.publishers.kafka.base import BaseKafkaMessageBro
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
 
+Message = BaseModel | Mapping[str, Any]
+
+
+def get_aiokafka_producer(broker: KafkaBroker) -> Optional[AIOKafkaProducer]:
+    """
+    Returns aiokafka producer of connected FastStream broker, since FastStream doesn't expose metadata of topics.
+    It's not public API of FastStream 0.5, so None is returned, if broker isn't connected or internals are changed.
+    """
+    producer: Any = getattr(getattr(broker, "_producer", None), "_producer", None)
+    return producer if isinstance(producer, AIOKafkaProducer) else None
+
 
 class FastStreamKafkaMessageBroker(BaseKafkaMessageBrokerPublisher):
     def __init__(
@@ -25,15 +39,147 @@ class FastStreamKafkaMessageBroker(BaseKafkaMessageBrokerPublisher):
         await self._broker.start()
 
     @override
-    async def send_message(self, topic: str, value: BaseModel) -> None:
-        if (producer := self._producers.get(topic)) is None:
-            raise UnknownTopicError(f"Unknown topic {topic}, please configure in IOC")
+    async def send_message(self, topic: str, value: Message) -> None:
+        producer: AsyncAPIDefaultPublisher | AsyncAPIBatchPublisher = self._get_producer(topic)
 
         logger.info("Sending message %s to topic %s", value, topic)
 
-        await producer.publish(value)
+        if isinstance(producer, AsyncAPIBatchPublisher):
+            await producer.publish([value])
+        else:
+            await producer.publish(value)
+
+    @override
+    async def send_messages(self, topic: str, values: Sequence[Message]) -> None:
+        producer: AsyncAPIDefaultPublisher | AsyncAPIBatchPublisher = self._get_producer(topic)
+
+        logger.info("Sending %s messages to topic %s", len(values), topic)
+
+        if isinstance(producer, AsyncAPIBatchPublisher):
+            await producer.publish(list(values))
+            return
+
+        for value in values:
+            await producer.publish(value)
+
+    @override
+    async def flush(self) -> None: ...
+
+    @override
+    async def warm_up(self) -> None:
+        # If aiokafka producer isn't available, only connection to cluster is checked
+        producer: Optional[AIOKafkaProducer] = get_aiokafka_producer(self._broker)
+
+        if producer is None:
+            logger.warning("Producer of FastStream broker isn't available, metadata of topics isn't fetched")
+
+            # Time is limited by timeout of warm-up
+            if not await self._broker.ping(timeout=None):
+                raise ConnectionError("Kafka cluster isn't available")
+
+            return
+
+        for topic in self._producers:
+            await producer.partitions_for(topic)
 
     @override
     async def stop(self) -> None:
+        await self.flush()
         logger.info("Kafka message broker stopped.")
         await self._broker.close()
+
+    def _get_producer(self, topic: str) -> AsyncAPIDefaultPublisher | AsyncAPIBatchPublisher:
+        if (producer := self._producers.get(topic)) is None:
+            raise UnknownTopicError(f"Unknown topic {topic}, please configure in IOC")
+
+        return producer
+
+
+class BatchingFastStreamKafkaMessageBroker(FastStreamKafkaMessageBroker):
+    """
+    Accumulates messages per topic and publishes them with batch publishers. A batch is flushed when it reaches
+    max_batch_size messages, when linger_ms passed since its first message, or on flush()/stop().
+    Callers are resumed only after their batch is acknowledged by broker, so delivery guarantees stay the same.
+    """
+
+    def __init__(
+        self,
+        broker: KafkaBroker,
+        producers: Mapping[str, AsyncAPIBatchPublisher],
+        max_batch_size: int = 100,
+        linger_ms: int = 5,
+    ) -> None:
+        super().__init__(broker=broker, producers=producers)
+        self._max_batch_size: int = max_batch_size
+        self._linger: float = linger_ms / 1000
+        self._buffers: dict[str, list[tuple[Message, asyncio.Future[None]]]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    @override
+    async def send_message(self, topic: str, value: Message) -> None:
+        await self.send_messages(topic=topic, values=[value])
+
+    @override
+    async def send_messages(self, topic: str, values: Sequence[Message]) -> None:
+        self._get_producer(topic)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[None]] = []
+
+        for value in values:
+            future: asyncio.Future[None] = loop.create_future()
+            buffer: list[tuple[Message, asyncio.Future[None]]] = self._buffers.setdefault(topic, [])
+            buffer.append((value, future))
+            futures.append(future)
+
+            if len(buffer) >= self._max_batch_size:
+                self._flush_topic(topic)
+
+        if self._buffers.get(topic) and topic not in self._timers:
+            self._timers[topic] = loop.call_later(self._linger, self._flush_topic, topic)
+
+        for result in await asyncio.gather(*futures, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
+
+    @override
+    async def flush(self) -> None:
+        for topic in list(self._buffers):
+            self._flush_topic(topic)
+
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _flush_topic(self, topic: str) -> None:
+        if (timer := self._timers.pop(topic, None)) is not None:
+            timer.cancel()
+
+        batch: list[tuple[Message, asyncio.Future[None]]] = self._buffers.pop(topic, [])
+        if not batch:
+            return
+
+        task: asyncio.Task[None] = asyncio.create_task(self._publish_batch(topic, batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+        # Flush may be cancelled (even before it starts), e.g. on shutdown, callers mustn't wait for it forever
+        task.add_done_callback(partial(self._cancel_unresolved, batch))
+
+    @staticmethod
+    def _cancel_unresolved(batch: list[tuple[Message, asyncio.Future[None]]], _task: asyncio.Task[None]) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.cancel()
+
+    async def _publish_batch(self, topic: str, batch: list[tuple[Message, asyncio.Future[None]]]) -> None:
+        logger.info("Sending batch of %s messages to topic %s", len(batch), topic)
+
+        try:
+            await self._get_producer(topic).publish([value for value, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
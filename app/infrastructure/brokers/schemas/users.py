@@ -1,16 +1,41 @@
+from typing import Self
+
 from pydantic import BaseModel, Field
 
 from app.infrastructure.brokers.schemas.base import StringUUID
+from app.logic.events.users import (
+    UserCreateEvent,
+    UserDeleteEvent,
+    UsersDeleteEvent,
+    UsersImportEvent,
+    UserUpdateEvent,
+)
 
 
 class UserDeleteSchema(BaseModel):
     oid: StringUUID
 
+    @classmethod
+    def from_event(cls, event: UserDeleteEvent) -> Self:
+        return cls(oid=event.user_oid)
+
+    @classmethod
+    def from_bulk_delete_event(cls, event: UsersDeleteEvent) -> list[Self]:
+        return [cls(oid=oid) for oid in event.user_oids]
+
 
 class UserCreateSchema(BaseModel):
     oid: StringUUID
     name: str = Field(..., description="Name of user for broker")
     surname: str = Field(..., description="Surname of user for broker")
 
+    @classmethod
+    def from_event(cls, event: UserCreateEvent | UserUpdateEvent) -> Self:
+        return cls(oid=event.oid, name=event.name, surname=event.surname)
+
+    @classmethod
+    def from_import_event(cls, event: UsersImportEvent) -> list[Self]:
+        return [cls.from_event(user) for user in event.users]
+
 
 class UserUpdateSchema(UserCreateSchema): ...
@@ -0,0 +1,141 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass
+class CacheMetrics:
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "size": self.size,
+        }
+
+
+@dataclass(slots=True)
+class _Entry(Generic[V]):
+    value: Optional[V]
+    expires_at: float
+
+
+class LRUCache(Generic[K, V]):
+    """
+    In-process cache with bounded size, LRU eviction, TTL and negative caching (remembering that key has no value).
+
+    It's not thread-safe, it's meant to be used from one event loop. Loaders must take generation of key before
+    loading and pass it to set(), so a value loaded before invalidation of the key is not stored after it.
+    Generations are kept per key, so invalidation of one key doesn't discard loads of others. Only the last
+    max_size invalidated keys are remembered, generation of forgotten keys is raised to the newest forgotten one.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0,
+        metrics: Optional[CacheMetrics] = None,
+    ) -> None:
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._max_size: int = max_size
+        self._ttl: float = ttl
+        self._negative_ttl: float = negative_ttl
+        self._last_generation: int = 0
+        self._base_generation: int = 0
+        self._generations: OrderedDict[K, int] = OrderedDict()
+        self._metrics: CacheMetrics = metrics if metrics is not None else CacheMetrics()
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        return self._metrics
+
+    def generation(self, key: K) -> int:
+        return self._generations.get(key, self._base_generation)
+
+    def get(self, key: K) -> tuple[bool, Optional[V]]:
+        """
+        :return: (False, None) on miss, (True, None) if key is known to have no value, (True, value) on hit
+        """
+        entry: Optional[_Entry[V]] = self._entries.get(key)
+
+        if entry is None:
+            self._metrics.misses += 1
+            return False, None
+
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self._metrics.expirations += 1
+            self._metrics.misses += 1
+            self._metrics.size = len(self._entries)
+            return False, None
+
+        self._entries.move_to_end(key)
+
+        if entry.value is None:
+            self._metrics.negative_hits += 1
+        else:
+            self._metrics.hits += 1
+
+        return True, entry.value
+
+    def set(
+        self, key: K, value: Optional[V], generation: Optional[int] = None, max_ttl: Optional[float] = None
+    ) -> None:
+        """
+        Stores value, None means that key has no value (negative caching).
+        Does nothing, if key was invalidated after provided generation.
+        :param max_ttl: limit of TTL for this value, e.g. for values, which may be stale
+        """
+        if generation is not None and generation != self.generation(key):
+            return
+
+        ttl: float = self._negative_ttl if value is None else self._ttl
+        if max_ttl is not None:
+            ttl = min(ttl, max_ttl)
+
+        if ttl <= 0:
+            return
+
+        self._entries[key] = _Entry(value=value, expires_at=time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._metrics.evictions += 1
+
+        self._metrics.size = len(self._entries)
+
+    def invalidate(self, key: K) -> None:
+        self._last_generation += 1
+        self._generations[key] = self._last_generation
+        self._generations.move_to_end(key)
+
+        while len(self._generations) > self._max_size:
+            _, self._base_generation = self._generations.popitem(last=False)
+
+        self._metrics.invalidations += 1
+        self._entries.pop(key, None)
+        self._metrics.size = len(self._entries)
+
+    def clear(self) -> None:
+        self._last_generation += 1
+        self._base_generation = self._last_generation
+        self._generations.clear()
+        self._entries.clear()
+        self._metrics.size = 0
@@ -0,0 +1,10 @@
+from uuid import UUID
+
+from app.infrastructure.cache.memory import LRUCache
+from app.infrastructure.repositories.users.base import UserReadModel
+
+
+class UsersCache(LRUCache[UUID, UserReadModel]):
+    """
+    Cache of users by their oid, used by read side (views) and invalidated by users events.
+    """
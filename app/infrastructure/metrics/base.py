@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+DEFAULT_LATENCY_BUCKETS: Final[tuple[float, ...]] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    In-process latency histogram. Buckets are upper bounds in seconds, the last counter collects everything above them.
+    """
+
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    counts: list[int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+        for index, bucket in enumerate(self.buckets):
+            if seconds <= bucket:
+                self.counts[index] += 1
+                return
+
+        self.counts[-1] += 1
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "average": self.average,
+            "max": self.max,
+            "buckets": {
+                **{str(bucket): amount for bucket, amount in zip(self.buckets, self.counts, strict=False)},
+                "+Inf": self.counts[-1],
+            },
+        }
@@ -0,0 +1,46 @@
+from collections.abc import Callable, Mapping, Sequence
+
+from pydantic import BaseModel
+
+from app.exceptions.infrastructure import BatchedEventError, TopicNotFoundInFactoryError
+from app.infrastructure.outbox.message import OutboxMessage
+from app.logic.events.base import AbstractEvent
+
+EventConverter = Callable[[AbstractEvent], BaseModel | Sequence[BaseModel]]
+
+
+class OutboxMessageFactory:
+    """
+    Converts domain events to outbox messages: picks topic and broker schema for each event type.
+    """
+
+    def __init__(self, mapping: Mapping[type[AbstractEvent], tuple[str, EventConverter]]) -> None:
+        self._mapping: Mapping[type[AbstractEvent], tuple[str, EventConverter]] = mapping
+
+    def create(self, event: AbstractEvent) -> OutboxMessage:
+        topic, converter = self._get_target(event)
+        schema: BaseModel | Sequence[BaseModel] = converter(event)
+
+        if not isinstance(schema, BaseModel):
+            raise BatchedEventError(f"Event {type(event).__name__} is batched, please use create_batch")
+
+        return OutboxMessage(topic=topic, payload=schema.model_dump(mode="json"))
+
+    def create_batch(self, event: AbstractEvent) -> list[OutboxMessage]:
+        """
+        Converts batched event to one message per item, so consumers of topic get the same messages
+        as for single events.
+        """
+        topic, converter = self._get_target(event)
+        schemas: BaseModel | Sequence[BaseModel] = converter(event)
+
+        if isinstance(schemas, BaseModel):
+            schemas = [schemas]
+
+        return [OutboxMessage(topic=topic, payload=schema.model_dump(mode="json")) for schema in schemas]
+
+    def _get_target(self, event: AbstractEvent) -> tuple[str, EventConverter]:
+        if (target := self._mapping.get(type(event))) is None:
+            raise TopicNotFoundInFactoryError(f"Please add topic for event {type(event).__name__}")
+
+        return target
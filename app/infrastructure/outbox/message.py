@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from app.domain.entities.ids import new_id
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """
+    Message, which must be published to broker after the transaction that produced it is committed.
+    """
+
+    topic: str
+    payload: dict[str, Any]
+    oid: UUID = field(default_factory=new_id, kw_only=True)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC), kw_only=True)
@@ -0,0 +1,125 @@
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Final
+
+from app.infrastructure.brokers.publishers.kafka.base import BaseKafkaMessageBrokerPublisher
+from app.infrastructure.metrics.base import LatencyHistogram
+from app.infrastructure.outbox.message import OutboxMessage
+from app.infrastructure.uow.outbox.base import OutboxUnitOfWork
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+@dataclass
+class OutboxRelayMetrics:
+    relayed: int = 0
+    batches: int = 0
+    failures: int = 0
+    last_lag_seconds: float = 0.0
+    lag: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram(buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0))
+    )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "relayed": self.relayed,
+            "batches": self.batches,
+            "failures": self.failures,
+            "last_lag_seconds": self.last_lag_seconds,
+            "lag": self.lag.as_dict(),
+        }
+
+
+class OutboxRelay:
+    """
+    Background task, which drains outbox to broker in batches. Messages are deleted in the same transaction in
+    which they were read, so a failed publish leaves them in outbox for the next attempt (at-least-once delivery).
+    """
+
+    def __init__(
+        self,
+        uow: OutboxUnitOfWork,
+        broker: BaseKafkaMessageBrokerPublisher,
+        batch_size: int = 100,
+        poll_interval: float = 0.5,
+        metrics: OutboxRelayMetrics | None = None,
+    ) -> None:
+        self._uow: OutboxUnitOfWork = uow
+        self._broker: BaseKafkaMessageBrokerPublisher = broker
+        self._batch_size: int = batch_size
+        self._poll_interval: float = poll_interval
+        self._metrics: OutboxRelayMetrics = metrics if metrics is not None else OutboxRelayMetrics()
+        self._stopping: asyncio.Event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def metrics(self) -> OutboxRelayMetrics:
+        return self._metrics
+
+    async def start(self) -> None:
+        logger.info("Outbox relay started.")
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._stopping.set()
+        await self._task
+        self._task = None
+        logger.info("Outbox relay stopped.")
+
+    async def relay_batch(self) -> int:
+        """
+        Publishes one batch of the oldest messages.
+        :return: amount of published messages
+        """
+        async with self._uow as uow:
+            messages: list[OutboxMessage] = await uow.outbox.list(limit=self._batch_size)
+            if not messages:
+                return 0
+
+            payloads: dict[str, list[dict[str, Any]]] = {}
+            for message in messages:
+                payloads.setdefault(message.topic, []).append(message.payload)
+
+            await asyncio.gather(
+                *(self._broker.send_messages(topic=topic, values=values) for topic, values in payloads.items())
+            )
+
+            await uow.outbox.delete([message.oid for message in messages])
+            await uow.commit()
+
+        self._observe(messages)
+        return len(messages)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            relayed: int = 0
+            try:
+                relayed = await self.relay_batch()
+            except Exception:
+                self._metrics.failures += 1
+                logger.exception("Failed to relay outbox batch")
+
+            if relayed < self._batch_size:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self._poll_interval)
+
+    def _observe(self, messages: list[OutboxMessage]) -> None:
+        now: datetime = datetime.now(UTC)
+        lags: list[float] = [
+            (now - (m.created_at if m.created_at.tzinfo else m.created_at.replace(tzinfo=UTC))).total_seconds()
+            for m in messages
+        ]
+
+        for lag in lags:
+            self._metrics.lag.observe(lag)
+
+        self._metrics.relayed += len(messages)
+        self._metrics.batches += 1
+        self._metrics.last_lag_seconds = max(lags)
@@ -1,6 +1,7 @@
 import builtins
 from abc import ABC, abstractmethod
 from typing import Generic, Optional, TypeVar, overload
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,15 +23,23 @@ class AbstractRepository(ABC, Generic[BaseEntityType]):
         raise NotImplementedError
 
     @abstractmethod
-    async def get(self, oid: str) -> Optional[BaseEntityType]:
+    async def get(self, oid: UUID) -> Optional[BaseEntityType]:
         raise NotImplementedError
 
     @abstractmethod
-    async def update(self, oid: str, model: BaseEntityType) -> BaseEntityType:
+    async def update(self, oid: UUID, model: BaseEntityType) -> Optional[BaseEntityType]:
+        """
+        Updates model by one statement.
+        :return: updated model or None, if there is no model with provided oid
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def delete(self, oid: str) -> None:
+    async def delete(self, oid: UUID) -> bool:
+        """
+        Deletes model by one statement.
+        :return: True if model was deleted, False if there is no model with provided oid
+        """
         raise NotImplementedError
 
     @overload
@@ -0,0 +1,51 @@
+from collections.abc import Sequence
+from typing import override
+from uuid import UUID
+
+from sqlalchemy import Result, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.adapters.alchemy.orm import outbox_table
+from app.infrastructure.outbox.message import OutboxMessage
+from app.infrastructure.repositories.outbox.base import OutboxRepository
+
+
+class SQLAlchemyOutboxRepository(OutboxRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session: AsyncSession = session
+
+    @override
+    async def add(self, messages: Sequence[OutboxMessage]) -> None:
+        if not messages:
+            return
+
+        await self._session.execute(
+            insert(outbox_table),
+            [
+                {
+                    "oid": message.oid,
+                    "topic": message.topic,
+                    "payload": message.payload,
+                    "created_at": message.created_at,
+                }
+                for message in messages
+            ],
+        )
+
+    @override
+    async def list(self, limit: int) -> list[OutboxMessage]:
+        result: Result = await self._session.execute(
+            select(outbox_table).order_by(outbox_table.c.created_at).limit(limit).with_for_update(skip_locked=True)
+        )
+
+        return [
+            OutboxMessage(oid=row.oid, topic=row.topic, payload=row.payload, created_at=row.created_at)
+            for row in result
+        ]
+
+    @override
+    async def delete(self, oids: Sequence[UUID]) -> None:
+        if not oids:
+            return
+
+        await self._session.execute(delete(outbox_table).where(outbox_table.c.oid.in_(oids)))
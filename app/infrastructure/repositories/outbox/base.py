@@ -0,0 +1,29 @@
+import builtins
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from uuid import UUID
+
+from app.infrastructure.outbox.message import OutboxMessage
+
+
+class OutboxRepository(ABC):
+    """
+    An interface for work with outbox messages, that is used by units of work,
+    which must save messages in the same transaction as changes of domain models.
+    """
+
+    @abstractmethod
+    async def add(self, messages: Sequence[OutboxMessage]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list(self, limit: int) -> builtins.list[OutboxMessage]:
+        """
+        Returns the oldest messages. Messages are locked until the end of transaction, so several relays
+        may drain the outbox at once.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, oids: Sequence[UUID]) -> None:
+        raise NotImplementedError
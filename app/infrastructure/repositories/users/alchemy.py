@@ -1,57 +1,248 @@
-from typing import TYPE_CHECKING, Any, override
+import builtins
+from collections.abc import AsyncGenerator, Sequence
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Final, override
+from uuid import UUID
 
-from sqlalchemy import Result, Row, RowMapping, delete, insert, select, update
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    Result,
+    Row,
+    RowMapping,
+    Select,
+    String,
+    any_,
+    bindparam,
+    delete,
+    insert,
+    literal_column,
+    select,
+    tuple_,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.orm import undefer
 
 from app.domain.entities.user import UserEntity
+from app.infrastructure.adapters.alchemy.orm import users_table
 from app.infrastructure.repositories.base import SQLAlchemyAbstractRepository
-from app.infrastructure.repositories.users.base import UsersRepository
+from app.infrastructure.repositories.users.base import UserReadModel, UsersRepository
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from sqlalchemy.ext.asyncio import AsyncResult
+
+# Rows per one multi-row INSERT, keeps number of bound parameters below limits of SQLite
+INSERT_MANY_BATCH_SIZE: Final[int] = 500
+
+
+# Read models are selected by Core without password. Names are read as plain strings,
+# so value objects aren't built and converted back
+READ_MODEL_COLUMNS: Final[tuple[ColumnElement[Any], ...]] = (
+    users_table.c.oid,
+    type_coerce(users_table.c.surname, String).label("surname"),
+    type_coerce(users_table.c.name, String).label("name"),
+    users_table.c.created_at,
+    users_table.c.updated_at,
+)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite doesn't keep timezone, values are stored in UTC
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
 
 
 class SQLAlchemyUsersRepository(SQLAlchemyAbstractRepository, UsersRepository):
     @override
-    async def get_by_fullname(self, surname: str, name: str) -> UserEntity | None:
-        result: Result = await self._session.execute(select(UserEntity).filter_by(surname=surname, name=name))
+    async def get_by_fullname(self, surname: str, name: str, with_password: bool = False) -> UserEntity | None:
+        statement: Select = select(UserEntity).filter_by(surname=surname, name=name)
+        result: Result = await self._session.execute(self._with_password(statement) if with_password else statement)
 
         return result.scalar_one_or_none()
 
+    @override
+    async def add_all(self, models: Sequence[UserEntity]) -> builtins.list[UserEntity]:
+        if not models:
+            return []
+
+        # Parameters list turns into multi-row INSERT ... RETURNING ("insertmanyvalues" of SQLAlchemy)
+        result: Result = await self._session.execute(
+            insert(UserEntity).returning(UserEntity, sort_by_parameter_order=True),
+            [self._as_values(model) for model in models],
+        )
+
+        return list(result.scalars().all())
+
     @override
     async def add(self, model: UserEntity) -> UserEntity:
         result: Result = await self._session.execute(
-            insert(UserEntity).values(**await model.to_dict(save_classes_value_objects=True)).returning(UserEntity)
+            insert(UserEntity).values(**model.to_dict(save_classes_value_objects=True)).returning(UserEntity)
         )
 
         return result.scalar_one()
 
     @override
-    async def get(self, oid: str) -> UserEntity | None:
-        result: Result = await self._session.execute(select(UserEntity).filter_by(oid=oid))
+    async def add_many(self, models: Sequence[UserEntity]) -> None:
+        if not models:
+            return
+
+        connection: AsyncConnection = await self._session.connection()
+
+        if connection.dialect.driver == "asyncpg":
+            await self._copy_many(connection, models)
+            return
+
+        for start in range(0, len(models), INSERT_MANY_BATCH_SIZE):
+            await self._session.execute(
+                insert(users_table).values(
+                    [self._as_values(model) for model in models[start : start + INSERT_MANY_BATCH_SIZE]]
+                )
+            )
+
+    async def _oid_in(self, oids: Sequence[UUID]) -> ColumnElement[bool]:
+        connection: AsyncConnection = await self._session.connection()
+
+        if connection.dialect.name == "postgresql":
+            # One array parameter, so statement is the same for any number of ids and stays in prepared cache
+            return users_table.c.oid == any_(bindparam("oids", value=list(oids), type_=ARRAY(users_table.c.oid.type)))
+
+        return users_table.c.oid.in_(oids)
+
+    @staticmethod
+    def _with_password(statement: Select) -> Select:
+        # Password is deferred in mapping, see start_mappers
+        return statement.options(undefer(UserEntity.password))
+
+    @staticmethod
+    def _as_values(model: UserEntity) -> dict[str, Any]:
+        return {
+            "oid": model.oid,
+            "surname": model.surname,
+            "name": model.name,
+            "password": model.password,
+            "created_at": model.created_at,
+            "updated_at": model.updated_at,
+        }
+
+    @staticmethod
+    async def _copy_many(connection: AsyncConnection, models: Sequence[UserEntity]) -> None:
+        """
+        Loads users by COPY of asyncpg, which is much faster than INSERT for large batches.
+        COPY goes around SQLAlchemy, so values are converted to database types here instead of type decorators.
+        """
+        driver_connection: Any = (await connection.get_raw_connection()).driver_connection
+
+        # SQLAlchemy starts transaction of asyncpg lazily, on the first statement.
+        # Without it COPY would be committed on its own, apart from the rest of unit of work.
+        if not driver_connection.is_in_transaction():
+            await connection.exec_driver_sql("SELECT 1")
+
+        await driver_connection.copy_records_to_table(
+            users_table.name,
+            schema_name=users_table.schema,
+            columns=[column.name for column in users_table.columns],
+            records=[
+                (
+                    model.oid,
+                    model.surname.as_generic_type(),
+                    model.name.as_generic_type(),
+                    model.password.as_generic_type(),
+                    model.created_at,
+                    model.updated_at,
+                )
+                for model in models
+            ],
+        )
+
+    @override
+    async def get(self, oid: UUID, with_password: bool = False) -> UserEntity | None:
+        statement: Select = select(UserEntity).filter_by(oid=oid)
+        result: Result = await self._session.execute(self._with_password(statement) if with_password else statement)
 
         return result.scalar_one_or_none()
 
     @override
-    async def update(self, oid: str, model: UserEntity) -> UserEntity:
+    async def get_many(self, oids: Sequence[UUID]) -> builtins.list[UserEntity]:
+        if not oids:
+            return []
+
+        result: Result = await self._session.execute(select(UserEntity).where(await self._oid_in(oids)))
+
+        return list(result.scalars().all())
+
+    @override
+    async def upsert(self, model: UserEntity) -> tuple[UserEntity, bool]:
+        connection: AsyncConnection = await self._session.connection()
+        dialect_insert = postgresql.insert if connection.dialect.name == "postgresql" else sqlite.insert
+
+        statement = dialect_insert(UserEntity).values(**self._as_values(model))
+        statement = statement.on_conflict_do_update(
+            index_elements=[users_table.c.oid],
+            set_={
+                "surname": statement.excluded.surname,
+                "name": statement.excluded.name,
+                "password": statement.excluded.password,
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+
+        if connection.dialect.name == "postgresql":
+            # xmax of row version is 0 only if it was inserted, row updated on conflict has xmax of the transaction
+            result: Result = await self._session.execute(
+                statement.returning(UserEntity, literal_column("xmax = 0", Boolean)),
+                execution_options={"populate_existing": True},
+            )
+            stored_user, inserted = result.one()
+            return stored_user, inserted
+
+        result = await self._session.execute(
+            statement.returning(UserEntity),
+            execution_options={"populate_existing": True},
+        )
+        stored_user = result.scalar_one()
+
+        # created_at is not updated on conflict, so it's the new one only if row was inserted
+        return stored_user, _as_utc(stored_user.created_at) == _as_utc(model.created_at)
+
+    @override
+    async def update(self, oid: UUID, model: UserEntity) -> UserEntity | None:
         result: Result = await self._session.execute(
             update(UserEntity)
             .filter_by(oid=oid)
-            .values(**await model.to_dict(exclude={"oid"}, save_classes_value_objects=True))
+            .values(**model.to_dict(exclude={"oid", "created_at"}, save_classes_value_objects=True))
             .returning(UserEntity)
         )
 
-        return result.scalar_one()
+        return result.scalar_one_or_none()
 
     @override
-    async def delete(self, oid: str) -> None:
-        await self._session.execute(delete(UserEntity).filter_by(oid=oid))
+    async def delete(self, oid: UUID) -> bool:
+        result: Result = await self._session.execute(delete(UserEntity).filter_by(oid=oid).returning(users_table.c.oid))
+
+        return result.scalar_one_or_none() is not None
+
+    @override
+    async def delete_many(self, oids: Sequence[UUID]) -> builtins.list[UUID]:
+        if not oids:
+            return []
+
+        result: Result = await self._session.execute(
+            delete(users_table).where(await self._oid_in(oids)).returning(users_table.c.oid)
+        )
+
+        return list(result.scalars().all())
 
     @override
     async def list(self, start: int | None = None, limit: int | None = None) -> list[UserEntity]:
+        statement: Select = select(UserEntity).order_by(users_table.c.created_at, users_table.c.oid)
+
         if start is None and limit is None:
-            result: Result = await self._session.execute(select(UserEntity))
+            result: Result = await self._session.execute(statement)
         else:
-            result: Result = await self._session.execute(select(UserEntity).offset(start).limit(limit))
+            result: Result = await self._session.execute(statement.offset(start).limit(limit))
 
         trading_result_entities: Sequence[Row | RowMapping | Any] = result.scalars().all()
 
@@ -61,3 +252,74 @@ class SQLAlchemyUsersRepository(SQLAlchemyAbstractRepository, UsersRepository):
             assert isinstance(entity, UserEntity)
 
         return trading_result_entities
+
+    @override
+    async def list_after(self, limit: int, after: tuple[datetime, UUID] | None = None) -> builtins.list[UserEntity]:
+        statement: Select = select(UserEntity).order_by(users_table.c.created_at, users_table.c.oid).limit(limit)
+
+        if after is not None:
+            statement = statement.where(tuple_(users_table.c.created_at, users_table.c.oid) > after)
+
+        result: Result = await self._session.execute(statement)
+
+        return list(result.scalars().all())
+
+    @override
+    async def get_read_model(self, oid: UUID) -> UserReadModel | None:
+        result: Result = await self._session.execute(select(*READ_MODEL_COLUMNS).where(users_table.c.oid == oid))
+        row: Row | None = result.one_or_none()
+
+        return UserReadModel._make(row) if row is not None else None
+
+    @override
+    async def get_read_models(self, oids: Sequence[UUID]) -> builtins.list[UserReadModel]:
+        if not oids:
+            return []
+
+        result: Result = await self._session.execute(select(*READ_MODEL_COLUMNS).where(await self._oid_in(oids)))
+
+        return [UserReadModel._make(row) for row in result]
+
+    @override
+    async def list_read_models(
+        self, start: int | None = None, limit: int | None = None
+    ) -> builtins.list[UserReadModel]:
+        statement: Select = select(*READ_MODEL_COLUMNS).order_by(users_table.c.created_at, users_table.c.oid)
+
+        if start is not None:
+            statement = statement.offset(start)
+
+        if limit is not None:
+            statement = statement.limit(limit)
+
+        result: Result = await self._session.execute(statement)
+
+        return [UserReadModel._make(row) for row in result]
+
+    @override
+    async def list_read_models_after(
+        self, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> builtins.list[UserReadModel]:
+        statement: Select = (
+            select(*READ_MODEL_COLUMNS).order_by(users_table.c.created_at, users_table.c.oid).limit(limit)
+        )
+
+        if after is not None:
+            statement = statement.where(tuple_(users_table.c.created_at, users_table.c.oid) > after)
+
+        result: Result = await self._session.execute(statement)
+
+        return [UserReadModel._make(row) for row in result]
+
+    @override
+    async def stream(self, fetch_size: int) -> AsyncGenerator[UserReadModel, None]:
+        statement: Select = (
+            select(*READ_MODEL_COLUMNS)
+            .order_by(users_table.c.created_at, users_table.c.oid)
+            .execution_options(yield_per=fetch_size)
+        )
+
+        result: AsyncResult = await self._session.stream(statement)
+
+        async for row in result:
+            yield UserReadModel._make(row)
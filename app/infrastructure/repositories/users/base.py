@@ -1,9 +1,27 @@
+import builtins
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, Sequence
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
 
 from app.domain.entities.user import UserEntity
 from app.infrastructure.repositories.base import AbstractRepository
 
 
+class UserReadModel(NamedTuple):
+    """
+    Plain projection of user for read side (views and export), without password and value objects.
+    It's immutable, so it can be shared between requests by cache.
+    """
+
+    oid: UUID
+    surname: str
+    name: str
+    created_at: datetime
+    updated_at: datetime
+
+
 class UsersRepository(AbstractRepository[UserEntity], ABC):
     """
     An interface for work with User, that is used by UsersUnitOfWork.
@@ -12,7 +30,10 @@ class UsersRepository(AbstractRepository[UserEntity], ABC):
     """
 
     @abstractmethod
-    async def get_by_fullname(self, surname: str, name: str) -> UserEntity | None:
+    async def get_by_fullname(self, surname: str, name: str, with_password: bool = False) -> UserEntity | None:
+        """
+        Password is loaded only if with_password is set, e.g. for authentication.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -20,13 +41,94 @@ class UsersRepository(AbstractRepository[UserEntity], ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get(self, oid: str) -> UserEntity | None:
+    async def add_all(self, models: Sequence[UserEntity]) -> builtins.list[UserEntity]:
+        """
+        Adds users by one multi-row statement and returns stored users in the same order.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_many(self, models: Sequence[UserEntity]) -> None:
+        """
+        Bulk load of users. Doesn't return them back, because they are not changed by database.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, oid: UUID, with_password: bool = False) -> UserEntity | None:
+        """
+        Password is loaded only if with_password is set, other reads leave it out.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(self, oids: Sequence[UUID]) -> builtins.list[UserEntity]:
+        """
+        Returns users with provided oids by one query, in any order. Missing users are skipped.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upsert(self, model: UserEntity) -> tuple[UserEntity, bool]:
+        """
+        Inserts user or replaces stored user with the same oid by one statement, created_at of stored user is kept.
+        :return: stored user and True if it was inserted, False if it was updated
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, oids: Sequence[UUID]) -> builtins.list[UUID]:
+        """
+        Deletes users by one statement.
+        :return: oids of deleted users
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def update(self, oid: str, model: UserEntity) -> UserEntity:
+    async def update(self, oid: UUID, model: UserEntity) -> UserEntity | None:
         raise NotImplementedError
 
     @abstractmethod
     async def list(self, start: int | None = None, limit: int | None = None) -> list[UserEntity]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def list_after(self, limit: int, after: tuple[datetime, UUID] | None = None) -> builtins.list[UserEntity]:
+        """
+        Keyset pagination: returns users ordered by (created_at, oid), which go after provided key.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_read_model(self, oid: UUID) -> UserReadModel | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_read_models(self, oids: Sequence[UUID]) -> builtins.list[UserReadModel]:
+        """
+        Returns read models of found users in any order, missing oids are skipped.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_read_models(
+        self, start: int | None = None, limit: int | None = None
+    ) -> builtins.list[UserReadModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_read_models_after(
+        self, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> builtins.list[UserReadModel]:
+        """
+        Keyset pagination of read models over (created_at, oid), same order as list_after.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream(self, fetch_size: int) -> AsyncGenerator[UserReadModel, None]:
+        """
+        Iterates over all users ordered by (created_at, oid), fetching them from database by fetch_size rows,
+        so memory doesn't depend on size of the table.
+        """
+        raise NotImplementedError
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+
+class BasePasswordHasher(ABC):
+    """
+    Interface for password hashers. Hashing is CPU bound, so implementations must not block the event loop.
+    """
+
+    @abstractmethod
+    async def hash_password(self, password: str) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def hash_passwords(self, passwords: Sequence[str]) -> list[bytes]:
+        """
+        Hashes several passwords in parallel, keeping their order.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def validate_password(self, password: str, hashed_password: bytes) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def shutdown(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Final, Literal, TypeVar, override
+
+from app.exceptions.infrastructure import PasswordHashingOverloadedError
+from app.infrastructure.metrics.base import LatencyHistogram
+from app.infrastructure.security.base import BasePasswordHasher
+from app.infrastructure.security.hashing import hash_password, hash_passwords, validate_password
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class HashingMetrics:
+    queue_depth: int = 0
+    in_flight: int = 0
+    rejected: int = 0
+    hash_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    batch_hash_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    validate_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+            "hash_latency": self.hash_latency.as_dict(),
+            "batch_hash_latency": self.batch_hash_latency.as_dict(),
+            "validate_latency": self.validate_latency.as_dict(),
+        }
+
+
+class ExecutorPasswordHasher(BasePasswordHasher):
+    """
+    Runs bcrypt on a process pool or on a thread pool (bcrypt releases the GIL while hashing), so the event loop
+    stays free. At most max_workers calls run at once, at most max_queue_size calls wait for a free worker,
+    everything above that is rejected with PasswordHashingOverloadedError.
+
+    Batches (imports) take at most max_batch_workers of workers all together, by default half of them,
+    so the rest of workers is left for hashing of single passwords of interactive requests.
+    """
+
+    def __init__(
+        self,
+        executor_type: Literal["thread", "process"] = "thread",
+        max_workers: int = 4,
+        max_queue_size: int = 64,
+        rounds: int = 12,
+        metrics: HashingMetrics | None = None,
+        max_batch_workers: int | None = None,
+    ) -> None:
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=max_workers)
+            if executor_type == "process"
+            else ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hasher")
+        )
+        self._workers: asyncio.Semaphore = asyncio.Semaphore(max_workers)
+        self._max_batch_workers: int = (
+            min(max_batch_workers, max_workers) if max_batch_workers is not None else max(1, max_workers // 2)
+        )
+        self._batch_workers: asyncio.Semaphore = asyncio.Semaphore(self._max_batch_workers)
+        self._max_queue_size: int = max_queue_size
+        self._rounds: int = rounds
+        self._metrics: HashingMetrics = metrics if metrics is not None else HashingMetrics()
+
+    @property
+    def metrics(self) -> HashingMetrics:
+        return self._metrics
+
+    @override
+    async def hash_password(self, password: str) -> bytes:
+        return await self._run(partial(hash_password, password, self._rounds), self._metrics.hash_latency)
+
+    @override
+    async def hash_passwords(self, passwords: Sequence[str]) -> list[bytes]:
+        """
+        Splits passwords into max_batch_workers slices, each slice is hashed by one call in executor.
+        So a batch takes at most max_batch_workers places in the queue instead of one place per password.
+        Slices of all batches wait for their share of workers before entering the queue, so they don't
+        fill the queue of interactive requests.
+        """
+        if not passwords:
+            return []
+
+        slice_size: int = -(-len(passwords) // self._max_batch_workers)
+        hashed_slices: list[list[bytes]] = await asyncio.gather(
+            *(
+                self._run_batch(partial(hash_passwords, list(passwords[start : start + slice_size]), self._rounds))
+                for start in range(0, len(passwords), slice_size)
+            )
+        )
+
+        return [hashed for hashed_slice in hashed_slices for hashed in hashed_slice]
+
+    @override
+    async def validate_password(self, password: str, hashed_password: bytes) -> bool:
+        return await self._run(partial(validate_password, password, hashed_password), self._metrics.validate_latency)
+
+    @override
+    async def shutdown(self) -> None:
+        logger.info("Shutting down password hasher executor")
+        # Waiting for running hashes blocks, so it's done in a thread to keep the event loop free during shutdown
+        await asyncio.to_thread(self._executor.shutdown, wait=True, cancel_futures=True)
+
+    async def _run_batch(self, func: Callable[[], T]) -> T:
+        async with self._batch_workers:
+            return await self._run(func, self._metrics.batch_hash_latency)
+
+    async def _run(self, func: Callable[[], T], latency: LatencyHistogram) -> T:
+        if self._workers.locked() and self._metrics.queue_depth >= self._max_queue_size:
+            self._metrics.rejected += 1
+            raise PasswordHashingOverloadedError("Too many password hashing requests, please try again later")
+
+        started: float = time.perf_counter()
+        self._metrics.queue_depth += 1
+        try:
+            await self._workers.acquire()
+        finally:
+            self._metrics.queue_depth -= 1
+
+        self._metrics.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+        finally:
+            self._metrics.in_flight -= 1
+            self._workers.release()
+            latency.observe(time.perf_counter() - started)
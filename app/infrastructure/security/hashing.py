@@ -1,17 +1,25 @@
 import logging
+from collections.abc import Sequence
 
 import bcrypt
 
 logger = logging.getLogger(__name__)
 
 
-def hash_password(password: str) -> bytes:
+def hash_password(password: str, rounds: int = 12) -> bytes:
     logger.debug("hashing password")
-    salt: bytes = bcrypt.gensalt()
+    salt: bytes = bcrypt.gensalt(rounds=rounds)
     pwd_bytes: bytes = password.encode()
     return bcrypt.hashpw(pwd_bytes, salt)
 
 
+def hash_passwords(passwords: Sequence[str], rounds: int = 12) -> list[bytes]:
+    """
+    Hashes several passwords in one call, so one executor task serves a whole slice of bulk import.
+    """
+    return [hash_password(password, rounds) for password in passwords]
+
+
 def validate_password(
     password: str,
     hashed_password: bytes,
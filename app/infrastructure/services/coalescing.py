@@ -0,0 +1,151 @@
+import asyncio
+import contextvars
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Final, Optional
+
+from app.domain.entities.user import UserEntity
+from app.infrastructure.metrics.base import LatencyHistogram
+from app.infrastructure.outbox.message import OutboxMessage
+from app.infrastructure.uow.users.base import UsersUnitOfWork
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+PendingUser = tuple[UserEntity, Sequence[OutboxMessage], asyncio.Future[UserEntity]]
+
+
+@dataclass
+class WriteCoalescingMetrics:
+    batches: int = 0
+    rows: int = 0
+    fallbacks: int = 0
+    failed_rows: int = 0
+    batch_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "average_batch_size": self.rows / self.batches if self.batches else 0.0,
+            "fallbacks": self.fallbacks,
+            "failed_rows": self.failed_rows,
+            "batch_latency": self.batch_latency.as_dict(),
+        }
+
+
+class CoalescingUsersWriter:
+    """
+    Coalesces inserts of users from concurrent requests. Users are collected for window_ms or until max_batch_size
+    of them, after that they are written by one multi-row INSERT ... RETURNING with their outbox messages,
+    and committed once. Each caller is resumed with its own stored user only after commit.
+
+    Batches are written by tasks with empty context, otherwise they would inherit unit of work of the caller,
+    which has started the batch, and would be nested into its transaction instead of committing their own.
+
+    If the batch fails, its users are written one by one in separate transactions, so only the callers of bad rows
+    get an error.
+    """
+
+    def __init__(
+        self,
+        uow: UsersUnitOfWork,
+        max_batch_size: int = 100,
+        window_ms: int = 2,
+        metrics: Optional[WriteCoalescingMetrics] = None,
+    ) -> None:
+        self._uow: UsersUnitOfWork = uow
+        self._max_batch_size: int = max_batch_size
+        self._window: float = window_ms / 1000
+        self._metrics: WriteCoalescingMetrics = metrics if metrics is not None else WriteCoalescingMetrics()
+        self._pending: list[PendingUser] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._writes: set[asyncio.Task[None]] = set()
+
+    @property
+    def metrics(self) -> WriteCoalescingMetrics:
+        return self._metrics
+
+    async def add(self, user: UserEntity, outbox_messages: Sequence[OutboxMessage] = ()) -> UserEntity:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future[UserEntity] = loop.create_future()
+        self._pending.append((user, outbox_messages, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+
+        return await future
+
+    async def close(self) -> None:
+        """
+        Writes all pending users and waits for writes in progress.
+        """
+        self._flush()
+
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch: list[PendingUser] = self._pending
+        if not batch:
+            return
+
+        self._pending = []
+        task: asyncio.Task[None] = asyncio.create_task(self._write_batch(batch), context=contextvars.Context())
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write_batch(self, batch: list[PendingUser]) -> None:
+        started: float = time.perf_counter()
+
+        try:
+            stored_users: list[UserEntity] = await self._write(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                self._metrics.failed_rows += 1
+                self._resolve(batch[0][2], error=e)
+                return
+
+            logger.warning("Batch of %s users failed, writing them one by one: %s", len(batch), type(e).__name__)
+            self._metrics.fallbacks += 1
+
+            for item in batch:
+                await self._write_batch([item])
+
+            return
+
+        self._metrics.batches += 1
+        self._metrics.rows += len(batch)
+        self._metrics.batch_latency.observe(time.perf_counter() - started)
+
+        for (_, _, future), stored_user in zip(batch, stored_users, strict=True):
+            self._resolve(future, result=stored_user)
+
+    async def _write(self, batch: list[PendingUser]) -> list[UserEntity]:
+        async with self._uow as uow:
+            stored_users: list[UserEntity] = await uow.users.add_all([user for user, _, _ in batch])
+            await uow.outbox.add([message for _, messages, _ in batch for message in messages])
+            await uow.commit()
+            return stored_users
+
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future[UserEntity],
+        result: Optional[UserEntity] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        # Caller may be cancelled while its user is being written
+        if future.done():
+            return
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
@@ -1,7 +1,14 @@
+import asyncio
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import aclosing
+from datetime import datetime
 from typing import Optional
+from uuid import UUID
 
 from app.domain.entities.user import UserEntity
 from app.exceptions.infrastructure import UserNotFoundError
+from app.infrastructure.outbox.message import OutboxMessage
+from app.infrastructure.repositories.users.base import UserReadModel
 from app.infrastructure.uow.users.base import UsersUnitOfWork
 
 
@@ -9,30 +16,61 @@ class UsersService:
     def __init__(self, uow: UsersUnitOfWork) -> None:
         self._uow: UsersUnitOfWork = uow
 
-    async def add(self, user: UserEntity) -> UserEntity:
+    async def add(self, user: UserEntity, outbox_messages: Sequence[OutboxMessage] = ()) -> UserEntity:
         async with self._uow as uow:
             new_user: UserEntity = await uow.users.add(user)
+            await uow.outbox.add(outbox_messages)
             await uow.commit()
             return new_user
 
-    async def update(self, user: UserEntity) -> UserEntity:
+    async def add_many(self, users: Sequence[UserEntity], outbox_messages: Sequence[OutboxMessage] = ()) -> None:
         async with self._uow as uow:
-            updated_user = await uow.users.update(oid=user.oid, model=user)
+            await uow.users.add_many(users)
+            await uow.outbox.add(outbox_messages)
+            await uow.commit()
+
+    async def update(self, user: UserEntity, outbox_messages: Sequence[OutboxMessage] = ()) -> UserEntity:
+        """
+        Updates user by one statement, created_at of the stored user is kept.
+        Raises UserNotFoundError, if there is no such user.
+        """
+        oid: UUID = user.oid
+        async with self._uow as uow:
+            updated_user: Optional[UserEntity] = await uow.users.update(oid=oid, model=user)
+            if not updated_user:
+                raise UserNotFoundError(f"Couldn't find user {oid}")
+
+            await uow.outbox.add(outbox_messages)
             await uow.commit()
             return updated_user
 
-    async def get_by_full_name(self, surname: str, name: str) -> UserEntity:
+    async def upsert(self, user: UserEntity) -> tuple[UserEntity, bool]:
+        """
+        Inserts user or replaces the stored one with the same oid by one statement, created_at of stored user is kept.
+        :return: stored user and True if it was inserted, False if it was updated
+        """
         async with self._uow as uow:
-            user: Optional[UserEntity] = await uow.users.get_by_fullname(surname=surname, name=name)
+            result: tuple[UserEntity, bool] = await uow.users.upsert(user)
+            await uow.commit()
+            return result
+
+    async def get_by_full_name(self, surname: str, name: str, with_password: bool = False) -> UserEntity:
+        async with self._uow as uow:
+            user: Optional[UserEntity] = await uow.users.get_by_fullname(
+                surname=surname, name=name, with_password=with_password
+            )
 
             if not user:
                 raise UserNotFoundError(name)
 
             return user
 
-    async def get_by_id(self, oid: str) -> UserEntity:
+    async def get_by_id(self, oid: UUID, with_password: bool = False) -> UserEntity:
+        """
+        Password is loaded only if with_password is set, e.g. for authentication.
+        """
         async with self._uow as uow:
-            user: Optional[UserEntity] = await uow.users.get(oid=oid)
+            user: Optional[UserEntity] = await uow.users.get(oid=oid, with_password=with_password)
             if not user:
                 raise UserNotFoundError(str(oid))
 
@@ -42,14 +80,100 @@ class UsersService:
         async with self._uow as uow:
             return await uow.users.list(start=start, limit=limit)
 
-    async def delete(self, oid: str) -> None:
+    async def get_many(self, oids: Sequence[UUID]) -> list[UserEntity]:
+        async with self._uow as uow:
+            return await uow.users.get_many(oids)
+
+    async def get_after(self, limit: int, after: tuple[datetime, UUID] | None = None) -> list[UserEntity]:
+        async with self._uow as uow:
+            return await uow.users.list_after(limit=limit, after=after)
+
+    async def get_read_model(self, oid: UUID) -> Optional[UserReadModel]:
+        async with self._uow as uow:
+            return await uow.users.get_read_model(oid)
+
+    async def get_read_models(self, oids: Sequence[UUID]) -> list[UserReadModel]:
+        async with self._uow as uow:
+            return await uow.users.get_read_models(oids)
+
+    async def get_read_models_page(self, start: int | None = None, limit: int | None = None) -> list[UserReadModel]:
+        async with self._uow as uow:
+            return await uow.users.list_read_models(start=start, limit=limit)
+
+    async def get_read_models_after(
+        self, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> list[UserReadModel]:
+        async with self._uow as uow:
+            return await uow.users.list_read_models_after(limit=limit, after=after)
+
+    async def stream(self, fetch_size: int) -> AsyncGenerator[UserReadModel, None]:
+        """
+        Streams all users, unit of work is kept open until iteration is finished or closed.
+
+        Unit of work keeps its session in context variable of the current task, while streaming response may be
+        iterated and closed by different tasks (e.g. closed by garbage collector after client disconnect).
+        So unit of work is opened and closed by its own reader task, which passes rows by chunks of fetch_size
+        through the queue and reads at most one chunk ahead.
+        """
+        chunks: asyncio.Queue[Optional[list[UserReadModel]]] = asyncio.Queue(maxsize=1)
+        reader: asyncio.Task[None] = asyncio.create_task(self._read_chunks(fetch_size, chunks))
+
+        try:
+            while (chunk := await chunks.get()) is not None:
+                for row in chunk:
+                    yield row
+
+            # Raises error of reader, if reading has failed
+            await reader
+        finally:
+            reader.cancel()
+            await asyncio.wait({reader})
+
+    async def _read_chunks(self, fetch_size: int, chunks: asyncio.Queue[Optional[list[UserReadModel]]]) -> None:
+        try:
+            async with self._uow as uow, aclosing(uow.users.stream(fetch_size)) as rows:
+                chunk: list[UserReadModel] = []
+
+                async for row in rows:
+                    chunk.append(row)
+
+                    if len(chunk) >= fetch_size:
+                        await chunks.put(chunk)
+                        chunk = []
+
+                if chunk:
+                    await chunks.put(chunk)
+        except Exception:
+            # Wakes up stream, which raises the error by awaiting reader
+            await chunks.put(None)
+            raise
+
+        await chunks.put(None)
+
+    async def delete(self, oid: UUID, outbox_messages: Sequence[OutboxMessage] = ()) -> None:
+        """
+        Deletes user by one statement. Raises UserNotFoundError, if there is no such user.
+        """
+        async with self._uow as uow:
+            if not await uow.users.delete(oid):
+                raise UserNotFoundError(f"Couldn't find user {oid}")
+
+            await uow.outbox.add(outbox_messages)
+            await uow.commit()
+
+    async def delete_many(self, oids: Sequence[UUID]) -> list[UUID]:
+        """
+        Deletes users by one statement, unknown oids are skipped.
+        :return: oids of deleted users
+        """
         async with self._uow as uow:
-            await uow.users.delete(oid)
+            deleted_oids: list[UUID] = await uow.users.delete_many(oids)
             await uow.commit()
+            return deleted_oids
 
     async def check_existence(
         self,
-        oid: Optional[str] = None,
+        oid: Optional[UUID] = None,
         email: Optional[str] = None,
         surname: Optional[str] = None,
         name: Optional[str] = None,
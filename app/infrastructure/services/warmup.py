@@ -0,0 +1,189 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Final, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, AsyncTransaction
+
+from app.domain.entities.user import UserEntity
+from app.domain.values.user import Password, UserName, UserSurname
+from app.infrastructure.brokers.publishers.kafka.base import BaseKafkaMessageBrokerPublisher
+from app.infrastructure.outbox.message import OutboxMessage
+from app.infrastructure.repositories.outbox.alchemy import SQLAlchemyOutboxRepository
+from app.infrastructure.repositories.users.alchemy import SQLAlchemyUsersRepository
+from app.infrastructure.security.base import BasePasswordHasher
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def get_warmup_connections(pool_size: int, connections: Optional[int] = None) -> int:
+    """
+    Warm-up runs while requests are served, so at least one connection of pool is left for them.
+    :param connections: configured number of connections, half of pool by default
+    """
+    return min(connections or max(pool_size // 2, 1), max(pool_size - 1, 1))
+
+
+@dataclass
+class WarmupReport:
+    """
+    Result of warm-up, application is ready only after warm-up is finished (even if some steps failed).
+    """
+
+    ready: bool = False
+    duration: Optional[float] = None
+    steps: dict[str, str] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"ready": self.ready, "duration": self.duration, "steps": self.steps}
+
+
+class Warmup:
+    """
+    Prepares application for the first requests after start: fills connection pools, runs hot statements on every
+    pooled connection, so they are compiled by SQLAlchemy and prepared by driver, fetches Kafka metadata of topics
+    and runs one password hash, so hashing pool is started.
+
+    Writes on primary are made in a transaction, which is rolled back, replicas get only reads.
+    Failed steps are logged and reported, they don't prevent start of application.
+
+    It's started in background, when application already serves requests, so readiness probe reports
+    not ready application, until warm-up is finished.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        password_hasher: BasePasswordHasher,
+        publisher: BaseKafkaMessageBrokerPublisher,
+        replicas: Sequence[AsyncEngine] = (),
+        connections: int = 5,
+        timeout: float = 30.0,
+        report: Optional[WarmupReport] = None,
+    ) -> None:
+        self._engine: AsyncEngine = engine
+        self._hasher: BasePasswordHasher = password_hasher
+        self._publisher: BaseKafkaMessageBrokerPublisher = publisher
+        self._replicas: tuple[AsyncEngine, ...] = tuple(replicas)
+        self._connections: int = connections
+        self._timeout: float = timeout
+        self._report: WarmupReport = report if report is not None else WarmupReport()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def report(self) -> WarmupReport:
+        return self._report
+
+    async def start(self) -> None:
+        logger.info("Warm-up started.")
+        self._task = asyncio.create_task(self.run(), name="warm-up")
+
+    async def stop(self) -> None:
+        """
+        Cancels warm-up, if application is stopped before it's finished.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def run(self) -> None:
+        started: float = time.perf_counter()
+
+        try:
+            async with asyncio.timeout(self._timeout):
+                password: Optional[bytes] = await self._step("password_hasher", self._warm_up_hasher)
+
+                await asyncio.gather(
+                    self._step("database_primary", lambda: self._warm_up_engine(self._engine, password)),
+                    *(
+                        self._step(f"database_replica_{index}", lambda replica=replica: self._warm_up_engine(replica))
+                        for index, replica in enumerate(self._replicas)
+                    ),
+                    self._step("kafka", self._publisher.warm_up),
+                )
+        except TimeoutError:
+            logger.warning("Warm-up didn't finish in %s seconds", self._timeout)
+            self._report.steps = {step: result or "timeout" for step, result in self._report.steps.items()}
+
+        self._report.duration = time.perf_counter() - started
+        self._report.ready = True
+        logger.info("Warm-up finished in %.3f seconds: %s", self._report.duration, self._report.steps)
+
+    async def _step(self, name: str, warm_up: Callable[[], Awaitable[T]]) -> Optional[T]:
+        self._report.steps[name] = ""
+
+        try:
+            result: T = await warm_up()
+        except Exception as e:
+            logger.warning("Warm-up step %s failed: %s", name, e)
+            self._report.steps[name] = f"failed: {type(e).__name__}"
+            return None
+
+        self._report.steps[name] = "ok"
+        return result
+
+    async def _warm_up_hasher(self) -> bytes:
+        return await self._hasher.hash_password(uuid.uuid4().hex)
+
+    async def _warm_up_engine(self, engine: AsyncEngine, password: Optional[bytes] = None) -> None:
+        """
+        Opens connections at once, so pool keeps all of them, and runs hot statements on each of them.
+        Writes are run only if password is provided, because user can't be created without it.
+        """
+        opened: list[AsyncConnection | BaseException] = await asyncio.gather(
+            *(engine.connect().start() for _ in range(self._connections)),
+            return_exceptions=True,
+        )
+        connections: list[AsyncConnection] = [item for item in opened if isinstance(item, AsyncConnection)]
+
+        try:
+            if errors := [item for item in opened if isinstance(item, BaseException)]:
+                raise errors[0]
+
+            await asyncio.gather(*(self._run_hot_statements(connection, password) for connection in connections))
+        finally:
+            for connection in connections:
+                await connection.close()
+
+    @staticmethod
+    async def _run_hot_statements(connection: AsyncConnection, password: Optional[bytes] = None) -> None:
+        transaction: AsyncTransaction = await connection.begin()
+        session: AsyncSession = AsyncSession(bind=connection)
+
+        try:
+            users: SQLAlchemyUsersRepository = SQLAlchemyUsersRepository(session=session)
+            oid: uuid.UUID = uuid.uuid4()
+
+            await users.get_read_model(oid)
+            await users.get_read_models([oid])
+            await users.list_read_models_after(limit=1)
+            await users.list_read_models_after(limit=1, after=(datetime.now(UTC), oid))
+
+            if password is None:
+                return
+
+            user: UserEntity = UserEntity(
+                oid=oid,
+                name=UserName("Warmup"),
+                surname=UserSurname("Warmup"),
+                password=Password(password),
+            )
+
+            await users.add(user)
+            await users.update(oid=oid, model=user)
+            await users.delete(oid)
+            await SQLAlchemyOutboxRepository(session=session).add(
+                [OutboxMessage(topic="warm-up", payload={"oid": str(oid)})]
+            )
+        finally:
+            await session.close()
+            await transaction.rollback()
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
 from traceback import TracebackException
-from typing import Self
+from typing import Optional, Self
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.exceptions.infrastructure import UnitOfWorkNotStartedError
+
 
 class AbstractUnitOfWork(ABC):
     """
@@ -30,19 +34,48 @@ class AbstractUnitOfWork(ABC):
         raise NotImplementedError
 
 
+@dataclass
+class SessionState:
+    """
+    Session of the current task with information about nesting of unit of work.
+    """
+
+    session: AsyncSession
+    token: Optional[Token[Optional["SessionState"]]] = None
+    depth: int = 1
+    commit_requested: bool = False
+
+
 class SQLAlchemyAbstractUnitOfWork(AbstractUnitOfWork):
     """
     Unit of work interface for SQLAlchemy, from which should be inherited all other units of work,
     which would be based on SQLAlchemy logics.
+
+    Unit of work is shared between requests, so the session is kept in a context variable, which is separate for
+    each asyncio task. Unit of work is reentrant: nested "async with" reuses session and transaction of the outer
+    one, commit() on nested level is postponed until the outermost level exits without exception. So the whole
+    command runs on one connection and commits once.
     """
 
     def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
         super().__init__()
         self._session_factory = session_factory
+        self._state: ContextVar[Optional[SessionState]] = ContextVar(f"uow_state_{id(self)}", default=None)
+
+    @property
+    def _session(self) -> AsyncSession:
+        return self._current_state().session
 
     async def __aenter__(self) -> Self:
-        self._session: AsyncSession = self._session_factory()
-        return await super().__aenter__()
+        state: Optional[SessionState] = self._state.get()
+
+        if state is not None:
+            state.depth += 1
+            return self
+
+        state = SessionState(session=self._session_factory())
+        state.token = self._state.set(state)
+        return self
 
     async def __aexit__(
         self,
@@ -50,11 +83,31 @@ class SQLAlchemyAbstractUnitOfWork(AbstractUnitOfWork):
         exc_value: BaseException | None,
         traceback: TracebackException | None,
     ) -> None:
-        await super().__aexit__(exc_type, exc_value, traceback)
-        await self._session.close()
+        state: SessionState = self._current_state()
+
+        if state.depth > 1:
+            state.depth -= 1
+            return
+
+        try:
+            if exc_type is None and state.commit_requested:
+                await state.session.commit()
+            else:
+                await super().__aexit__(exc_type, exc_value, traceback)
+        finally:
+            await state.session.close()
+            if state.token is not None:
+                self._state.reset(state.token)
 
     async def commit(self) -> None:
-        await self._session.commit()
+        state: SessionState = self._current_state()
+
+        if state.depth > 1:
+            state.commit_requested = True
+            return
+
+        await state.session.commit()
+        state.commit_requested = False
 
     async def rollback(self) -> None:
         """
@@ -70,3 +123,9 @@ class SQLAlchemyAbstractUnitOfWork(AbstractUnitOfWork):
 
         self._session.expunge_all()
         await self._session.rollback()
+
+    def _current_state(self) -> SessionState:
+        if (state := self._state.get()) is None:
+            raise UnitOfWorkNotStartedError(f"{self.__class__.__name__} is used outside of 'async with' block")
+
+        return state
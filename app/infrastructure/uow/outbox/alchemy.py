@@ -0,0 +1,13 @@
+from typing import override
+
+from app.infrastructure.repositories.outbox.alchemy import SQLAlchemyOutboxRepository
+from app.infrastructure.repositories.outbox.base import OutboxRepository
+from app.infrastructure.uow.base import SQLAlchemyAbstractUnitOfWork
+from app.infrastructure.uow.outbox.base import OutboxUnitOfWork
+
+
+class SQLAlchemyOutboxUnitOfWork(SQLAlchemyAbstractUnitOfWork, OutboxUnitOfWork):
+    @property
+    @override
+    def outbox(self) -> OutboxRepository:
+        return SQLAlchemyOutboxRepository(session=self._session)
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from app.infrastructure.repositories.outbox.base import OutboxRepository
+from app.infrastructure.uow.base import AbstractUnitOfWork
+
+
+class OutboxUnitOfWork(AbstractUnitOfWork, ABC):
+    """
+    An interface for work with outbox, that is used by outbox relay.
+    """
+
+    @property
+    @abstractmethod
+    def outbox(self) -> OutboxRepository:
+        raise NotImplementedError
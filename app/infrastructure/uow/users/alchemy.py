@@ -1,15 +1,31 @@
-from typing import TYPE_CHECKING, Self
+from typing import override
 
+from app.exceptions.infrastructure import ReadOnlyUnitOfWorkError
+from app.infrastructure.repositories.outbox.alchemy import SQLAlchemyOutboxRepository
+from app.infrastructure.repositories.outbox.base import OutboxRepository
 from app.infrastructure.repositories.users.alchemy import SQLAlchemyUsersRepository
+from app.infrastructure.repositories.users.base import UsersRepository
 from app.infrastructure.uow.base import SQLAlchemyAbstractUnitOfWork
-from app.infrastructure.uow.users.base import UsersUnitOfWork
-
-if TYPE_CHECKING:
-    from app.infrastructure.repositories.users.base import UsersRepository
+from app.infrastructure.uow.users.base import ReadOnlyUsersUnitOfWork, UsersUnitOfWork
 
 
 class SQLAlchemyUsersUnitOfWork(SQLAlchemyAbstractUnitOfWork, UsersUnitOfWork):
-    async def __aenter__(self) -> Self:
-        uow = await super().__aenter__()
-        self.users: UsersRepository = SQLAlchemyUsersRepository(session=self._session)
-        return uow
+    @property
+    @override
+    def users(self) -> UsersRepository:
+        return SQLAlchemyUsersRepository(session=self._session)
+
+    @property
+    @override
+    def outbox(self) -> OutboxRepository:
+        return SQLAlchemyOutboxRepository(session=self._session)
+
+
+class SQLAlchemyReadOnlyUsersUnitOfWork(SQLAlchemyUsersUnitOfWork, ReadOnlyUsersUnitOfWork):
+    """
+    Unit of work of views, its sessions are made by routing session maker, so they may be bound to a replica.
+    """
+
+    @override
+    async def commit(self) -> None:
+        raise ReadOnlyUnitOfWorkError("Read-only unit of work can't commit")
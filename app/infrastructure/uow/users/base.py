@@ -1,5 +1,6 @@
-from abc import ABC
+from abc import ABC, abstractmethod
 
+from app.infrastructure.repositories.outbox.base import OutboxRepository
 from app.infrastructure.repositories.users.base import UsersRepository
 from app.infrastructure.uow.base import AbstractUnitOfWork
 
@@ -11,4 +12,18 @@ class UsersUnitOfWork(AbstractUnitOfWork, ABC):
     using dependency injection without disrupting its functionality.
     """
 
-    users: UsersRepository
+    @property
+    @abstractmethod
+    def users(self) -> UsersRepository:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def outbox(self) -> OutboxRepository:
+        raise NotImplementedError
+
+
+class ReadOnlyUsersUnitOfWork(UsersUnitOfWork, ABC):
+    """
+    Unit of work for read paths, it may be bound to a replica, so it must never commit.
+    """
@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 from typing import (
     TYPE_CHECKING,
@@ -11,7 +12,7 @@ from app.logic.handlers.base import (
     AbstractCommandHandler,
     AbstractEventHandler,
 )
-from app.logic.message_bus import MessageBus
+from app.logic.message_bus import MessageBus, MessageBusMetrics
 from app.logic.types.handlers import (
     CommandHandlerMapping,
     EventHandlerMapping,
@@ -35,11 +36,26 @@ class Bootstrap:
         events_handlers_for_injection: EventHandlerMapping,  # type: ignore
         commands_handlers_for_injection: CommandHandlerMapping,  # type: ignore
         dependencies: Optional[dict[str, Any]] = None,
+        concurrent_event_handlers: bool = False,
+        max_concurrency: int = 8,
+        handler_timeout: Optional[float] = None,
+        metrics: Optional[MessageBusMetrics] = None,
     ) -> None:
         self._event_buffer = event_buffer
         self._dependencies: dict[str, Any] = {"event_buffer": self._event_buffer}
         self._events_handlers_for_injection = events_handlers_for_injection
         self._commands_handlers_for_injection = commands_handlers_for_injection
+        self._concurrent_event_handlers = concurrent_event_handlers
+        self._max_concurrency = max_concurrency
+        self._handler_timeout = handler_timeout
+        self._metrics = metrics if metrics is not None else MessageBusMetrics()
+        self._injected_event_handlers: Optional[
+            dict[type[AbstractEvent], list[AbstractEventHandler[AbstractEvent]]]
+        ] = None
+        self._injected_command_handlers: Optional[
+            dict[type[AbstractCommand], AbstractCommandHandler[AbstractCommand]]
+        ] = None
+        self._injection_lock: asyncio.Lock = asyncio.Lock()
 
         if dependencies:
             self._dependencies.update(dependencies)
@@ -48,24 +64,45 @@ class Bootstrap:
         """
         Makes necessary injections to commands handlers and events handlers for creating appropriate messagebus,
         after which returns messagebus instance.
+
+        Handlers are injected only on the first call and reused afterward, so a messagebus may be cheaply created
+        per request.
         """
 
-        injected_event_handlers: dict[type[AbstractEvent], list[AbstractEventHandler[AbstractEvent]]] = {
-            event_type: [await self._inject_dependencies(handler=handler) for handler in event_handlers]
-            for event_type, event_handlers in self._events_handlers_for_injection.items()
-        }
-
-        injected_command_handlers: dict[type[AbstractCommand], AbstractCommandHandler[AbstractCommand]] = {
-            command_type: await self._inject_dependencies(handler=handler)
-            for command_type, handler in self._commands_handlers_for_injection.items()
-        }
+        if self._injected_event_handlers is None or self._injected_command_handlers is None:
+            await self._inject_handlers()
 
         return MessageBus(
             event_buffer=self._event_buffer,
-            event_handlers=injected_event_handlers,
-            command_handlers=injected_command_handlers,
+            event_handlers=self._injected_event_handlers,
+            command_handlers=self._injected_command_handlers,
+            concurrent_event_handlers=self._concurrent_event_handlers,
+            max_concurrency=self._max_concurrency,
+            handler_timeout=self._handler_timeout,
+            metrics=self._metrics,
         )
 
+    async def _inject_handlers(self) -> None:
+        """
+        Concurrent first requests wait for one injection, handlers are published only when both maps are filled.
+        """
+        async with self._injection_lock:
+            if self._injected_event_handlers is not None and self._injected_command_handlers is not None:
+                return
+
+            injected_event_handlers: dict[type[AbstractEvent], list[AbstractEventHandler[AbstractEvent]]] = {
+                event_type: [await self._inject_dependencies(handler=handler) for handler in event_handlers]
+                for event_type, event_handlers in self._events_handlers_for_injection.items()
+            }
+
+            injected_command_handlers: dict[type[AbstractCommand], AbstractCommandHandler[AbstractCommand]] = {
+                command_type: await self._inject_dependencies(handler=handler)
+                for command_type, handler in self._commands_handlers_for_injection.items()
+            }
+
+            self._injected_event_handlers = injected_event_handlers
+            self._injected_command_handlers = injected_command_handlers
+
     async def _inject_dependencies(
         self, handler: Union[type[AbstractEventHandler], type[AbstractCommandHandler]]
     ) -> Union[AbstractEventHandler, AbstractCommandHandler]:
@@ -1,14 +1,12 @@
-import contextlib
 from abc import ABC
-from dataclasses import (
-    asdict,
-    dataclass,
-)
+from dataclasses import dataclass
 from typing import (
     Any,
     Optional,
 )
 
+from app.domain.serializers import NO_FIELDS, get_serializer
+
 
 @dataclass(frozen=True)
 class AbstractCommand(ABC):  # noqa
@@ -17,23 +15,14 @@ class AbstractCommand(ABC):  # noqa
     Commands represents external operations, which must be executed.
     """
 
-    async def to_dict(
-        self,
-        exclude: Optional[set[str]] = None,
-        include: Optional[dict[str, Any]] = None,
-    ) -> dict[str, Any]:
+    def to_dict(self, exclude: Optional[set[str]] = None, include: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
-        Create a dictionary representation of the model.
+        Create a dictionary representation of the model. Values aren't copied, nested models are kept as they are.
 
         exclude: set of model fields, which should be excluded from dictionary representation.
         include: set of model fields, which should be included into dictionary representation.
         """
-
-        data: dict[str, Any] = asdict(self)
-        if exclude:
-            for key in exclude:
-                with contextlib.suppress(KeyError):
-                    del data[key]
+        data: dict[str, Any] = get_serializer(type(self), frozenset(exclude) if exclude else NO_FIELDS)(self)
 
         if include:
             data.update(include)
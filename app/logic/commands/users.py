@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from uuid import UUID
 
 from app.logic.commands.base import AbstractCommand
 
@@ -12,7 +13,19 @@ class CreateUserCommand(AbstractCommand):
 
 @dataclass(frozen=True)
 class UpdateUserCommand(AbstractCommand):
-    oid: str
+    oid: UUID
+    surname: str
+    name: str
+    password: str
+
+
+@dataclass(frozen=True)
+class UpsertUserCommand(AbstractCommand):
+    """
+    Creates user with provided oid or replaces the existing one, so repeating it gives the same result.
+    """
+
+    oid: UUID
     surname: str
     name: str
     password: str
@@ -20,4 +33,18 @@ class UpdateUserCommand(AbstractCommand):
 
 @dataclass(frozen=True)
 class DeleteUserCommand(AbstractCommand):
-    oid: str
+    oid: UUID
+
+
+@dataclass(frozen=True)
+class DeleteUsersCommand(AbstractCommand):
+    oids: tuple[UUID, ...]
+
+
+@dataclass(frozen=True)
+class ImportUsersCommand(AbstractCommand):
+    """
+    Creates a chunk of users at once. Rows are validated one by one, so invalid rows don't fail the chunk.
+    """
+
+    users: tuple[CreateUserCommand, ...]
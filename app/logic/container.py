@@ -1,9 +1,11 @@
 import logging
+from collections.abc import AsyncIterator
 from functools import lru_cache
-from typing import Final, cast
+from typing import Any, Final, cast
 
 from dishka import AsyncContainer, Provider, Scope, from_context, make_async_container, provide
 from faststream.kafka import KafkaBroker
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -11,23 +13,65 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from app.infrastructure.brokers.factory import EventHandlerTopicFactory
+from app.infrastructure.adapters.alchemy.pool import (
+    DatabasePoolsMetrics,
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolMetrics,
+    instrument_engine,
+)
+from app.infrastructure.adapters.alchemy.routing import ReadYourWrites, ReplicaRouter, RoutingSessionMaker
 from app.infrastructure.brokers.publishers.kafka.base import BaseKafkaMessageBrokerPublisher
-from app.infrastructure.brokers.publishers.kafka.faststream import FastStreamKafkaMessageBroker
-from app.infrastructure.uow.users.alchemy import SQLAlchemyUsersUnitOfWork
-from app.infrastructure.uow.users.base import UsersUnitOfWork
+from app.infrastructure.brokers.publishers.kafka.faststream import (
+    BatchingFastStreamKafkaMessageBroker,
+    FastStreamKafkaMessageBroker,
+)
+from app.infrastructure.brokers.schemas.users import UserCreateSchema, UserDeleteSchema, UserUpdateSchema
+from app.infrastructure.cache.memory import CacheMetrics
+from app.infrastructure.cache.users import UsersCache
+from app.infrastructure.outbox.factory import OutboxMessageFactory
+from app.infrastructure.outbox.relay import OutboxRelay, OutboxRelayMetrics
+from app.infrastructure.security.base import BasePasswordHasher
+from app.infrastructure.security.executor import ExecutorPasswordHasher, HashingMetrics
+from app.infrastructure.services.coalescing import CoalescingUsersWriter, WriteCoalescingMetrics
+from app.infrastructure.services.warmup import Warmup, WarmupReport, get_warmup_connections
+from app.infrastructure.uow.outbox.alchemy import SQLAlchemyOutboxUnitOfWork
+from app.infrastructure.uow.users.alchemy import SQLAlchemyReadOnlyUsersUnitOfWork, SQLAlchemyUsersUnitOfWork
+from app.infrastructure.uow.users.base import ReadOnlyUsersUnitOfWork, UsersUnitOfWork
 from app.logic.bootstrap import Bootstrap
-from app.logic.commands.users import CreateUserCommand, DeleteUserCommand, UpdateUserCommand
+from app.logic.commands.users import (
+    CreateUserCommand,
+    DeleteUserCommand,
+    DeleteUsersCommand,
+    ImportUsersCommand,
+    UpdateUserCommand,
+    UpsertUserCommand,
+)
 from app.logic.event_buffer import EventBuffer
-from app.logic.events.users import UserCreateEvent, UserDeleteEvent, UserUpdateEvent
+from app.logic.events.users import (
+    UserCreateEvent,
+    UserDeleteEvent,
+    UsersDeleteEvent,
+    UsersImportEvent,
+    UserUpdateEvent,
+)
 from app.logic.handlers.users.commands import (
     CreateUserCommandHandler,
     DeleteUserCommandHandler,
+    DeleteUsersCommandHandler,
+    ImportUsersCommandHandler,
     UpdateUserCommandHandler,
+    UpsertUserCommandHandler,
+)
+from app.logic.handlers.users.events import (
+    UserCreateCacheEventHandler,
+    UserDeleteCacheEventHandler,
+    UsersDeleteCacheEventHandler,
+    UsersImportCacheEventHandler,
+    UserUpdateCacheEventHandler,
 )
-from app.logic.handlers.users.events import UserCreateEventHandler, UserDeleteEventHandler, UserUpdateEventHandler
-from app.logic.message_bus import MessageBus
+from app.logic.message_bus import MessageBus, MessageBusMetrics
 from app.logic.types.handlers import CommandHandlerMapping, EventHandlerMapping
+from app.logic.views.users import UsersViews
 from app.settings.configs.app import Settings, get_settings
 
 logger: Final[logging.Logger] = logging.getLogger(__name__)
@@ -45,6 +89,9 @@ class HandlerProvider(Provider):
                 CreateUserCommand: CreateUserCommandHandler,
                 UpdateUserCommand: UpdateUserCommandHandler,
                 DeleteUserCommand: DeleteUserCommandHandler,
+                ImportUsersCommand: ImportUsersCommandHandler,
+                UpsertUserCommand: UpsertUserCommandHandler,
+                DeleteUsersCommand: DeleteUsersCommandHandler,
             },
         )
 
@@ -56,9 +103,11 @@ class HandlerProvider(Provider):
         return cast(
             "EventHandlerMapping",
             {
-                UserCreateEvent: [UserCreateEventHandler],
-                UserDeleteEvent: [UserDeleteEventHandler],
-                UserUpdateEvent: [UserUpdateEventHandler],
+                UserCreateEvent: [UserCreateCacheEventHandler],
+                UserDeleteEvent: [UserDeleteCacheEventHandler],
+                UserUpdateEvent: [UserUpdateCacheEventHandler],
+                UsersImportEvent: [UsersImportCacheEventHandler],
+                UsersDeleteEvent: [UsersDeleteCacheEventHandler],
             },
         )
 
@@ -67,18 +116,30 @@ class BrokerProvider(Provider):
     settings = from_context(provides=Settings, scope=Scope.APP)
 
     @provide(scope=Scope.APP)
-    async def get_mapping_events_and_topic(self, settings: Settings) -> EventHandlerTopicFactory:
-        return EventHandlerTopicFactory(
+    async def get_outbox_message_factory(self, settings: Settings) -> OutboxMessageFactory:
+        """
+        Here you have to link events with topics and broker schemas, events are saved to outbox with them.
+        """
+        return OutboxMessageFactory(
             mapping={
-                UserCreateEventHandler: settings.broker_kafka.user_create_topic,
-                UserDeleteEventHandler: settings.broker_kafka.user_delete_topic,
-                UserUpdateEventHandler: settings.broker_kafka.user_update_topic,
+                UserCreateEvent: (settings.broker_kafka.user_create_topic, UserCreateSchema.from_event),
+                UserDeleteEvent: (settings.broker_kafka.user_delete_topic, UserDeleteSchema.from_event),
+                UserUpdateEvent: (settings.broker_kafka.user_update_topic, UserUpdateSchema.from_event),
+                UsersImportEvent: (settings.broker_kafka.user_create_topic, UserCreateSchema.from_import_event),
+                UsersDeleteEvent: (settings.broker_kafka.user_delete_topic, UserDeleteSchema.from_bulk_delete_event),
             }
         )
 
     @provide(scope=Scope.APP)
     async def get_faststream_kafka_broker(self, settings: Settings) -> KafkaBroker:
-        return KafkaBroker(bootstrap_servers=str(settings.broker_kafka.url))
+        return KafkaBroker(
+            bootstrap_servers=str(settings.broker_kafka.url),
+            linger_ms=settings.broker_kafka.linger_ms,
+            max_batch_size=settings.broker_kafka.max_batch_size,
+            compression_type=settings.broker_kafka.compression_type,
+            acks=settings.broker_kafka.acks,
+            enable_idempotence=settings.broker_kafka.enable_idempotence,
+        )
 
     @provide(scope=Scope.APP)
     async def get_producer(
@@ -86,19 +147,23 @@ class BrokerProvider(Provider):
         settings: Settings,
         faststream_kafka_broker: KafkaBroker,
     ) -> BaseKafkaMessageBrokerPublisher:
+        topics: tuple[str, ...] = (
+            settings.broker_kafka.user_create_topic,
+            settings.broker_kafka.user_update_topic,
+            settings.broker_kafka.user_delete_topic,
+        )
+
+        if settings.broker_kafka.batch_publish:
+            return BatchingFastStreamKafkaMessageBroker(
+                broker=faststream_kafka_broker,
+                producers={topic: faststream_kafka_broker.publisher(topic, batch=True) for topic in topics},
+                max_batch_size=settings.broker_kafka.batch_publish_size,
+                linger_ms=settings.broker_kafka.batch_publish_linger_ms,
+            )
+
         return FastStreamKafkaMessageBroker(
             broker=faststream_kafka_broker,
-            producers={
-                settings.broker_kafka.user_create_topic: faststream_kafka_broker.publisher(
-                    settings.broker_kafka.user_create_topic
-                ),
-                settings.broker_kafka.user_update_topic: faststream_kafka_broker.publisher(
-                    settings.broker_kafka.user_update_topic
-                ),
-                settings.broker_kafka.user_delete_topic: faststream_kafka_broker.publisher(
-                    settings.broker_kafka.user_delete_topic
-                ),
-            },
+            producers={topic: faststream_kafka_broker.publisher(topic) for topic in topics},
         )
 
 
@@ -109,19 +174,104 @@ class AppProvider(Provider):
     async def get_users_uow(self, session_maker: async_sessionmaker[AsyncSession]) -> UsersUnitOfWork:
         return SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
 
+    @provide(scope=Scope.APP)
+    async def get_users_read_only_uow(self, session_maker: RoutingSessionMaker) -> ReadOnlyUsersUnitOfWork:
+        return SQLAlchemyReadOnlyUsersUnitOfWork(session_factory=session_maker)
+
+    @provide(scope=Scope.APP)
+    async def get_cache_metrics(self) -> CacheMetrics:
+        return CacheMetrics()
+
+    @provide(scope=Scope.APP)
+    async def get_users_cache(self, settings: Settings, cache_metrics: CacheMetrics) -> UsersCache:
+        return UsersCache(
+            max_size=settings.users_cache.max_size,
+            ttl=settings.users_cache.ttl,
+            negative_ttl=settings.users_cache.negative_ttl,
+            metrics=cache_metrics,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_users_views(
+        self,
+        users_uow: ReadOnlyUsersUnitOfWork,
+        users_cache: UsersCache,
+        read_your_writes: ReadYourWrites,
+        settings: Settings,
+    ) -> UsersViews:
+        return UsersViews(
+            uow=users_uow,
+            max_page_size=settings.pagination.max_page_size,
+            cache=users_cache if settings.users_cache.enabled else None,
+            export_fetch_size=settings.export.fetch_size,
+            # Without replicas all reads go to primary, so pinned clients may use cache and shared loads,
+            # otherwise users read from a lagging replica are cached not longer than replicas may lag
+            read_your_writes=read_your_writes if settings.database.replica_urls else None,
+            max_cache_ttl=settings.replicas.read_your_writes_window if settings.database.replica_urls else None,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_hashing_metrics(self) -> HashingMetrics:
+        return HashingMetrics()
+
+    @provide(scope=Scope.APP)
+    async def get_password_hasher(
+        self,
+        settings: Settings,
+        hashing_metrics: HashingMetrics,
+    ) -> AsyncIterator[BasePasswordHasher]:
+        password_hasher: BasePasswordHasher = ExecutorPasswordHasher(
+            executor_type=settings.hashing.executor,
+            max_workers=settings.hashing.max_workers,
+            max_queue_size=settings.hashing.max_queue_size,
+            max_batch_workers=settings.hashing.max_batch_workers,
+            rounds=settings.hashing.rounds,
+            metrics=hashing_metrics,
+        )
+        yield password_hasher
+        await password_hasher.shutdown()
+
+    @provide(scope=Scope.APP)
+    async def get_write_coalescing_metrics(self) -> WriteCoalescingMetrics:
+        return WriteCoalescingMetrics()
+
+    @provide(scope=Scope.APP)
+    async def get_users_writer(
+        self,
+        settings: Settings,
+        users_uow: UsersUnitOfWork,
+        write_coalescing_metrics: WriteCoalescingMetrics,
+    ) -> AsyncIterator[CoalescingUsersWriter]:
+        users_writer: CoalescingUsersWriter = CoalescingUsersWriter(
+            uow=users_uow,
+            max_batch_size=settings.write_coalescing.max_batch_size,
+            window_ms=settings.write_coalescing.window_ms,
+            metrics=write_coalescing_metrics,
+        )
+        yield users_writer
+        await users_writer.close()
+
     @provide(scope=Scope.APP)
     async def get_event_buffer(self) -> EventBuffer:
         return EventBuffer()
 
+    @provide(scope=Scope.APP)
+    async def get_message_bus_metrics(self) -> MessageBusMetrics:
+        return MessageBusMetrics()
+
     @provide(scope=Scope.APP)
     async def get_bootstrap(
         self,
+        settings: Settings,
+        message_bus_metrics: MessageBusMetrics,
         events: EventHandlerMapping,
         commands: CommandHandlerMapping,
-        kafka_broker: BaseKafkaMessageBrokerPublisher,
-        event_handler_and_topic_factory: EventHandlerTopicFactory,
+        outbox_message_factory: OutboxMessageFactory,
         user_uow: UsersUnitOfWork,
         event_buffer: EventBuffer,
+        password_hasher: BasePasswordHasher,
+        users_cache: UsersCache,
+        users_writer: CoalescingUsersWriter,
     ) -> Bootstrap:
         return Bootstrap(
             event_buffer=event_buffer,
@@ -129,12 +279,62 @@ class AppProvider(Provider):
             commands_handlers_for_injection=commands,
             dependencies={
                 "users_uow": user_uow,
-                "kafka_broker": kafka_broker,
-                "event_handler_and_topic_factory": event_handler_and_topic_factory,
+                "outbox_message_factory": outbox_message_factory,
+                "password_hasher": password_hasher,
+                "users_cache": users_cache,
+                "users_writer": users_writer if settings.write_coalescing.enabled else None,
             },
+            concurrent_event_handlers=settings.message_bus.concurrent_event_handlers,
+            max_concurrency=settings.message_bus.max_concurrency,
+            handler_timeout=settings.message_bus.handler_timeout,
+            metrics=message_bus_metrics,
         )
 
     @provide(scope=Scope.APP)
+    async def get_outbox_relay_metrics(self) -> OutboxRelayMetrics:
+        return OutboxRelayMetrics()
+
+    @provide(scope=Scope.APP)
+    async def get_outbox_relay(
+        self,
+        settings: Settings,
+        session_maker: async_sessionmaker[AsyncSession],
+        kafka_broker: BaseKafkaMessageBrokerPublisher,
+        outbox_relay_metrics: OutboxRelayMetrics,
+    ) -> OutboxRelay:
+        return OutboxRelay(
+            uow=SQLAlchemyOutboxUnitOfWork(session_factory=session_maker),
+            broker=kafka_broker,
+            batch_size=settings.outbox.batch_size,
+            poll_interval=settings.outbox.poll_interval,
+            metrics=outbox_relay_metrics,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_warmup_report(self) -> WarmupReport:
+        return WarmupReport()
+
+    @provide(scope=Scope.APP)
+    async def get_warmup(
+        self,
+        settings: Settings,
+        engine: AsyncEngine,
+        router: ReplicaRouter,
+        password_hasher: BasePasswordHasher,
+        kafka_broker: BaseKafkaMessageBrokerPublisher,
+        warmup_report: WarmupReport,
+    ) -> Warmup:
+        return Warmup(
+            engine=engine,
+            password_hasher=password_hasher,
+            publisher=kafka_broker,
+            replicas=router.replicas,
+            connections=get_warmup_connections(settings.alchemy.pool_size, settings.warmup.connections),
+            timeout=settings.warmup.timeout,
+            report=warmup_report,
+        )
+
+    @provide(scope=Scope.REQUEST)
     async def get_message_bus(self, bootstrap: Bootstrap) -> MessageBus:
         return await bootstrap.get_messagebus()
 
@@ -143,13 +343,12 @@ class DatabaseProvider(Provider):
     settings = from_context(provides=Settings, scope=Scope.APP)
 
     @provide(scope=Scope.APP)
-    async def get_engine_client(self, settings: Settings) -> AsyncEngine:
-        engine: AsyncEngine = create_async_engine(
-            url=settings.database.url,
-            pool_pre_ping=settings.alchemy.pool_pre_ping,
-            pool_recycle=settings.alchemy.pool_recycle,
-            echo=settings.alchemy.echo,
-        )
+    async def get_database_pools_metrics(self) -> DatabasePoolsMetrics:
+        return DatabasePoolsMetrics()
+
+    @provide(scope=Scope.APP)
+    async def get_engine_client(self, settings: Settings, pools_metrics: DatabasePoolsMetrics) -> AsyncEngine:
+        engine: AsyncEngine = self._create_engine(settings.database.url, settings, pools_metrics, name="primary")
 
         logger.info("Successfully connected to database")
 
@@ -165,6 +364,79 @@ class DatabaseProvider(Provider):
 
         return session_maker
 
+    @provide(scope=Scope.APP)
+    async def get_read_your_writes(self, settings: Settings) -> ReadYourWrites:
+        # Without replicas all reads go to primary, so clients aren't pinned
+        return ReadYourWrites(
+            window=settings.replicas.read_your_writes_window if settings.database.replica_urls else 0,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_replica_router(
+        self,
+        engine: AsyncEngine,
+        settings: Settings,
+        read_your_writes: ReadYourWrites,
+        pools_metrics: DatabasePoolsMetrics,
+    ) -> AsyncIterator[ReplicaRouter]:
+        replicas: list[AsyncEngine] = [
+            self._create_engine(url, settings, pools_metrics, name=f"replica-{index}")
+            for index, url in enumerate(settings.database.replica_urls)
+        ]
+
+        if replicas:
+            logger.info("Views read from %s replicas, routing: %s", len(replicas), settings.replicas.routing)
+
+        yield ReplicaRouter(
+            primary=engine,
+            replicas=replicas,
+            strategy=settings.replicas.routing,
+            read_your_writes=read_your_writes,
+        )
+
+        for replica in replicas:
+            await replica.dispose()
+
+    @provide(scope=Scope.APP)
+    async def get_read_only_session_maker(self, router: ReplicaRouter, settings: Settings) -> RoutingSessionMaker:
+        return RoutingSessionMaker(
+            router=router,
+            autoflush=False,
+            expire_on_commit=settings.alchemy.expire_on_commit,
+        )
+
+    @staticmethod
+    def _create_engine(url: str, settings: Settings, pools_metrics: DatabasePoolsMetrics, name: str) -> AsyncEngine:
+        connect_args: dict[str, Any] = {}
+
+        if make_url(url).get_driver_name() == "asyncpg":
+            server_settings: dict[str, str] = {"application_name": settings.alchemy.application_name}
+
+            if settings.alchemy.statement_timeout is not None:
+                server_settings["statement_timeout"] = str(settings.alchemy.statement_timeout)
+
+            connect_args = {
+                "prepared_statement_cache_size": settings.alchemy.prepared_statement_cache_size,
+                "server_settings": server_settings,
+            }
+
+        engine: AsyncEngine = create_async_engine(
+            url=url,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_size=settings.alchemy.pool_size,
+            max_overflow=settings.alchemy.max_overflow,
+            pool_timeout=settings.alchemy.pool_timeout,
+            pool_pre_ping=settings.alchemy.pool_pre_ping,
+            pool_recycle=settings.alchemy.pool_recycle,
+            echo=settings.alchemy.echo,
+            connect_args=connect_args,
+        )
+
+        pools_metrics.pools[name] = PoolMetrics()
+        instrument_engine(engine, pools_metrics.pools[name])
+
+        return engine
+
 
 @lru_cache(maxsize=1)
 def get_container() -> AsyncContainer:
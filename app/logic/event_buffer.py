@@ -1,17 +1,42 @@
 from collections import deque
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 
 from app.logic.events.base import AbstractEvent
 
 
 class EventBuffer:
+    """
+    Buffer of events raised by handlers. Handlers are injected once and shared between requests, so the storage
+    itself lives in a context variable: each dispatch of MessageBus gets its own deque, and concurrent requests
+    never see each other's events.
+    """
+
     def __init__(self) -> None:
-        self._buffer: deque[AbstractEvent] = deque()
+        self._buffer: ContextVar[deque[AbstractEvent] | None] = ContextVar(f"event_buffer_{id(self)}", default=None)
+
+    @contextmanager
+    def dispatch(self) -> Iterator[None]:
+        """Opens a fresh buffer for the current dispatch and restores the previous one after it."""
+        token: Token[deque[AbstractEvent] | None] = self._buffer.set(deque())
+        try:
+            yield
+        finally:
+            self._buffer.reset(token)
 
     def add(self, event: AbstractEvent) -> None:
-        self._buffer.append(event)
+        self._current().append(event)
 
     def get_events(self) -> Generator[AbstractEvent, None, None]:
         """Генератор, который извлекает события по FIFO."""
-        while self._buffer:
-            yield self._buffer.popleft()
+        buffer: deque[AbstractEvent] = self._current()
+        while buffer:
+            yield buffer.popleft()
+
+    def _current(self) -> deque[AbstractEvent]:
+        buffer: deque[AbstractEvent] | None = self._buffer.get()
+        if buffer is None:
+            buffer = deque()
+            self._buffer.set(buffer)
+        return buffer
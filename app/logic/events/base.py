@@ -1,12 +1,12 @@
-import contextlib
 from abc import ABC
 from dataclasses import (
-    asdict,
     dataclass,
     field,
 )
 from typing import Any
-from uuid import uuid4
+from uuid import UUID, uuid4
+
+from app.domain.serializers import NO_FIELDS, get_serializer
 
 
 @dataclass(frozen=True)
@@ -16,21 +16,16 @@ class AbstractEvent(ABC):  # noqa
     Events represents internal operations, which may be executed.
     """
 
-    oid: str = field(default_factory=lambda: str(uuid4()), kw_only=True)
+    oid: UUID = field(default_factory=uuid4, kw_only=True)
 
-    async def to_dict(self, exclude: set[str] | None = None, include: dict[str, Any] | None = None) -> dict[str, Any]:
+    def to_dict(self, exclude: set[str] | None = None, include: dict[str, Any] | None = None) -> dict[str, Any]:
         """
-        Create a dictionary representation of the model.
+        Create a dictionary representation of the model. Values aren't copied, nested models are kept as they are.
 
         exclude: set of model fields, which should be excluded from dictionary representation.
         include: set of model fields, which should be included into dictionary representation.
         """
-
-        data: dict[str, Any] = asdict(self)
-        if exclude:
-            for key in exclude:
-                with contextlib.suppress(KeyError):
-                    del data[key]
+        data: dict[str, Any] = get_serializer(type(self), frozenset(exclude) if exclude else NO_FIELDS)(self)
 
         if include:
             data.update(include)
@@ -1,22 +1,41 @@
 from dataclasses import dataclass
+from uuid import UUID
 
 from app.logic.events.base import AbstractEvent
 
 
 @dataclass(frozen=True)
 class UserCreateEvent(AbstractEvent):
-    oid: str
+    oid: UUID
     surname: str
     name: str
 
 
 @dataclass(frozen=True)
 class UserDeleteEvent(AbstractEvent):
-    user_oid: str
+    user_oid: UUID
 
 
 @dataclass(frozen=True)
 class UserUpdateEvent(AbstractEvent):
-    oid: str
+    oid: UUID
     surname: str
     name: str
+
+
+@dataclass(frozen=True)
+class UsersImportEvent(AbstractEvent):
+    """
+    One event for a whole chunk of bulk import.
+    """
+
+    users: tuple[UserCreateEvent, ...]
+
+
+@dataclass(frozen=True)
+class UsersDeleteEvent(AbstractEvent):
+    """
+    One event for all users deleted by bulk delete.
+    """
+
+    user_oids: tuple[UUID, ...]
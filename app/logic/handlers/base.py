@@ -4,7 +4,9 @@ from abc import (
 )
 from typing import (
     Any,
+    ClassVar,
     Generic,
+    Optional,
     TypeVar,
 )
 
@@ -19,8 +21,11 @@ CT = TypeVar("CT", bound=AbstractCommand)
 class AbstractEventHandler(ABC, Generic[ET]):
     """
     Abstract event handler class, from which every event handler should be inherited from.
+    Set timeout to override default timeout of message bus for this handler.
     """
 
+    timeout: ClassVar[Optional[float]] = None
+
     @abstractmethod
     def __init__(self, event_buffer: EventBuffer) -> None:
         raise NotImplementedError
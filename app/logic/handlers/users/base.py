@@ -1,40 +1,49 @@
 from abc import ABC
-from typing import TYPE_CHECKING
 
-from app.infrastructure.brokers.factory import EventHandlerTopicFactory
-from app.infrastructure.brokers.publishers.kafka.base import BaseKafkaMessageBrokerPublisher
+from app.infrastructure.cache.users import UsersCache
+from app.infrastructure.outbox.factory import OutboxMessageFactory
+from app.infrastructure.security.base import BasePasswordHasher
 from app.infrastructure.uow.users.base import UsersUnitOfWork
 from app.logic.event_buffer import EventBuffer
 from app.logic.handlers.base import AbstractCommandHandler, AbstractEventHandler
 from app.logic.types.handlers import CT, ET
 
-if TYPE_CHECKING:
-    from app.infrastructure.brokers.publishers.base import BaseMessageBrokerPublisher
-
 
 class UsersEventHandler(AbstractEventHandler[ET], ABC):
     """
     Abstract event handler class, from which every users event handler should be inherited from.
     """
 
-    def __init__(
-        self,
-        event_buffer: EventBuffer,
-        users_uow: UsersUnitOfWork,
-        kafka_broker: BaseKafkaMessageBrokerPublisher,
-        event_handler_and_topic_factory: EventHandlerTopicFactory,
-    ) -> None:
+    def __init__(self, event_buffer: EventBuffer, users_uow: UsersUnitOfWork) -> None:
         self._event_buffer: EventBuffer = event_buffer
         self._uow: UsersUnitOfWork = users_uow
-        self._broker: BaseMessageBrokerPublisher = kafka_broker
-        self._factory: EventHandlerTopicFactory = event_handler_and_topic_factory
+
+
+class UsersCacheEventHandler(AbstractEventHandler[ET], ABC):
+    """
+    Abstract event handler class for keeping users cache of views consistent with writes.
+    """
+
+    def __init__(self, event_buffer: EventBuffer, users_cache: UsersCache) -> None:
+        self._event_buffer: EventBuffer = event_buffer
+        self._cache: UsersCache = users_cache
 
 
 class UsersCommandHandler(AbstractCommandHandler[CT], ABC):
     """
     Abstract command handler class, from which every users command handler should be inherited from.
+    Events of command handlers are saved to outbox in the same transaction as users, and are published
+    to broker by outbox relay.
     """
 
-    def __init__(self, event_buffer: EventBuffer, users_uow: UsersUnitOfWork) -> None:
+    def __init__(
+        self,
+        event_buffer: EventBuffer,
+        users_uow: UsersUnitOfWork,
+        password_hasher: BasePasswordHasher,
+        outbox_message_factory: OutboxMessageFactory,
+    ) -> None:
         self._uow: UsersUnitOfWork = users_uow
         self._event_buffer: EventBuffer = event_buffer
+        self._hasher: BasePasswordHasher = password_hasher
+        self._outbox_factory: OutboxMessageFactory = outbox_message_factory
@@ -1,95 +1,247 @@
+import logging
+from typing import Final, Optional
+from uuid import UUID
+
 from app.domain.entities.user import UserEntity
 from app.domain.values.user import Password, UserName, UserSurname
+from app.exceptions.domain import BaseDomainError
 from app.exceptions.infrastructure import UserNotFoundError
-from app.infrastructure.security.hashing import hash_password
+from app.infrastructure.outbox.factory import OutboxMessageFactory
+from app.infrastructure.security.base import BasePasswordHasher
+from app.infrastructure.services.coalescing import CoalescingUsersWriter
 from app.infrastructure.services.users import UsersService
+from app.infrastructure.uow.users.base import UsersUnitOfWork
 from app.logic.commands.users import (
     CreateUserCommand,
     DeleteUserCommand,
+    DeleteUsersCommand,
+    ImportUsersCommand,
     UpdateUserCommand,
+    UpsertUserCommand,
+)
+from app.logic.event_buffer import EventBuffer
+from app.logic.events.users import (
+    UserCreateEvent,
+    UserDeleteEvent,
+    UsersDeleteEvent,
+    UsersImportEvent,
+    UserUpdateEvent,
 )
-from app.logic.events.users import UserCreateEvent, UserDeleteEvent, UserUpdateEvent
 from app.logic.handlers.users.base import UsersCommandHandler
 
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
 
 class CreateUserCommandHandler(UsersCommandHandler[CreateUserCommand]):
+    def __init__(
+        self,
+        event_buffer: EventBuffer,
+        users_uow: UsersUnitOfWork,
+        password_hasher: BasePasswordHasher,
+        outbox_message_factory: OutboxMessageFactory,
+        users_writer: Optional[CoalescingUsersWriter] = None,
+    ) -> None:
+        super().__init__(event_buffer, users_uow, password_hasher, outbox_message_factory)
+        self._writer: Optional[CoalescingUsersWriter] = users_writer
+
     async def __call__(self, command: CreateUserCommand) -> UserEntity:
         """
-        Handler for creating a new user.
+        Handler for creating a new user. If users writer is set, the user is written together with users
+        of concurrent requests.
         """
-        async with self._uow as uow:
-            user_service: UsersService = UsersService(uow=uow)
-
-            new_user: UserEntity = UserEntity(
-                name=UserName(command.name),
-                surname=UserSurname(command.surname),
-                password=Password(hash_password(command.password)),
+        new_user: UserEntity = UserEntity(
+            name=UserName(command.name),
+            surname=UserSurname(command.surname),
+            password=Password(await self._hasher.hash_password(command.password)),
+        )
+
+        event: UserCreateEvent = UserCreateEvent(
+            oid=new_user.oid,
+            name=new_user.name.as_generic_type(),
+            surname=new_user.surname.as_generic_type(),
+        )
+
+        if self._writer is not None:
+            # Writer commits batches by itself, so it's called outside of unit of work of the handler
+            added_user: UserEntity = await self._writer.add(
+                new_user,
+                outbox_messages=[self._outbox_factory.create(event)],
             )
-
-            added_user: UserEntity = await user_service.add(new_user)
-
-            self._event_buffer.add(
-                UserCreateEvent(
-                    oid=added_user.oid,
-                    name=added_user.name.as_generic_type(),
-                    surname=added_user.surname.as_generic_type(),
+        else:
+            async with self._uow as uow:
+                added_user: UserEntity = await UsersService(uow=uow).add(
+                    new_user,
+                    outbox_messages=[self._outbox_factory.create(event)],
                 )
-            )
 
-            return added_user
+        self._event_buffer.add(event)
+
+        return added_user
 
 
 class UpdateUserCommandHandler(UsersCommandHandler[UpdateUserCommand]):
     async def __call__(self, command: UpdateUserCommand) -> UserEntity:
         """
         Updates a user, if user with provided credentials exist, and updates event signaling that
-        operation was successfully executed. In other case raises BookNotExistsException.
+        operation was successfully executed. In other case raises UserNotFoundError.
+        Existence is checked before hashing of password, so requests of unknown users don't load hashing pool.
+        The update statement checks it again, in case the user was deleted in between.
         :param command: command to execute which must be linked in app/logic/handlers/__init__
         :return: domain entity of the updated book
         """
+        name: UserName = UserName(command.name)
+        surname: UserSurname = UserSurname(command.surname)
+
+        if await UsersService(uow=self._uow).get_read_model(command.oid) is None:
+            raise UserNotFoundError(f"Couldn't find user {command.oid}")
+
+        # Password is hashed outside of transaction, so it doesn't hold connection for the time of hashing
+        password: Password = Password(await self._hasher.hash_password(command.password))
+
         async with self._uow as uow:
             user_service: UsersService = UsersService(uow=uow)
 
-            if not await user_service.check_existence(oid=command.oid):
-                raise UserNotFoundError(command.oid)
+            updated_user: UserEntity = UserEntity(oid=command.oid, name=name, surname=surname, password=password)
+
+            event: UserUpdateEvent = UserUpdateEvent(
+                oid=updated_user.oid,
+                name=updated_user.name.as_generic_type(),
+                surname=updated_user.surname.as_generic_type(),
+            )
+
+            updated_user: UserEntity = await user_service.update(
+                updated_user,
+                outbox_messages=[self._outbox_factory.create(event)],
+            )
+
+            self._event_buffer.add(event)
 
-            user: UserEntity = await user_service.get_by_id(command.oid)
+            return updated_user
+
+
+class UpsertUserCommandHandler(UsersCommandHandler[UpsertUserCommand]):
+    async def __call__(self, command: UpsertUserCommand) -> UserEntity:
+        """
+        Creates or replaces a user by one INSERT ... ON CONFLICT DO UPDATE statement. Emits create event, if the user
+        was inserted, and update event otherwise. Outbox message is written in the same transaction, since the kind
+        of event is known only after the statement.
+        """
+        async with self._uow as uow:
+            user_service: UsersService = UsersService(uow=uow)
 
-            updated_user: UserEntity = UserEntity(
-                oid=user.oid,
+            new_user: UserEntity = UserEntity(
+                oid=command.oid,
                 name=UserName(command.name),
                 surname=UserSurname(command.surname),
-                password=Password(hash_password(command.password)),
-                created_at=user.created_at,
+                password=Password(await self._hasher.hash_password(command.password)),
             )
 
-            updated_user: UserEntity = await user_service.update(updated_user)
+            stored_user, created = await user_service.upsert(new_user)
 
-            self._event_buffer.add(
-                UserUpdateEvent(
-                    oid=updated_user.oid,
-                    name=updated_user.name.as_generic_type(),
-                    surname=updated_user.surname.as_generic_type(),
-                )
+            event_type: type[UserCreateEvent | UserUpdateEvent] = UserCreateEvent if created else UserUpdateEvent
+            event: UserCreateEvent | UserUpdateEvent = event_type(
+                oid=stored_user.oid,
+                name=stored_user.name.as_generic_type(),
+                surname=stored_user.surname.as_generic_type(),
             )
 
-            return updated_user
+            await uow.outbox.add([self._outbox_factory.create(event)])
+            await uow.commit()
+
+        self._event_buffer.add(event)
+
+        return stored_user
 
 
 class DeleteUserCommandHandler(UsersCommandHandler[DeleteUserCommand]):
-    async def __call__(self, command: UpdateUserCommand) -> None:
+    async def __call__(self, command: DeleteUserCommand) -> None:
+        """
+        Deletes a user by one statement, raises UserNotFoundError if there is no such user.
+        """
         async with self._uow as uow:
             user_service: UsersService = UsersService(uow=uow)
 
-            if not await user_service.check_existence(oid=command.oid):
-                raise UserNotFoundError(f"Couldn't find user {command.oid}")
-
-            deleted_user: None = await user_service.delete(oid=command.oid)
+            event: UserDeleteEvent = UserDeleteEvent(user_oid=command.oid)
 
-            self._event_buffer.add(
-                UserDeleteEvent(
-                    user_oid=command.oid,
-                )
+            deleted_user: None = await user_service.delete(
+                oid=command.oid,
+                outbox_messages=[self._outbox_factory.create(event)],
             )
 
+            self._event_buffer.add(event)
+
             return deleted_user
+
+
+class ImportUsersCommandHandler(UsersCommandHandler[ImportUsersCommand]):
+    async def __call__(self, command: ImportUsersCommand) -> dict[int, str]:
+        """
+        Creates a chunk of users by one bulk load and one event. Passwords are hashed in parallel.
+        If the chunk couldn't be saved, all its valid rows are reported as errors, so import goes on with next chunks.
+        :param command: command with rows of the chunk
+        :return: errors of invalid rows by their index in the command, valid rows are created
+        """
+        errors: dict[int, str] = {}
+        valid_indexes: list[int] = []
+        valid_rows: list[tuple[UserName, UserSurname, str]] = []
+
+        for index, row in enumerate(command.users):
+            try:
+                valid_rows.append((UserName(row.name), UserSurname(row.surname), row.password))
+                valid_indexes.append(index)
+            except BaseDomainError as error:  # noqa: PERF203
+                errors[index] = error.message
+
+        if not valid_rows:
+            return errors
+
+        hashed_passwords: list[bytes] = await self._hasher.hash_passwords([password for *_, password in valid_rows])
+
+        new_users: list[UserEntity] = [
+            UserEntity(name=name, surname=surname, password=Password(hashed_password))
+            for (name, surname, _), hashed_password in zip(valid_rows, hashed_passwords, strict=True)
+        ]
+
+        event: UsersImportEvent = UsersImportEvent(
+            users=tuple(
+                UserCreateEvent(oid=user.oid, name=user.name.as_generic_type(), surname=user.surname.as_generic_type())
+                for user in new_users
+            )
+        )
+
+        try:
+            async with self._uow as uow:
+                await UsersService(uow=uow).add_many(
+                    new_users, outbox_messages=self._outbox_factory.create_batch(event)
+                )
+        except Exception as e:
+            logger.exception("Chunk of %s imported users couldn't be saved", len(new_users))
+            errors.update(dict.fromkeys(valid_indexes, f"Couldn't save chunk of rows: {type(e).__name__}"))
+            return errors
+
+        self._event_buffer.add(event)
+
+        return errors
+
+
+class DeleteUsersCommandHandler(UsersCommandHandler[DeleteUsersCommand]):
+    async def __call__(self, command: DeleteUsersCommand) -> list[UUID]:
+        """
+        Deletes users by one DELETE ... RETURNING statement and emits one event for all deleted users.
+        Unknown oids are skipped.
+        :return: oids of deleted users
+        """
+        async with self._uow as uow:
+            deleted_oids: list[UUID] = await UsersService(uow=uow).delete_many(command.oids)
+
+            if not deleted_oids:
+                return deleted_oids
+
+            event: UsersDeleteEvent = UsersDeleteEvent(user_oids=tuple(deleted_oids))
+
+            await uow.outbox.add(self._outbox_factory.create_batch(event))
+            await uow.commit()
+
+        self._event_buffer.add(event)
+
+        return deleted_oids
@@ -1,33 +1,39 @@
-from app.infrastructure.brokers.schemas.users import UserCreateSchema, UserDeleteSchema, UserUpdateSchema
-from app.logic.events.users import UserCreateEvent, UserDeleteEvent, UserUpdateEvent
-from app.logic.handlers.users.base import UsersEventHandler
+from app.logic.events.users import (
+    UserCreateEvent,
+    UserDeleteEvent,
+    UsersDeleteEvent,
+    UsersImportEvent,
+    UserUpdateEvent,
+)
+from app.logic.handlers.users.base import UsersCacheEventHandler
 
 
-class UserDeleteEventHandler(UsersEventHandler):
-    async def __call__(self, event: UserDeleteEvent) -> None:
-        topic: str = self._factory.get_topic(self.__class__)
+class UserCreateCacheEventHandler(UsersCacheEventHandler[UserCreateEvent]):
+    """
+    Drops negative entry of the created user, if its id was requested before creation.
+    """
 
-        await self._broker.send_message(
-            topic=topic,
-            value=UserDeleteSchema(oid=event.user_oid),
-        )
+    async def __call__(self, event: UserCreateEvent) -> None:
+        self._cache.invalidate(event.oid)
 
 
-class UserCreateEventHandler(UsersEventHandler):
-    async def __call__(self, event: UserCreateEvent) -> None:
-        topic: str = self._factory.get_topic(self.__class__)
+class UserUpdateCacheEventHandler(UsersCacheEventHandler[UserUpdateEvent]):
+    async def __call__(self, event: UserUpdateEvent) -> None:
+        self._cache.invalidate(event.oid)
 
-        await self._broker.send_message(
-            topic=topic,
-            value=UserCreateSchema(oid=event.oid, name=event.name, surname=event.surname),
-        )
 
+class UserDeleteCacheEventHandler(UsersCacheEventHandler[UserDeleteEvent]):
+    async def __call__(self, event: UserDeleteEvent) -> None:
+        self._cache.invalidate(event.user_oid)
+
+
+class UsersImportCacheEventHandler(UsersCacheEventHandler[UsersImportEvent]):
+    async def __call__(self, event: UsersImportEvent) -> None:
+        for user in event.users:
+            self._cache.invalidate(user.oid)
 
-class UserUpdateEventHandler(UsersEventHandler):
-    async def __call__(self, event: UserUpdateEvent) -> None:
-        topic: str = self._factory.get_topic(self.__class__)
 
-        await self._broker.send_message(
-            topic=topic,
-            value=UserUpdateSchema(oid=event.oid, name=event.name, surname=event.surname),
-        )
+class UsersDeleteCacheEventHandler(UsersCacheEventHandler[UsersDeleteEvent]):
+    async def __call__(self, event: UsersDeleteEvent) -> None:
+        for oid in event.user_oids:
+            self._cache.invalidate(oid)
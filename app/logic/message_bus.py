@@ -1,10 +1,17 @@
-from queue import Queue
+import asyncio
+import logging
+import time
+from asyncio import Queue
+from dataclasses import dataclass, field
 from typing import (
     Any,
+    Final,
+    Optional,
     Union,
 )
 
 from app.exceptions.logic import MessageBusMessageError
+from app.infrastructure.metrics.base import LatencyHistogram
 from app.logic.commands.base import AbstractCommand
 from app.logic.event_buffer import EventBuffer
 from app.logic.events.base import AbstractEvent
@@ -13,45 +20,145 @@ from app.logic.handlers.base import (
     AbstractEventHandler,
 )
 
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+@dataclass
+class MessageBusMetrics:
+    handler_latency: dict[str, LatencyHistogram] = field(default_factory=dict)
+    handler_failures: dict[str, int] = field(default_factory=dict)
+    handler_timeouts: dict[str, int] = field(default_factory=dict)
+
+    def observe(self, handler: str, seconds: float) -> None:
+        if (histogram := self.handler_latency.get(handler)) is None:
+            histogram = self.handler_latency[handler] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "handler_latency": {handler: value.as_dict() for handler, value in self.handler_latency.items()},
+            "handler_failures": dict(self.handler_failures),
+            "handler_timeouts": dict(self.handler_timeouts),
+        }
+
 
 class MessageBus:
+    """
+    Dispatches commands and events to injected handlers. Handlers are shared, while queue and event buffer
+    are created per call of handle(), so one bus instance may serve concurrent dispatches.
+
+    By default handlers of one event are awaited one after another without timeout and their errors are propagated.
+    With concurrent_event_handlers they run together (at most max_concurrency at once), each under its own timeout,
+    and a failed or timed out handler is only logged, so it can't hold back or break the others.
+    """
+
     def __init__(
         self,
         event_buffer: EventBuffer,
         event_handlers: dict[type[AbstractEvent], list[AbstractEventHandler[AbstractEvent]]],
         command_handlers: dict[type[AbstractCommand], AbstractCommandHandler[AbstractCommand]],
+        concurrent_event_handlers: bool = False,
+        max_concurrency: int = 8,
+        handler_timeout: Optional[float] = None,
+        metrics: Optional[MessageBusMetrics] = None,
     ) -> None:
         self._event_buffer = event_buffer
         self._event_handlers = event_handlers
         self._command_handlers = command_handlers
-        self._queue: Queue[Union[AbstractEvent, AbstractCommand]] = Queue()
-        self._command_result: Any = None
-
-    async def handle(self, message: Union[AbstractEvent, AbstractCommand]) -> None:
-        self._queue.put(message)
-        while not self._queue.empty():
-            message = self._queue.get()
-            if isinstance(message, AbstractEvent):
-                await self._handle_event(event=message)
-            elif isinstance(message, AbstractCommand):
-                await self._handle_command(command=message)
-            else:
-                raise MessageBusMessageError(
-                    "Please configure BootStrap for injection in IoC, there are missing some commands or events"
-                )
+        self._concurrent_event_handlers = concurrent_event_handlers
+        self._max_concurrency = max_concurrency
+        self._handler_timeout = handler_timeout
+        self._metrics = metrics if metrics is not None else MessageBusMetrics()
+
+    async def handle(self, message: Union[AbstractEvent, AbstractCommand]) -> Any:
+        """
+        Handles message and all events raised during its handling.
+        :return: result of command handler if message is command, None otherwise
+        """
+        queue: Queue[Union[AbstractEvent, AbstractCommand]] = Queue()
+        queue.put_nowait(message)
+        result: Any = None
+
+        with self._event_buffer.dispatch():
+            while not queue.empty():
+                current: Union[AbstractEvent, AbstractCommand] = queue.get_nowait()
+                if isinstance(current, AbstractEvent):
+                    await self._handle_event(event=current, queue=queue)
+                elif isinstance(current, AbstractCommand):
+                    command_result: Any = await self._handle_command(command=current, queue=queue)
+                    if current is message:
+                        result = command_result
+                else:
+                    raise MessageBusMessageError(
+                        "Please configure BootStrap for injection in IoC, there are missing some commands or events"
+                    )
+
+        return result
+
+    async def _handle_event(self, event: AbstractEvent, queue: Queue[Union[AbstractEvent, AbstractCommand]]) -> None:
+        handlers: list[AbstractEventHandler[AbstractEvent]] = self._event_handlers[type(event)]
+
+        if self._concurrent_event_handlers and len(handlers) > 1:
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(self._max_concurrency)
+            await asyncio.gather(*(self._run_isolated(handler, event, semaphore) for handler in handlers))
+            self._collect_events(queue)
+            return
 
-    async def _handle_event(self, event: AbstractEvent) -> None:
-        for handler in self._event_handlers[type(event)]:
-            await handler(event)
-            for event in self._event_buffer.get_events():
-                self._queue.put_nowait(event)
+        for handler in handlers:
+            if self._concurrent_event_handlers:
+                await self._run_isolated(handler, event)
+            else:
+                await self._run(handler, event)
+            self._collect_events(queue)
 
-    async def _handle_command(self, command: AbstractCommand) -> None:
+    async def _handle_command(
+        self,
+        command: AbstractCommand,
+        queue: Queue[Union[AbstractEvent, AbstractCommand]],
+    ) -> Any:
         handler: AbstractCommandHandler[AbstractCommand] = self._command_handlers[type(command)]
-        self._command_result = await handler(command)
-        for event in self._event_buffer.get_events():
-            self._queue.put_nowait(event)
+        result: Any = await handler(command)
+        self._collect_events(queue)
+        return result
+
+    async def _run(
+        self,
+        handler: AbstractEventHandler[AbstractEvent],
+        event: AbstractEvent,
+        timeout: Optional[float] = None,
+    ) -> None:
+        started: float = time.perf_counter()
+        try:
+            if timeout is None:
+                await handler(event)
+            else:
+                await asyncio.wait_for(handler(event), timeout=timeout)
+        finally:
+            self._metrics.observe(type(handler).__name__, time.perf_counter() - started)
 
-    @property
-    def command_result(self) -> Any:
-        return self._command_result
+    async def _run_isolated(
+        self,
+        handler: AbstractEventHandler[AbstractEvent],
+        event: AbstractEvent,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> None:
+        name: str = type(handler).__name__
+        try:
+            if semaphore is None:
+                await self._run(handler, event, self._timeout_for(handler))
+            else:
+                async with semaphore:
+                    await self._run(handler, event, self._timeout_for(handler))
+        except TimeoutError:
+            self._metrics.handler_timeouts[name] = self._metrics.handler_timeouts.get(name, 0) + 1
+            logger.error("Event handler %s timed out on event %s", name, event)
+        except Exception:
+            self._metrics.handler_failures[name] = self._metrics.handler_failures.get(name, 0) + 1
+            logger.exception("Event handler %s failed on event %s", name, event)
+
+    def _timeout_for(self, handler: AbstractEventHandler[AbstractEvent]) -> Optional[float]:
+        return handler.timeout if handler.timeout is not None else self._handler_timeout
+
+    def _collect_events(self, queue: Queue[Union[AbstractEvent, AbstractCommand]]) -> None:
+        for event in self._event_buffer.get_events():
+            queue.put_nowait(event)
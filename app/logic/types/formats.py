@@ -0,0 +1,16 @@
+from enum import StrEnum
+
+
+class DataFormat(StrEnum):
+    """
+    Formats of bulk export and import of users.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        if self is DataFormat.CSV:
+            return "text/csv"
+        return "application/x-ndjson"
@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any, NamedTuple
+from uuid import UUID
+
+
+def _to_primitive(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+async def encode_ndjson(rows: AsyncGenerator[NamedTuple, None], chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    Encodes rows to JSON lines, joining chunk_size of them into one chunk for sending.
+    Rows are closed, when encoding is closed, so database cursor is released in the same task.
+    """
+    lines: list[str] = []
+
+    async with aclosing(rows):
+        async for row in rows:
+            lines.append(json.dumps({field: _to_primitive(value) for field, value in zip(row._fields, row)}))
+
+            if len(lines) >= chunk_size:
+                yield ("\n".join(lines) + "\n").encode()
+                lines.clear()
+
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def encode_csv(
+    rows: AsyncGenerator[NamedTuple, None], fields: Sequence[str], chunk_size: int
+) -> AsyncIterator[bytes]:
+    """
+    Encodes rows to CSV with header, joining chunk_size of them into one chunk for sending.
+    """
+    buffer: io.StringIO = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    written: int = 0
+
+    async with aclosing(rows):
+        async for row in rows:
+            writer.writerow([_to_primitive(value) for value in row])
+            written += 1
+
+            if written >= chunk_size:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+                written = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
@@ -0,0 +1,70 @@
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Generic, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    DataLoader-like coalescing of lookups by key. All keys requested in the same event loop tick are loaded
+    by one call of batch_load (by max_batch_size keys at most). Concurrent lookups of the same key share one load
+    (single-flight), cancellation of one caller doesn't cancel the load for others.
+
+    Batches are loaded by tasks with empty context, as they are shared by callers, they must not depend
+    on context variables of the caller, which has started the batch (e.g. key of client for routing).
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        max_batch_size: int = 100,
+    ) -> None:
+        self._batch_load: Callable[[list[K]], Awaitable[Mapping[K, V]]] = batch_load
+        self._max_batch_size: int = max_batch_size
+        self._in_flight: dict[K, asyncio.Future[Optional[V]]] = {}
+        self._queue: list[K] = []
+        self._loads: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """
+        :return: value of key or None, if there is no such key
+        """
+        if (future := self._in_flight.get(key)) is None:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._in_flight[key] = future
+
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+
+            self._queue.append(key)
+
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        keys: list[K] = self._queue
+        self._queue = []
+
+        for start in range(0, len(keys), self._max_batch_size):
+            task: asyncio.Task[None] = asyncio.create_task(
+                self._load_batch(keys[start : start + self._max_batch_size]), context=contextvars.Context()
+            )
+            self._loads.add(task)
+            task.add_done_callback(self._loads.discard)
+
+    async def _load_batch(self, keys: list[K]) -> None:
+        try:
+            values: Mapping[K, V] = await self._batch_load(keys)
+        except Exception as e:
+            for key in keys:
+                future: asyncio.Future[Optional[V]] = self._in_flight.pop(key)
+                future.set_exception(e)
+                # Error is retrieved, so it isn't logged as never retrieved, if all callers were cancelled
+                future.exception()
+            return
+
+        for key in keys:
+            self._in_flight.pop(key).set_result(values.get(key))
@@ -0,0 +1,42 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, Optional, Self, TypeVar
+from uuid import UUID
+
+from app.exceptions.logic import InvalidCursorError
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Position in keyset pagination. For clients it's an opaque url-safe token.
+    """
+
+    created_at: datetime
+    oid: UUID
+
+    def encode(self) -> str:
+        raw: bytes = json.dumps({"c": self.created_at.isoformat(), "o": str(self.oid)}, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        try:
+            data: dict[str, str] = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            return cls(created_at=datetime.fromisoformat(data["c"]), oid=UUID(str(data["o"])))
+        except (binascii.Error, ValueError, KeyError, TypeError) as e:
+            raise InvalidCursorError(f"Invalid cursor: {token}") from e
+
+    def as_key(self) -> tuple[datetime, UUID]:
+        return self.created_at, self.oid
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
@@ -1,25 +1,173 @@
-from app.domain.entities.user import UserEntity
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
+
+from app.exceptions.infrastructure import UserNotFoundError
+from app.exceptions.logic import TooManyIdsError
+from app.infrastructure.adapters.alchemy.routing import ReadYourWrites
+from app.infrastructure.cache.users import UsersCache
+from app.infrastructure.repositories.users.base import UserReadModel
 from app.infrastructure.services.users import UsersService
 from app.infrastructure.uow.users.base import UsersUnitOfWork
+from app.logic.types.formats import DataFormat
+from app.logic.views.export import encode_csv, encode_ndjson
+from app.logic.views.loader import BatchLoader
+from app.logic.views.pagination import Cursor, Page
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 
 class UsersViews:
     """
     Views related to users, which purpose is to return information upon read requests,
     due to the fact that write requests (represented by commands) are different from read requests.
+    Users are read by Core selects into read models, without password, ORM identity map and value objects.
     """
 
-    def __init__(self, uow: UsersUnitOfWork) -> None:
+    def __init__(
+        self,
+        uow: UsersUnitOfWork,
+        max_page_size: int = 100,
+        cache: Optional[UsersCache] = None,
+        export_fetch_size: int = 1000,
+        read_your_writes: Optional[ReadYourWrites] = None,
+        max_cache_ttl: Optional[float] = None,
+    ) -> None:
         self._uow: UsersUnitOfWork = uow
+        self._max_page_size: int = max_page_size
+        self._cache: Optional[UsersCache] = cache
+        self._export_fetch_size: int = export_fetch_size
+        self._read_your_writes: Optional[ReadYourWrites] = read_your_writes
+        self._max_cache_ttl: Optional[float] = max_cache_ttl
+        self._loader: BatchLoader[tuple[UUID, int], UserReadModel] = BatchLoader(
+            self._load_users_of_generation, max_batch_size=max_page_size
+        )
+
+    async def get_user_by_id(self, user_id: UUID) -> UserReadModel:
+        """
+        Read-through lookup, if cache is set. Missing users are cached too, so repeated 404 don't hit database.
+        Lookups from concurrent requests are coalesced by loader into one query.
+        Loads are shared only by lookups of the same generation of the user in cache, so a lookup after invalidation
+        doesn't join a load, which has started before it, and stale user isn't cached under the new generation.
+
+        Client pinned to primary by read-your-writes reads by its own query, as cache and shared loads may have
+        users read from a lagging replica. Such users are cached at most for max_cache_ttl, so they don't stay
+        stale (or missing, if they have just been created) for the whole TTL of cache.
+        """
+        if self._is_pinned():
+            pinned_user: Optional[UserReadModel] = (await self._load_users([user_id])).get(user_id)
+
+            if pinned_user is None:
+                raise UserNotFoundError(str(user_id))
+
+            return pinned_user
+
+        if self._cache is not None:
+            found, cached = self._cache.get(user_id)
+
+            if found and cached is None:
+                raise UserNotFoundError(str(user_id))
+
+            if cached is not None:
+                return cached
+
+        generation: int = self._cache.generation(user_id) if self._cache is not None else 0
+        user: Optional[UserReadModel] = await self._loader.load((user_id, generation))
+
+        if self._cache is not None:
+            self._cache.set(user_id, user, generation, self._max_cache_ttl)
+
+        if user is None:
+            raise UserNotFoundError(str(user_id))
 
-    async def get_user_by_id(self, user_id: str) -> UserEntity:
-        users_service: UsersService = UsersService(self._uow)
-        user: UserEntity = await users_service.get_by_id(user_id)
         return user
 
-    async def get_all_users(self, page_number: int = 1, page_size: int = 10) -> list[UserEntity]:
+    async def get_users_by_ids(self, user_ids: Sequence[UUID]) -> list[UserReadModel]:
+        """
+        Returns found users in order of provided ids by one query, users from cache are not queried.
+        Missing users are skipped. Cache isn't used for client pinned to primary by read-your-writes.
+        """
+        unique_ids: list[UUID] = list(dict.fromkeys(user_ids))
+
+        if len(unique_ids) > self._max_page_size:
+            raise TooManyIdsError(f"Please request at most {self._max_page_size} users at once")
+
+        if self._is_pinned():
+            pinned_users: dict[UUID, UserReadModel] = await self._load_users(unique_ids)
+            return [user for user_id in unique_ids if (user := pinned_users.get(user_id)) is not None]
+
+        users: dict[UUID, Optional[UserReadModel]] = {}
+        missed_ids: list[UUID] = []
+
+        for user_id in unique_ids:
+            found, cached = self._cache.get(user_id) if self._cache is not None else (False, None)
+
+            if found:
+                users[user_id] = cached
+            else:
+                missed_ids.append(user_id)
+
+        if missed_ids:
+            generations: dict[UUID, int] = (
+                {user_id: self._cache.generation(user_id) for user_id in missed_ids} if self._cache is not None else {}
+            )
+            loaded_users: dict[UUID, UserReadModel] = await self._load_users(missed_ids)
+
+            for user_id in missed_ids:
+                users[user_id] = loaded_users.get(user_id)
+
+                if self._cache is not None:
+                    self._cache.set(user_id, users[user_id], generations[user_id], self._max_cache_ttl)
+
+        return [user for user_id in unique_ids if (user := users[user_id]) is not None]
+
+    def _is_pinned(self) -> bool:
+        return self._read_your_writes is not None and self._read_your_writes.is_pinned()
+
+    async def _load_users_of_generation(self, keys: list[tuple[UUID, int]]) -> dict[tuple[UUID, int], UserReadModel]:
+        users: dict[UUID, UserReadModel] = await self._load_users(list(dict.fromkeys(user_id for user_id, _ in keys)))
+        return {key: user for key in keys if (user := users.get(key[0])) is not None}
+
+    async def _load_users(self, user_ids: list[UUID]) -> dict[UUID, UserReadModel]:
+        users_service: UsersService = UsersService(self._uow)
+        return {user.oid: user for user in await users_service.get_read_models(user_ids)}
+
+    async def get_all_users(self, page_number: int = 1, page_size: int = 10) -> list[UserReadModel]:
         users_service: UsersService = UsersService(self._uow)
-        start: int = (page_number - 1) * page_size
-        limit: int = start + page_size
-        users: list[UserEntity] = await users_service.get_all(start, limit)
+        limit: int = min(page_size, self._max_page_size)
+        start: int = (page_number - 1) * limit
+        users: list[UserReadModel] = await users_service.get_read_models_page(start, limit)
         return users
+
+    async def get_users_page(self, cursor: Optional[str] = None, page_size: int = 10) -> Page[UserReadModel]:
+        """
+        Keyset pagination over (created_at, oid), it doesn't slow down on deep pages unlike get_all_users.
+        :param cursor: token of the previous page, None for the first page
+        :param page_size: size of the page, limited by max_page_size
+        :return: page of users with token for the next page, if there is one
+        """
+        users_service: UsersService = UsersService(self._uow)
+        limit: int = min(page_size, self._max_page_size)
+        after: Optional[tuple[datetime, UUID]] = Cursor.decode(cursor).as_key() if cursor else None
+
+        users: list[UserReadModel] = await users_service.get_read_models_after(limit=limit + 1, after=after)
+
+        if len(users) <= limit:
+            return Page(items=users)
+
+        users = users[:limit]
+        return Page(items=users, next_cursor=Cursor(created_at=users[-1].created_at, oid=users[-1].oid).encode())
+
+    def export_users(self, export_format: DataFormat) -> AsyncIterator[bytes]:
+        """
+        Streams all users in provided format. Rows are fetched from database by server side cursor
+        only when the previous chunk was consumed, so slow client slows down reading instead of growing memory.
+        """
+        users_service: UsersService = UsersService(self._uow)
+        rows: AsyncGenerator[UserReadModel, None] = users_service.stream(self._export_fetch_size)
+
+        if export_format is DataFormat.CSV:
+            return encode_csv(rows, fields=UserReadModel._fields, chunk_size=self._export_fetch_size)
+
+        return encode_ndjson(rows, chunk_size=self._export_fetch_size)
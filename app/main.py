@@ -13,10 +13,19 @@ from sqlalchemy.orm import clear_mappers
 
 from app.application.api.utils.docs import router as docs_faststream_router
 from app.application.api.utils.exception_handlers import application_error_handler, internal_server_error_handler
+from app.application.api.utils.health import router as health_router
+from app.application.api.utils.metrics import router as metrics_router
+from app.application.api.utils.middlewares import ReadYourWritesMiddleware
 from app.application.api.v1.users.handlers import UserController
+from app.domain.entities.ids import UUID4Generator, UUID7Generator, set_id_generator
 from app.exceptions.base import BaseAppError
 from app.infrastructure.adapters.alchemy.orm import start_mappers
+from app.infrastructure.brokers.consumers.kafka.users import setup_users_cache_consumers
+from app.infrastructure.brokers.publishers.kafka.base import BaseKafkaMessageBrokerPublisher
+from app.infrastructure.outbox.relay import OutboxRelay
+from app.infrastructure.services.warmup import Warmup, WarmupReport
 from app.logic.container import get_container
+from app.settings.configs.app import Settings, get_settings
 from app.settings.logger.config import setup_logging
 
 if TYPE_CHECKING:
@@ -28,16 +37,36 @@ async def lifespan(app: Litestar) -> AsyncGenerator[None, None]:
     container: AsyncContainer = get_container()
     kafka_faststream_broker: KafkaBroker = await container.get(KafkaBroker)
 
+    settings: Settings = await container.get(Settings)
+
     faststream_app: FastStream = FastStream(kafka_faststream_broker)
+    setup_faststream_dishka(container, faststream_app, auto_inject=True)
+
+    if settings.broker_kafka.cache_consumer_enabled:
+        setup_users_cache_consumers(kafka_faststream_broker, settings.broker_kafka)
+
     await faststream_app.start()
 
     start_mappers()
+    set_id_generator(UUID4Generator() if settings.ids.generator == "uuid4" else UUID7Generator())
 
     setup_logging()
-    setup_faststream_dishka(container, faststream_app, auto_inject=True)
+
+    outbox_relay: OutboxRelay = await container.get(OutboxRelay)
+    if settings.outbox.relay_enabled:
+        await outbox_relay.start()
+
+    warmup: Warmup = await container.get(Warmup)
+    if settings.warmup.enabled:
+        await warmup.start()
+    else:
+        (await container.get(WarmupReport)).ready = True
 
     yield
 
+    await warmup.stop()
+    await outbox_relay.stop()
+    await (await container.get(BaseKafkaMessageBrokerPublisher)).flush()
     await faststream_app.stop()
     await container.close()
     clear_mappers()
@@ -46,8 +75,9 @@ async def lifespan(app: Litestar) -> AsyncGenerator[None, None]:
 def create_app() -> Litestar:
     container: AsyncContainer = get_container()
     litestar_app: Litestar = Litestar(
-        route_handlers=[UserController, docs_faststream_router],
+        route_handlers=[UserController, docs_faststream_router, metrics_router, health_router],
         lifespan=[lifespan],
+        middleware=[ReadYourWritesMiddleware(cookie=get_settings().replicas.cookie)],
         openapi_config=OpenAPIConfig(
             title="Users service API",
             description="This is the description of users service API",
@@ -0,0 +1,91 @@
+"""
+Helpers of benchmarks. Benchmarks run against a temporary SQLite database, so they measure the Python side
+(SQLAlchemy, mapping, serialization), which is the same for every database.
+"""
+
+import asyncio
+import statistics
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from uuid import UUID
+
+import bcrypt
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import clear_mappers
+
+from app.domain.entities.user import UserEntity
+from app.domain.values.user import Password, UserName, UserSurname
+from app.infrastructure.adapters.alchemy.orm import metadata, start_mappers
+from app.infrastructure.repositories.users.alchemy import SQLAlchemyUsersRepository
+
+
+@asynccontextmanager
+async def temporary_database() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """
+    Creates temporary database with schema of application and maps domain models.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        engine: AsyncEngine = create_async_engine(f"sqlite+aiosqlite:///{Path(directory) / 'benchmark.db'}")
+        start_mappers()
+
+        try:
+            async with engine.begin() as connection:
+                await connection.run_sync(metadata.create_all)
+
+            yield async_sessionmaker(bind=engine, expire_on_commit=False)
+        finally:
+            clear_mappers()
+            await engine.dispose()
+
+
+def create_users(users: int) -> list[UserEntity]:
+    password: Password = Password(bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=4)))
+    return [
+        UserEntity(name=UserName(f"Name{index}"), surname=UserSurname(f"Surname{index}"), password=password)
+        for index in range(users)
+    ]
+
+
+@asynccontextmanager
+async def users_database(users: int) -> AsyncIterator[tuple[async_sessionmaker[AsyncSession], list[UUID]]]:
+    """
+    Creates temporary database with provided number of users.
+    :return: session maker and oids of users in order of creation
+    """
+    async with temporary_database() as session_maker:
+        models: list[UserEntity] = create_users(users)
+
+        async with session_maker() as session:
+            await SQLAlchemyUsersRepository(session=session).add_many(models)
+            await session.commit()
+
+        yield session_maker, [model.oid for model in models]
+
+
+async def measure(name: str, run: Callable[[], Awaitable[object]], repeat: int = 200, warmup: int = 10) -> float:
+    """
+    Runs coroutine function repeat times after warmup runs and prints median and p95 latency.
+    :return: median latency in seconds
+    """
+    for _ in range(warmup):
+        await run()
+
+    timings: list[float] = []
+
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        await run()
+        timings.append(time.perf_counter() - started)
+
+    timings.sort()
+    median: float = statistics.median(timings)
+    p95: float = timings[int(len(timings) * 0.95) - 1]
+    print(f"{name:<48} median {median * 1e6:>10.1f} us   p95 {p95 * 1e6:>10.1f} us")  # noqa: T201
+    return median
+
+
+def run(main: Callable[[], Awaitable[None]]) -> None:
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+"""
+Measures memory and allocations of materializing users: building entities with value objects as they were
+(dataclasses with __dict__) and as they are (frozen and slotted), then loading users by ORM.
+
+Run: python -m benchmarks.entity_memory
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Final
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.user import UserEntity
+from app.domain.values.user import Password, UserName, UserSurname
+from benchmarks.common import run, users_database
+
+USERS: Final[int] = 100_000
+PASSWORD: Final[bytes] = b"$2b$04$" + b"x" * 53
+
+
+@dataclass
+class DictUserName:
+    """
+    Value object as it was, validated on creation and stored with __dict__.
+    """
+
+    value: str
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.value, str) or self.value.isspace() or not self.value or self.value.isdigit():
+            raise ValueError(self.value)
+
+
+@dataclass
+class DictUserSurname(DictUserName): ...
+
+
+@dataclass
+class DictPassword:
+    value: bytes
+
+    def __post_init__(self) -> None:
+        if not self.value:
+            raise ValueError(self.value)
+
+
+def report(name: str, build: Callable[[], Any]) -> None:
+    """
+    Prints memory and number of memory blocks, which are kept by built objects, per user.
+    """
+    tracemalloc.start()
+    started: float = time.perf_counter()
+
+    try:
+        objects: Any = build()
+        elapsed: float = time.perf_counter() - started
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    statistics: list[tracemalloc.Statistic] = snapshot.statistics("filename")
+    size: int = sum(statistic.size for statistic in statistics)
+    blocks: int = sum(statistic.count for statistic in statistics)
+    print(  # noqa: T201
+        f"{name:<40} {size / 2**20:>8.1f} MiB   {size / USERS:>6.0f} B/user   "
+        f"{blocks / USERS:>5.1f} blocks/user   {elapsed:>6.2f} s (traced)"
+    )
+    del objects
+
+
+def build_with_dict_values() -> list[UserEntity]:
+    return [
+        UserEntity(
+            name=DictUserName(f"Name{index}"),  # type: ignore[arg-type]
+            surname=DictUserSurname(f"Surname{index}"),  # type: ignore[arg-type]
+            password=DictPassword(PASSWORD),  # type: ignore[arg-type]
+        )
+        for index in range(USERS)
+    ]
+
+
+def build_with_slotted_values() -> list[UserEntity]:
+    return [
+        UserEntity(name=UserName(f"Name{index}"), surname=UserSurname(f"Surname{index}"), password=Password(PASSWORD))
+        for index in range(USERS)
+    ]
+
+
+async def load_users(session_maker: async_sessionmaker[AsyncSession]) -> list[UserEntity]:
+    async with session_maker() as session:
+        return list((await session.execute(select(UserEntity))).scalars().all())
+
+
+async def main() -> None:
+    # Entities are built before mapping, so only domain objects are measured
+    report(f"build {USERS} users, dict value objects", build_with_dict_values)
+    report(f"build {USERS} users, slotted value objects", build_with_slotted_values)
+
+    async with users_database(USERS) as (session_maker, _):
+        tracemalloc.start()
+
+        try:
+            started: float = time.perf_counter()
+            users: list[UserEntity] = await load_users(session_maker)
+            elapsed: float = time.perf_counter() - started
+            size, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        print(  # noqa: T201
+            f"{f'load {len(users)} users by ORM':<40} {size / 2**20:>8.1f} MiB   {size / len(users):>6.0f} B/user   "
+            f"peak {peak / 2**20:.1f} MiB   {elapsed:>6.2f} s (traced)"
+        )
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,107 @@
+"""
+Compares serialization of entities, commands and events to dict by generated serializers with the previous
+implementation (async to_dict with dataclasses.asdict, which copies values deeply).
+
+Run: python -m benchmarks.entity_serialization
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from typing import Any, Final
+
+from app.domain.entities.base import BaseEntity
+from app.domain.entities.user import UserEntity
+from app.domain.values.user import Password, UserName, UserSurname
+from app.logic.commands.users import UpdateUserCommand
+from app.logic.events.users import UserCreateEvent
+from benchmarks.common import run
+
+CALLS: Final[int] = 100_000
+
+
+async def previous_entity_to_dict(
+    entity: BaseEntity,
+    exclude: set[str] | None = None,
+    save_classes_value_objects: bool = False,
+) -> dict[str, Any]:
+    if save_classes_value_objects:
+        data: dict[str, Any] = vars(entity)
+    else:
+        data = asdict(entity)
+
+        for key, value in data.items():
+            if isinstance(value, dict) and "value" in value:
+                data[key] = value["value"]
+
+    data.pop("_sa_instance_state", None)
+
+    if exclude:
+        for key in exclude:
+            data.pop(key, None)
+
+    return data
+
+
+async def previous_to_dict(model: Any) -> dict[str, Any]:
+    return asdict(model)
+
+
+async def per_call(calls: int, serialize: Callable[[], Awaitable[object] | object], awaited: bool) -> float:
+    started: float = time.perf_counter()
+
+    if awaited:
+        for _ in range(calls):
+            await serialize()  # type: ignore[misc]
+    else:
+        for _ in range(calls):
+            serialize()
+
+    return (time.perf_counter() - started) / calls
+
+
+async def compare(name: str, previous: Callable[[], Awaitable[object]], current: Callable[[], object]) -> None:
+    previous_time: float = await per_call(CALLS, previous, awaited=True)
+    current_time: float = await per_call(CALLS, current, awaited=False)
+    print(  # noqa: T201
+        f"{name:<40} previous {previous_time * 1e9:>8.0f} ns   current {current_time * 1e9:>8.0f} ns   "
+        f"speedup x{previous_time / current_time:.1f}"
+    )
+
+
+async def main() -> None:
+    user: UserEntity = UserEntity(
+        name=UserName("Ivan"), surname=UserSurname("Ivanov"), password=Password(b"$2b$04$" + b"x" * 53)
+    )
+    command: UpdateUserCommand = UpdateUserCommand(oid=user.oid, surname="Ivanov", name="Ivan", password="password")
+    event: UserCreateEvent = UserCreateEvent(oid=user.oid, surname="Ivanov", name="Ivan")
+
+    await compare(
+        "entity, values of value objects",
+        lambda: previous_entity_to_dict(user),
+        lambda: user.to_dict(),
+    )
+    # As it is used by insert of repository, previous implementation returns dict of entity itself here
+    await compare(
+        "entity, value objects",
+        lambda: previous_entity_to_dict(user, save_classes_value_objects=True),
+        lambda: user.to_dict(save_classes_value_objects=True),
+    )
+    # Previous implementation removes excluded fields from the entity itself, so entity is created for every call
+    await compare(
+        "new entity, value objects, without oid",
+        lambda: previous_entity_to_dict(
+            UserEntity(name=user.name, surname=user.surname, password=user.password),
+            exclude={"oid", "created_at"},
+            save_classes_value_objects=True,
+        ),
+        lambda: UserEntity(name=user.name, surname=user.surname, password=user.password).to_dict(
+            exclude={"oid", "created_at"}, save_classes_value_objects=True
+        ),
+    )
+    await compare("command", lambda: previous_to_dict(command), lambda: command.to_dict())
+    await compare("event", lambda: previous_to_dict(event), lambda: event.to_dict())
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,76 @@
+"""
+Compares inserts of users with random uuid4 oids and time-ordered UUIDv7 oids: throughput of batched inserts,
+while the table grows, and size of indexes of users table afterwards (from dbstat of SQLite).
+
+Run: python -m benchmarks.id_generators
+"""
+
+import time
+from typing import TYPE_CHECKING, Final
+
+from sqlalchemy import Result, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.ids import BaseIdGenerator, UUID4Generator, UUID7Generator, set_id_generator
+from app.infrastructure.repositories.users.alchemy import SQLAlchemyUsersRepository
+from benchmarks.common import create_users, run, temporary_database
+
+if TYPE_CHECKING:
+    from app.domain.entities.user import UserEntity
+
+USERS: Final[int] = 200_000
+BATCH_SIZE: Final[int] = 1_000
+REPORT_EVERY: Final[int] = 50_000
+
+
+async def index_sizes(session_maker: async_sessionmaker[AsyncSession]) -> dict[str, tuple[int, float]]:
+    """
+    :return: number of pages and share of unused bytes in them by index of users table
+    """
+    async with session_maker() as session:
+        result: Result = await session.execute(
+            text(
+                "SELECT name, COUNT(*), 1.0 * SUM(unused) / SUM(pgsize) FROM dbstat "
+                "WHERE name IN (SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'users') "
+                "GROUP BY name ORDER BY name"
+            )
+        )
+        return {name: (pages, unused) for name, pages, unused in result}
+
+
+async def insert_users(name: str, generator: BaseIdGenerator) -> None:
+    set_id_generator(generator)
+
+    async with temporary_database() as session_maker:
+        elapsed: float = 0.0
+
+        for start in range(0, USERS, BATCH_SIZE):
+            models: list[UserEntity] = create_users(BATCH_SIZE)
+            started: float = time.perf_counter()
+
+            async with session_maker() as session:
+                await SQLAlchemyUsersRepository(session=session).add_many(models)
+                await session.commit()
+
+            elapsed += time.perf_counter() - started
+            inserted: int = start + BATCH_SIZE
+
+            if inserted % REPORT_EVERY == 0:
+                print(f"{name:<8} {inserted:>8} users   {inserted / elapsed:>10.0f} rows/s")  # noqa: T201
+
+        for index, (pages, unused) in (await index_sizes(session_maker)).items():
+            print(f"{name:<8} {index:<28} {pages:>8} pages   {unused:>6.1%} unused")  # noqa: T201
+
+    print()  # noqa: T201
+
+
+async def main() -> None:
+    try:
+        await insert_users("uuid4", UUID4Generator())
+        await insert_users("uuid7", UUID7Generator())
+    finally:
+        set_id_generator(UUID7Generator())
+
+
+if __name__ == "__main__":
+    run(main)
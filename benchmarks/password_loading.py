@@ -0,0 +1,61 @@
+"""
+Compares loading of users by ORM with password (as before it was deferred) and without it.
+Measures latency and peak memory of loading one list response.
+
+Run: python -m benchmarks.password_loading
+"""
+
+import tracemalloc
+from typing import Final
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import undefer
+
+from app.domain.entities.user import UserEntity
+from benchmarks.common import measure, run, users_database
+
+USERS: Final[int] = 5_000
+PAGE_SIZES: Final[tuple[int, ...]] = (100, 1000)
+
+
+async def load(session_maker: async_sessionmaker[AsyncSession], limit: int, with_password: bool) -> list[UserEntity]:
+    statement: Select = select(UserEntity).limit(limit)
+
+    if with_password:
+        statement = statement.options(undefer(UserEntity.password))
+
+    async with session_maker() as session:
+        return list((await session.execute(statement)).scalars().all())
+
+
+async def peak_memory(session_maker: async_sessionmaker[AsyncSession], limit: int, with_password: bool) -> int:
+    tracemalloc.start()
+
+    try:
+        await load(session_maker, limit, with_password)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+async def main() -> None:
+    async with users_database(USERS) as (session_maker, _):
+        for limit in PAGE_SIZES:
+            with_password: float = await measure(
+                f"{limit} users with password", lambda limit=limit: load(session_maker, limit, with_password=True)
+            )
+            without_password: float = await measure(
+                f"{limit} users without password", lambda limit=limit: load(session_maker, limit, with_password=False)
+            )
+            memory_with: int = await peak_memory(session_maker, limit, with_password=True)
+            memory_without: int = await peak_memory(session_maker, limit, with_password=False)
+
+            print(  # noqa: T201
+                f"{'':<48} speedup x{with_password / without_password:.2f}, "
+                f"peak memory {memory_with / 1024:.0f} KiB -> {memory_without / 1024:.0f} KiB\n"
+            )
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,47 @@
+"""
+Compares ORM read path (UserEntity with identity map and value objects) with Core read path (UserReadModel)
+of SQLAlchemyUsersRepository.
+
+Run: python -m benchmarks.user_reads
+"""
+
+import random
+from typing import Final
+
+from app.infrastructure.repositories.users.alchemy import SQLAlchemyUsersRepository
+from benchmarks.common import measure, run, users_database
+
+USERS: Final[int] = 5_000
+PAGE_SIZE: Final[int] = 100
+
+
+async def main() -> None:
+    async with users_database(USERS) as (session_maker, oids):
+        pick: random.Random = random.Random(42)
+
+        async def read(method: str, *args: object, **kwargs: object) -> object:
+            async with session_maker() as session:
+                return await getattr(SQLAlchemyUsersRepository(session=session), method)(*args, **kwargs)
+
+        cases: list[tuple[str, str, str, dict[str, object]]] = [
+            ("get by id", "get", "get_read_model", {}),
+            (f"get {PAGE_SIZE} by ids", "get_many", "get_read_models", {}),
+            (f"page of {PAGE_SIZE}, keyset", "list_after", "list_read_models_after", {"limit": PAGE_SIZE}),
+            (f"page of {PAGE_SIZE}, offset", "list", "list_read_models", {"start": 1000, "limit": PAGE_SIZE}),
+        ]
+
+        for title, orm_method, core_method, kwargs in cases:
+            if orm_method == "get":
+                args: tuple[object, ...] = (pick.choice(oids),)
+            elif orm_method == "get_many":
+                args = (pick.sample(oids, PAGE_SIZE),)
+            else:
+                args = ()
+
+            orm: float = await measure(f"ORM  {title}", lambda m=orm_method, a=args, k=kwargs: read(m, *a, **k))
+            core: float = await measure(f"Core {title}", lambda m=core_method, a=args, k=kwargs: read(m, *a, **k))
+            print(f"{'':<48} speedup x{orm / core:.2f}\n")  # noqa: T201
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,86 @@
+"""
+Compares reading of users with oids as strings (as before: UUID column converted to string by type decorator,
+then parsed and validated back by response schema) and with native UUID oids, which are parsed once
+by the driver and formatted once by JSON encoding of response.
+
+Run: python -m benchmarks.uuid_oids
+"""
+
+import uuid
+from typing import Annotated, Any, Final
+
+from pydantic import UUID4, AfterValidator, BaseModel, Field, TypeAdapter
+from sqlalchemy import ColumnElement, Select, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.api.v1.users.schemas import UserSchemaResponse
+from app.infrastructure.adapters.alchemy.orm import users_table
+from app.infrastructure.adapters.alchemy.type_decorators import StringUUID
+from app.infrastructure.repositories.users.alchemy import READ_MODEL_COLUMNS
+from app.infrastructure.repositories.users.base import UserReadModel
+from benchmarks.common import measure, run, users_database
+
+USERS: Final[int] = 5_000
+PAGE_SIZES: Final[tuple[int, ...]] = (100, 1000)
+
+STRING_OID_COLUMNS: Final[tuple[ColumnElement[Any], ...]] = (
+    type_coerce(users_table.c.oid, StringUUID()).label("oid"),
+    *READ_MODEL_COLUMNS[1:],
+)
+
+
+class StringOidUserSchemaResponse(BaseModel):
+    """
+    Response schema as it was with string oids.
+    """
+
+    oid: UUID4 | Annotated[str, AfterValidator(lambda x: uuid.UUID(x, version=4))] = Field(...)
+    name: str = Field(min_length=1, max_length=40)
+    surname: str = Field(min_length=1, max_length=40)
+
+
+STRING_OID_ADAPTER: Final[TypeAdapter[list[StringOidUserSchemaResponse]]] = TypeAdapter(
+    list[StringOidUserSchemaResponse]
+)
+UUID_OID_ADAPTER: Final[TypeAdapter[list[UserSchemaResponse]]] = TypeAdapter(list[UserSchemaResponse])
+
+
+async def select_rows(
+    session_maker: async_sessionmaker[AsyncSession], columns: tuple[ColumnElement[Any], ...], limit: int
+) -> list[UserReadModel]:
+    statement: Select = select(*columns).order_by(users_table.c.created_at, users_table.c.oid).limit(limit)
+
+    async with session_maker() as session:
+        return [UserReadModel._make(row) for row in await session.execute(statement)]
+
+
+async def respond_with_string_oids(session_maker: async_sessionmaker[AsyncSession], limit: int) -> bytes:
+    users: list[UserReadModel] = await select_rows(session_maker, STRING_OID_COLUMNS, limit)
+    return STRING_OID_ADAPTER.dump_json(
+        [StringOidUserSchemaResponse(oid=user.oid, name=user.name, surname=user.surname) for user in users]
+    )
+
+
+async def respond_with_uuid_oids(session_maker: async_sessionmaker[AsyncSession], limit: int) -> bytes:
+    users: list[UserReadModel] = await select_rows(session_maker, READ_MODEL_COLUMNS, limit)
+    return UUID_OID_ADAPTER.dump_json([UserSchemaResponse.from_read_model(user) for user in users])
+
+
+async def main() -> None:
+    async with users_database(USERS) as (session_maker, _):
+        for limit in PAGE_SIZES:
+            string_oids: float = await measure(
+                f"{limit} users, string oids", lambda limit=limit: respond_with_string_oids(session_maker, limit)
+            )
+            uuid_oids: float = await measure(
+                f"{limit} users, uuid oids", lambda limit=limit: respond_with_uuid_oids(session_maker, limit)
+            )
+
+            print(  # noqa: T201
+                f"{'':<48} speedup x{string_oids / uuid_oids:.2f}, "
+                f"saving {(string_oids - uuid_oids) / limit * 1e6:.2f} us per row\n"
+            )
+
+
+if __name__ == "__main__":
+    run(main)
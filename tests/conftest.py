@@ -0,0 +1,76 @@
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable
+from pathlib import Path
+
+import pytest
+
+# Settings are read on import of application modules, unit tests don't connect to these services
+for name, value in {
+    "DATABASE_NAME": ":memory:",
+    "DATABASE_DIALECT": "sqlite",
+    "DATABASE_DRIVER": "aiosqlite",
+    "DATABASE_POOL_PRE_PING": "false",
+    "DATABASE_POOL_RECYCLE": "3600",
+    "DATABASE_ECHO": "false",
+    "DATABASE_AUTO_FLUSH": "false",
+    "DATABASE_EXPIRE_ON_COMMIT": "false",
+    "BROKER_HOST": "localhost",
+    "BROKER_PORT_NETWORK": "9092",
+}.items():
+    os.environ.setdefault(name, value)
+
+from sqlalchemy import func, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import clear_mappers  # noqa: E402
+
+from app.domain.entities.user import UserEntity  # noqa: E402
+from app.domain.values.user import Password, UserName, UserSurname  # noqa: E402
+from app.infrastructure.adapters.alchemy.orm import metadata, start_mappers, users_table  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def session_maker(tmp_path: Path) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """
+    Session maker of a new SQLite database with schema of application, domain models are mapped meanwhile.
+    """
+    engine: AsyncEngine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    start_mappers()
+
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(metadata.create_all)
+
+        yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    finally:
+        clear_mappers()
+        await engine.dispose()
+
+
+@pytest.fixture
+def create_user() -> Callable[..., UserEntity]:
+    """
+    Factory of new users, which differ by identifier and given name.
+    """
+
+    def create(name: str = "Ivan") -> UserEntity:
+        return UserEntity(name=UserName(name), surname=UserSurname("Ivanov"), password=Password(b"hash"))
+
+    return create
+
+
+@pytest.fixture
+def count_users(session_maker: async_sessionmaker[AsyncSession]) -> Callable[[], Awaitable[int]]:
+    """
+    Counter of users committed to the database of session maker.
+    """
+
+    async def count() -> int:
+        async with session_maker() as session:
+            return (await session.execute(select(func.count()).select_from(users_table))).scalar_one()
+
+    return count
@@ -0,0 +1,97 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.infrastructure.brokers.publishers.kafka.faststream import BatchingFastStreamKafkaMessageBroker
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingBatchPublisher:
+    def __init__(self, gate: asyncio.Event | None = None) -> None:
+        self.batches: list[list[Any]] = []
+        self.gate: asyncio.Event | None = gate
+
+    async def publish(self, values: list[Any]) -> None:
+        if self.gate is not None:
+            await self.gate.wait()
+
+        self.batches.append(values)
+
+
+class FakeKafkaBroker:
+    closed: bool = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def create_publisher(
+    batch_publisher: RecordingBatchPublisher, max_batch_size: int = 100, linger_ms: int = 10_000
+) -> BatchingFastStreamKafkaMessageBroker:
+    return BatchingFastStreamKafkaMessageBroker(
+        broker=FakeKafkaBroker(),  # type: ignore[arg-type]
+        producers={"users": batch_publisher},  # type: ignore[dict-item]
+        max_batch_size=max_batch_size,
+        linger_ms=linger_ms,
+    )
+
+
+async def test_batch_is_published_when_it_reaches_max_size() -> None:
+    batch_publisher: RecordingBatchPublisher = RecordingBatchPublisher()
+    publisher: BatchingFastStreamKafkaMessageBroker = create_publisher(batch_publisher, max_batch_size=2)
+
+    await asyncio.wait_for(
+        asyncio.gather(publisher.send_message("users", {"number": 1}), publisher.send_message("users", {"number": 2})),
+        timeout=1,
+    )
+
+    assert batch_publisher.batches == [[{"number": 1}, {"number": 2}]]
+
+
+async def test_batch_is_published_after_linger() -> None:
+    batch_publisher: RecordingBatchPublisher = RecordingBatchPublisher()
+    publisher: BatchingFastStreamKafkaMessageBroker = create_publisher(batch_publisher, linger_ms=1)
+
+    await asyncio.wait_for(publisher.send_messages("users", [{"number": 1}, {"number": 2}]), timeout=1)
+
+    assert batch_publisher.batches == [[{"number": 1}, {"number": 2}]]
+
+
+async def test_flush_publishes_pending_batches() -> None:
+    batch_publisher: RecordingBatchPublisher = RecordingBatchPublisher()
+    publisher: BatchingFastStreamKafkaMessageBroker = create_publisher(batch_publisher)
+
+    sending: asyncio.Task[None] = asyncio.create_task(publisher.send_message("users", {"number": 1}))
+    await asyncio.sleep(0)
+    await publisher.flush()
+
+    await asyncio.wait_for(sending, timeout=1)
+    assert batch_publisher.batches == [[{"number": 1}]]
+
+
+async def test_stop_publishes_pending_batches_and_closes_broker() -> None:
+    batch_publisher: RecordingBatchPublisher = RecordingBatchPublisher()
+    publisher: BatchingFastStreamKafkaMessageBroker = create_publisher(batch_publisher)
+
+    sending: asyncio.Task[None] = asyncio.create_task(publisher.send_message("users", {"number": 1}))
+    await asyncio.sleep(0)
+    await publisher.stop()
+
+    await asyncio.wait_for(sending, timeout=1)
+    assert batch_publisher.batches == [[{"number": 1}]]
+    assert publisher._broker.closed  # type: ignore[attr-defined]
+
+
+async def test_callers_arent_left_waiting_after_cancelled_flush() -> None:
+    batch_publisher: RecordingBatchPublisher = RecordingBatchPublisher(gate=asyncio.Event())
+    publisher: BatchingFastStreamKafkaMessageBroker = create_publisher(batch_publisher, max_batch_size=1)
+
+    sending: asyncio.Task[None] = asyncio.create_task(publisher.send_message("users", {"number": 1}))
+    await asyncio.sleep(0)
+    for flush in publisher._flushes:
+        flush.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(sending, timeout=1)
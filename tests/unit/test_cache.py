@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+
+import pytest
+
+from app.infrastructure.cache import memory
+from app.infrastructure.cache.memory import LRUCache
+
+
+@dataclass
+class FakeClock:
+    now: float = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake_clock: FakeClock = FakeClock()
+    monkeypatch.setattr(memory, "time", fake_clock)
+    return fake_clock
+
+
+def test_least_recently_used_key_is_evicted() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("a") == (True, 1)
+    assert cache.get("b") == (False, None)
+    assert cache.get("c") == (True, 3)
+    assert cache.metrics.evictions == 1
+    assert cache.metrics.size == 2
+
+
+def test_value_expires_after_ttl(clock: FakeClock) -> None:
+    cache: LRUCache[str, int] = LRUCache(ttl=10.0)
+    cache.set("a", 1)
+
+    clock.now = 9.0
+    assert cache.get("a") == (True, 1)
+
+    clock.now = 10.0
+    assert cache.get("a") == (False, None)
+    assert cache.metrics.expirations == 1
+
+
+def test_missing_value_is_cached_for_negative_ttl(clock: FakeClock) -> None:
+    cache: LRUCache[str, int] = LRUCache(ttl=10.0, negative_ttl=1.0)
+    cache.set("a", None)
+
+    assert cache.get("a") == (True, None)
+    assert cache.metrics.negative_hits == 1
+
+    clock.now = 1.0
+    assert cache.get("a") == (False, None)
+
+
+def test_negative_caching_is_disabled_by_zero_ttl() -> None:
+    cache: LRUCache[str, int] = LRUCache(negative_ttl=0)
+    cache.set("a", None)
+
+    assert cache.get("a") == (False, None)
+
+
+def test_value_loaded_before_invalidation_of_key_is_not_stored() -> None:
+    cache: LRUCache[str, int] = LRUCache()
+    generation: int = cache.generation("a")
+
+    cache.invalidate("a")
+    cache.set("a", 1, generation)
+
+    assert cache.get("a") == (False, None)
+
+
+def test_invalidation_of_key_doesnt_discard_loads_of_others() -> None:
+    cache: LRUCache[str, int] = LRUCache()
+    generation: int = cache.generation("a")
+
+    cache.invalidate("b")
+    cache.set("a", 1, generation)
+
+    assert cache.get("a") == (True, 1)
+
+
+def test_clear_discards_loads_of_all_keys() -> None:
+    cache: LRUCache[str, int] = LRUCache()
+    generation: int = cache.generation("a")
+
+    cache.clear()
+    cache.set("a", 1, generation)
+
+    assert cache.get("a") == (False, None)
+
+
+def test_load_is_discarded_when_invalidated_key_is_forgotten() -> None:
+    cache: LRUCache[str, int] = LRUCache(max_size=1)
+    cache.invalidate("a")
+    generation: int = cache.generation("a")
+
+    # Generation of "a" is forgotten, so it can't be told apart from the newer invalidation of "b"
+    cache.invalidate("b")
+    cache.invalidate("c")
+    cache.set("a", 1, generation)
+
+    assert cache.get("a") == (False, None)
@@ -0,0 +1,69 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from app.infrastructure.brokers.consumers.kafka.users import invalidate_users_cache, setup_users_cache_consumers
+from app.infrastructure.brokers.schemas.users import UserDeleteSchema
+from app.infrastructure.cache.users import UsersCache
+from app.settings.configs.app import BrokerKafkaSettings
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass
+class RecordingKafkaBroker:
+    """
+    KafkaBroker of FastStream, which records subscriptions.
+    """
+
+    subscriptions: list[dict[str, Any]] = field(default_factory=list)
+
+    def subscriber(self, *topics: str, **options: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        def subscribe(handler: Callable[..., Any]) -> Callable[..., Any]:
+            self.subscriptions.append({"topics": topics, "handler": handler, **options})
+            return handler
+
+        return subscribe
+
+
+async def test_consumed_users_are_invalidated() -> None:
+    users_cache: UsersCache = UsersCache()
+    changed_oid, kept_oid = uuid4(), uuid4()
+    users_cache.set(changed_oid, None)
+    users_cache.set(kept_oid, None)
+
+    await invalidate_users_cache([UserDeleteSchema(oid=changed_oid)], users_cache)
+
+    assert users_cache.get(changed_oid) == (False, None)
+    assert users_cache.get(kept_oid) == (True, None)
+
+
+def test_consumer_subscribes_to_users_topics_without_group_by_default() -> None:
+    broker: RecordingKafkaBroker = RecordingKafkaBroker()
+    settings: BrokerKafkaSettings = BrokerKafkaSettings(BROKER_CACHE_CONSUMER_MAX_RECORDS=10)
+
+    setup_users_cache_consumers(broker, settings)  # type: ignore[arg-type]
+
+    [subscription] = broker.subscriptions
+    assert subscription["topics"] == (
+        settings.user_create_topic,
+        settings.user_update_topic,
+        settings.user_delete_topic,
+    )
+    assert subscription["handler"] is invalidate_users_cache
+    assert subscription["group_id"] is None
+    assert subscription["batch"]
+    assert subscription["max_records"] == 10
+    assert subscription["auto_offset_reset"] == "latest"
+
+
+def test_consumer_joins_configured_group() -> None:
+    broker: RecordingKafkaBroker = RecordingKafkaBroker()
+    settings: BrokerKafkaSettings = BrokerKafkaSettings(BROKER_CACHE_CONSUMER_GROUP_ID="users-cache-node-1")
+
+    setup_users_cache_consumers(broker, settings)  # type: ignore[arg-type]
+
+    assert broker.subscriptions[0]["group_id"] == "users-cache-node-1"
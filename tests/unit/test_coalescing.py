@@ -0,0 +1,72 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.user import UserEntity
+from app.infrastructure.services.coalescing import CoalescingUsersWriter
+from app.infrastructure.uow.users.alchemy import SQLAlchemyUsersUnitOfWork
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_callers_are_resumed_after_commit_of_their_batch(
+    session_maker: async_sessionmaker[AsyncSession],
+    create_user: Callable[..., UserEntity],
+    count_users: Callable[[], Awaitable[int]],
+) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+    writer: CoalescingUsersWriter = CoalescingUsersWriter(uow=uow, max_batch_size=3, window_ms=1000)
+
+    async def add_in_unit_of_work(user: UserEntity) -> int:
+        # Unit of work of the caller must not be inherited by the batch, which this caller starts
+        async with uow:
+            await writer.add(user)
+            return await count_users()
+
+    committed_counts: list[int] = await asyncio.gather(*(add_in_unit_of_work(create_user()) for _ in range(3)))
+
+    assert committed_counts == [3, 3, 3]
+    assert writer.metrics.batches == 1
+
+
+async def test_failure_of_caller_doesnt_lose_users_of_others(
+    session_maker: async_sessionmaker[AsyncSession],
+    create_user: Callable[..., UserEntity],
+    count_users: Callable[[], Awaitable[int]],
+) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+    writer: CoalescingUsersWriter = CoalescingUsersWriter(uow=uow, max_batch_size=2, window_ms=1000)
+
+    async def add_and_fail() -> None:
+        async with uow:
+            await writer.add(create_user())
+            raise RuntimeError
+
+    # The failing caller is the last one, so batch is written by the task, which it starts
+    results: list[object] = await asyncio.gather(writer.add(create_user()), add_and_fail(), return_exceptions=True)
+
+    assert isinstance(results[1], RuntimeError)
+    assert await count_users() == 2
+
+
+async def test_batch_falls_back_to_one_by_one_writes(
+    session_maker: async_sessionmaker[AsyncSession],
+    create_user: Callable[..., UserEntity],
+    count_users: Callable[[], Awaitable[int]],
+) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+    writer: CoalescingUsersWriter = CoalescingUsersWriter(uow=uow, max_batch_size=3, window_ms=1000)
+    user: UserEntity = create_user()
+    duplicate: UserEntity = UserEntity(oid=user.oid, name=user.name, surname=user.surname, password=user.password)
+
+    results: list[object] = await asyncio.gather(
+        writer.add(user), writer.add(duplicate), writer.add(create_user()), return_exceptions=True
+    )
+
+    assert isinstance(results[0], UserEntity)
+    assert isinstance(results[1], Exception)
+    assert isinstance(results[2], UserEntity)
+    assert writer.metrics.fallbacks == 1
+    assert await count_users() == 2
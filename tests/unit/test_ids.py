@@ -0,0 +1,66 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import pytest
+
+from app.domain.entities import ids
+from app.domain.entities.ids import UUID7Generator, uuid7_bound, uuid7_created_at
+
+
+def test_uuid7_has_version_and_variant_of_rfc() -> None:
+    oid: UUID = UUID7Generator()()
+
+    assert oid.version == 7
+    assert oid.variant == uuid.RFC_4122
+
+
+def test_uuid7_are_monotonic_and_unique() -> None:
+    generator: UUID7Generator = UUID7Generator()
+
+    oids: list[UUID] = [generator() for _ in range(10_000)]
+
+    assert oids == sorted(oids)
+    assert len(set(oids)) == len(oids)
+
+
+def test_uuid7_are_monotonic_on_counter_overflow(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+    generator: UUID7Generator = UUID7Generator()
+
+    # More ids than counter has values in one millisecond
+    oids: list[UUID] = [generator() for _ in range(10_000)]
+
+    assert oids == sorted(oids)
+    assert uuid7_created_at(oids[-1]) > uuid7_created_at(oids[0])
+
+
+def test_uuid7_are_monotonic_when_clock_goes_back(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock: list[int] = [1_700_000_000_000_000_000, 1_600_000_000_000_000_000]
+    monkeypatch.setattr(ids.time, "time_ns", lambda: clock.pop(0))
+    generator: UUID7Generator = UUID7Generator()
+
+    first: UUID = generator()
+    second: UUID = generator()
+
+    assert second > first
+
+
+def test_uuid7_bound_separates_ids_by_time_of_creation() -> None:
+    generator: UUID7Generator = UUID7Generator()
+    moment: datetime = datetime.now(UTC)
+
+    oid: UUID = generator()
+
+    assert uuid7_bound(moment) <= oid < uuid7_bound(moment + timedelta(seconds=1))
+
+
+def test_uuid7_created_at_returns_time_of_creation_with_milliseconds() -> None:
+    moment: datetime = datetime(2025, 1, 2, 3, 4, 5, 678_000, tzinfo=UTC)
+
+    assert uuid7_created_at(uuid7_bound(moment)) == moment
+
+
+def test_uuid7_created_at_rejects_other_versions() -> None:
+    with pytest.raises(ValueError, match="is not UUIDv7"):
+        uuid7_created_at(uuid.uuid4())
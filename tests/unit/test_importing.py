@@ -0,0 +1,64 @@
+from collections.abc import AsyncIterator, Iterable
+
+import pytest
+from litestar.exceptions.http_exceptions import RequestEntityTooLarge
+
+from app.application.api.v1.users.importing import ImportChunk, limit_body_size, read_import_chunks
+from app.logic.types.formats import DataFormat
+
+pytestmark = pytest.mark.anyio
+
+
+async def stream(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def read_chunks(
+    chunks: Iterable[bytes], data_format: DataFormat = DataFormat.NDJSON, max_line_size: int = 4096
+) -> list[ImportChunk]:
+    return [
+        chunk
+        async for chunk in read_import_chunks(stream(chunks), data_format, chunk_size=10, max_line_size=max_line_size)
+    ]
+
+
+async def test_rows_split_between_chunks_of_body_are_joined() -> None:
+    [chunk] = await read_chunks(
+        [b'{"surname": "Ivanov", "na', b'me": "Ivan", "password": "password"}\n{"surname": "Pet', b'rov"}']
+    )
+
+    assert [command.name for command in chunk.commands] == ["Ivan"]
+    assert chunk.lines == [1]
+    assert [line for line, _ in chunk.errors] == [2]
+
+
+async def test_too_long_row_is_reported_and_skipped_until_line_break() -> None:
+    row: bytes = b'{"surname": "Ivanov", "name": "Ivan", "password": "password"}'
+
+    [chunk] = await read_chunks([row + b"\n" + b"x" * 50, b"x" * 50, b"x" * 50 + b"\n" + row], max_line_size=100)
+
+    assert chunk.lines == [1, 3]
+    assert chunk.errors == [(2, "Couldn't parse row: row is longer than 100 bytes")]
+
+
+async def test_too_long_last_row_without_line_break_is_reported() -> None:
+    [chunk] = await read_chunks([b"x" * 60, b"x" * 60], max_line_size=100)
+
+    assert chunk.errors == [(1, "Couldn't parse row: row is longer than 100 bytes")]
+
+
+async def test_csv_rows_are_matched_with_header() -> None:
+    [chunk] = await read_chunks([b"surname,name,password\r\nIvanov,Ivan,password\r\nPetrov\r\n"], DataFormat.CSV)
+
+    assert [(command.surname, command.name) for command in chunk.commands] == [("Ivanov", "Ivan")]
+    assert chunk.errors == [(3, "Couldn't parse row: expected 3 values, got 1")]
+
+
+async def test_body_larger_than_limit_is_rejected() -> None:
+    body: AsyncIterator[bytes] = limit_body_size(stream([b"x" * 60, b"x" * 60]), max_body_size=100)
+
+    assert await body.__anext__() == b"x" * 60
+
+    with pytest.raises(RequestEntityTooLarge):
+        await body.__anext__()
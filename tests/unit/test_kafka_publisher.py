@@ -0,0 +1,72 @@
+from typing import Optional
+
+import pytest
+from aiokafka import AIOKafkaProducer
+from faststream.kafka import KafkaBroker
+from faststream.kafka.publisher.producer import AioKafkaFastProducer
+
+from app.infrastructure.brokers.publishers.kafka.faststream import FastStreamKafkaMessageBroker, get_aiokafka_producer
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingAIOKafkaProducer(AIOKafkaProducer):
+    """
+    Producer of aiokafka, which records requests of metadata instead of sending them.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(bootstrap_servers="localhost:9092")
+        self.topics: list[str] = []
+
+    async def partitions_for(self, topic: str) -> set[int]:
+        self.topics.append(topic)
+        return {0}
+
+
+class PingedKafkaBroker(KafkaBroker):
+    pinged: bool = False
+
+    async def ping(self, timeout: Optional[float]) -> bool:
+        self.pinged = True
+        return True
+
+
+def connect(broker: KafkaBroker, producer: AIOKafkaProducer) -> None:
+    # The same as KafkaBroker.connect() of FastStream 0.5 does with producer
+    broker._producer = AioKafkaFastProducer(producer=producer, parser=None, decoder=None)
+
+
+async def test_producer_of_connected_broker_is_returned() -> None:
+    broker: KafkaBroker = KafkaBroker("localhost:9092")
+    producer: AIOKafkaProducer = RecordingAIOKafkaProducer()
+
+    assert get_aiokafka_producer(broker) is None
+
+    connect(broker, producer)
+
+    assert get_aiokafka_producer(broker) is producer
+
+
+async def test_warm_up_fetches_metadata_of_topics() -> None:
+    broker: PingedKafkaBroker = PingedKafkaBroker("localhost:9092")
+    producer: RecordingAIOKafkaProducer = RecordingAIOKafkaProducer()
+    connect(broker, producer)
+    publisher: FastStreamKafkaMessageBroker = FastStreamKafkaMessageBroker(
+        broker=broker,
+        producers={"users": broker.publisher("users"), "orders": broker.publisher("orders")},
+    )
+
+    await publisher.warm_up()
+
+    assert producer.topics == ["users", "orders"]
+    assert not broker.pinged
+
+
+async def test_warm_up_without_producer_pings_cluster() -> None:
+    broker: PingedKafkaBroker = PingedKafkaBroker("localhost:9092")
+    publisher: FastStreamKafkaMessageBroker = FastStreamKafkaMessageBroker(broker=broker, producers={})
+
+    await publisher.warm_up()
+
+    assert broker.pinged
@@ -0,0 +1,98 @@
+import asyncio
+from contextvars import ContextVar
+
+import pytest
+
+from app.logic.views.loader import BatchLoader
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingBatchLoad:
+    def __init__(self, values: dict[str, int], gate: asyncio.Event | None = None) -> None:
+        self.values: dict[str, int] = values
+        self.calls: list[list[str]] = []
+        self.gate: asyncio.Event | None = gate
+
+    async def __call__(self, keys: list[str]) -> dict[str, int]:
+        self.calls.append(keys)
+
+        if self.gate is not None:
+            await self.gate.wait()
+
+        return {key: self.values[key] for key in keys if key in self.values}
+
+
+async def test_keys_of_the_same_tick_are_loaded_by_one_call() -> None:
+    batch_load: RecordingBatchLoad = RecordingBatchLoad({"a": 1, "b": 2})
+    loader: BatchLoader[str, int] = BatchLoader(batch_load)
+
+    values: list[int | None] = await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("c"))
+
+    assert values == [1, 2, None]
+    assert batch_load.calls == [["a", "b", "c"]]
+
+
+async def test_batches_are_limited_by_max_batch_size() -> None:
+    batch_load: RecordingBatchLoad = RecordingBatchLoad({"a": 1, "b": 2, "c": 3})
+    loader: BatchLoader[str, int] = BatchLoader(batch_load, max_batch_size=2)
+
+    assert await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("c")) == [1, 2, 3]
+    assert batch_load.calls == [["a", "b"], ["c"]]
+
+
+async def test_concurrent_lookups_of_key_share_one_load() -> None:
+    batch_load: RecordingBatchLoad = RecordingBatchLoad({"a": 1}, gate=asyncio.Event())
+    loader: BatchLoader[str, int] = BatchLoader(batch_load)
+
+    first: asyncio.Task[int | None] = asyncio.create_task(loader.load("a"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    # The load of the first lookup is in flight already
+    second: asyncio.Task[int | None] = asyncio.create_task(loader.load("a"))
+    await asyncio.sleep(0)
+    batch_load.gate.set()  # type: ignore[union-attr]
+
+    assert await asyncio.gather(first, second) == [1, 1]
+    assert batch_load.calls == [["a"]]
+
+
+async def test_cancellation_of_caller_doesnt_cancel_load_for_others() -> None:
+    batch_load: RecordingBatchLoad = RecordingBatchLoad({"a": 1}, gate=asyncio.Event())
+    loader: BatchLoader[str, int] = BatchLoader(batch_load)
+
+    cancelled: asyncio.Task[int | None] = asyncio.create_task(loader.load("a"))
+    waiting: asyncio.Task[int | None] = asyncio.create_task(loader.load("a"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    batch_load.gate.set()  # type: ignore[union-attr]
+
+    assert await waiting == 1
+    assert cancelled.cancelled()
+
+
+async def test_error_of_load_is_raised_to_all_callers() -> None:
+    async def failing_batch_load(keys: list[str]) -> dict[str, int]:
+        raise RuntimeError
+
+    loader: BatchLoader[str, int] = BatchLoader(failing_batch_load)
+
+    results: list[object] = await asyncio.gather(loader.load("a"), loader.load("a"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_batch_doesnt_inherit_context_of_caller() -> None:
+    client: ContextVar[str | None] = ContextVar("client", default=None)
+    clients_of_batches: list[str | None] = []
+
+    async def batch_load(keys: list[str]) -> dict[str, int]:
+        clients_of_batches.append(client.get())
+        return {}
+
+    loader: BatchLoader[str, int] = BatchLoader(batch_load)
+    client.set("first")
+
+    await loader.load("a")
+
+    assert clients_of_batches == [None]
@@ -0,0 +1,181 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from app.logic.bootstrap import Bootstrap
+from app.logic.commands.base import AbstractCommand
+from app.logic.event_buffer import EventBuffer
+from app.logic.events.base import AbstractEvent
+from app.logic.handlers.base import AbstractCommandHandler, AbstractEventHandler
+from app.logic.message_bus import MessageBus, MessageBusMetrics
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass(frozen=True)
+class DoubleCommand(AbstractCommand):
+    value: int
+
+
+@dataclass(frozen=True)
+class DoubledEvent(AbstractEvent):
+    value: int
+
+
+class DoubleCommandHandler(AbstractCommandHandler[DoubleCommand]):
+    def __init__(self, event_buffer: EventBuffer, injections: list[str]) -> None:
+        self._event_buffer: EventBuffer = event_buffer
+        injections.append(type(self).__name__)
+
+    async def __call__(self, command: DoubleCommand) -> int:
+        # Lets other dispatches run in between
+        await asyncio.sleep(0)
+        self._event_buffer.add(DoubledEvent(value=command.value))
+        return command.value * 2
+
+
+class RecordingEventHandler(AbstractEventHandler[DoubledEvent]):
+    def __init__(self, event_buffer: EventBuffer, records: list[int]) -> None:
+        self._records: list[int] = records
+
+    async def __call__(self, event: DoubledEvent) -> None:
+        self._records.append(event.value)
+
+
+def create_bootstrap(records: list[int], injections: list[str]) -> Bootstrap:
+    return Bootstrap(
+        event_buffer=EventBuffer(),
+        events_handlers_for_injection={DoubledEvent: [RecordingEventHandler]},
+        commands_handlers_for_injection={DoubleCommand: DoubleCommandHandler},
+        dependencies={"records": records, "injections": injections},
+    )
+
+
+async def test_handle_returns_result_of_command_handler() -> None:
+    records: list[int] = []
+    message_bus: MessageBus = await create_bootstrap(records, []).get_messagebus()
+
+    assert await message_bus.handle(DoubleCommand(value=2)) == 4
+    assert records == [2]
+
+
+async def test_concurrent_dispatches_have_their_own_events() -> None:
+    records: list[int] = []
+    message_bus: MessageBus = await create_bootstrap(records, []).get_messagebus()
+
+    results: list[int] = await asyncio.gather(*(message_bus.handle(DoubleCommand(value=value)) for value in range(10)))
+
+    assert results == [value * 2 for value in range(10)]
+    assert sorted(records) == list(range(10))
+
+
+async def test_concurrent_first_calls_inject_handlers_once() -> None:
+    injections: list[str] = []
+    bootstrap: Bootstrap = create_bootstrap([], injections)
+
+    message_buses: list[MessageBus] = await asyncio.gather(*(bootstrap.get_messagebus() for _ in range(10)))
+
+    assert injections == ["DoubleCommandHandler"]
+    assert len({id(message_bus._command_handlers) for message_bus in message_buses}) == 1
+
+
+class BarrierEventHandler(AbstractEventHandler[DoubledEvent]):
+    """
+    Finishes only when all handlers of the barrier have started, so it hangs, unless handlers run together.
+    """
+
+    def __init__(self, event_buffer: EventBuffer, started: list[str], parties: int) -> None:
+        self._started: list[str] = started
+        self._parties: int = parties
+
+    async def __call__(self, event: DoubledEvent) -> None:
+        self._started.append(type(self).__name__)
+
+        while len(self._started) < self._parties:  # noqa: ASYNC110
+            await asyncio.sleep(0.001)
+
+
+class SlowEventHandler(AbstractEventHandler[DoubledEvent]):
+    def __init__(self, event_buffer: EventBuffer, seconds: float) -> None:
+        self._seconds: float = seconds
+
+    async def __call__(self, event: DoubledEvent) -> None:
+        await asyncio.sleep(self._seconds)
+
+
+class FailingEventHandler(AbstractEventHandler[DoubledEvent]):
+    def __init__(self, event_buffer: EventBuffer) -> None: ...
+
+    async def __call__(self, event: DoubledEvent) -> None:
+        raise RuntimeError
+
+
+def create_message_bus(
+    event_handlers: list[AbstractEventHandler[DoubledEvent]],
+    concurrent_event_handlers: bool = True,
+    handler_timeout: float | None = None,
+) -> MessageBus:
+    return MessageBus(
+        event_buffer=EventBuffer(),
+        event_handlers={DoubledEvent: event_handlers},  # type: ignore[dict-item]
+        command_handlers={},
+        concurrent_event_handlers=concurrent_event_handlers,
+        handler_timeout=handler_timeout,
+        metrics=MessageBusMetrics(),
+    )
+
+
+async def test_concurrent_handlers_of_event_run_together() -> None:
+    started: list[str] = []
+    message_bus: MessageBus = create_message_bus(
+        [BarrierEventHandler(EventBuffer(), started, parties=2), BarrierEventHandler(EventBuffer(), started, parties=2)]
+    )
+
+    await asyncio.wait_for(message_bus.handle(DoubledEvent(value=1)), timeout=1)
+
+    assert len(started) == 2
+
+
+async def test_timed_out_handler_doesnt_hold_back_others() -> None:
+    records: list[int] = []
+    message_bus: MessageBus = create_message_bus(
+        [SlowEventHandler(EventBuffer(), seconds=10), RecordingEventHandler(EventBuffer(), records)],
+        handler_timeout=0.01,
+    )
+
+    await asyncio.wait_for(message_bus.handle(DoubledEvent(value=1)), timeout=1)
+
+    assert records == [1]
+    assert message_bus._metrics.handler_timeouts == {"SlowEventHandler": 1}
+
+
+async def test_failed_handler_doesnt_break_others() -> None:
+    records: list[int] = []
+    message_bus: MessageBus = create_message_bus(
+        [FailingEventHandler(EventBuffer()), RecordingEventHandler(EventBuffer(), records)]
+    )
+
+    await message_bus.handle(DoubledEvent(value=1))
+
+    assert records == [1]
+    assert message_bus._metrics.handler_failures == {"FailingEventHandler": 1}
+    assert set(message_bus._metrics.handler_latency) == {"FailingEventHandler", "RecordingEventHandler"}
+
+
+async def test_sequential_handlers_have_no_timeout_and_propagate_errors() -> None:
+    records: list[int] = []
+    message_bus: MessageBus = create_message_bus(
+        [SlowEventHandler(EventBuffer(), seconds=0.05), RecordingEventHandler(EventBuffer(), records)],
+        concurrent_event_handlers=False,
+        handler_timeout=0.01,
+    )
+
+    await message_bus.handle(DoubledEvent(value=1))
+    assert records == [1]
+
+    failing_message_bus: MessageBus = create_message_bus(
+        [FailingEventHandler(EventBuffer())], concurrent_event_handlers=False
+    )
+    with pytest.raises(RuntimeError):
+        await failing_message_bus.handle(DoubledEvent(value=1))
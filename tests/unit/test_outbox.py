@@ -0,0 +1,127 @@
+from collections.abc import Mapping, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.exceptions.infrastructure import BatchedEventError
+from app.infrastructure.brokers.publishers.kafka.base import BaseKafkaMessageBrokerPublisher
+from app.infrastructure.brokers.schemas.users import UserCreateSchema
+from app.infrastructure.outbox.factory import OutboxMessageFactory
+from app.infrastructure.outbox.message import OutboxMessage
+from app.infrastructure.outbox.relay import OutboxRelay
+from app.infrastructure.uow.outbox.alchemy import SQLAlchemyOutboxUnitOfWork
+from app.logic.events.users import UserCreateEvent, UsersImportEvent
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingPublisher(BaseKafkaMessageBrokerPublisher):
+    def __init__(self, fail: bool = False) -> None:
+        self.sent: dict[str, list[Any]] = {}
+        self.fail: bool = fail
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def send_message(self, topic: str, value: BaseModel | Mapping[str, Any]) -> None:
+        await self.send_messages(topic, [value])
+
+    async def send_messages(self, topic: str, values: Sequence[BaseModel | Mapping[str, Any]]) -> None:
+        if self.fail:
+            raise ConnectionError
+
+        self.sent.setdefault(topic, []).extend(values)
+
+    async def flush(self) -> None: ...
+
+    async def warm_up(self) -> None: ...
+
+
+async def add_messages(uow: SQLAlchemyOutboxUnitOfWork, messages: Sequence[OutboxMessage]) -> None:
+    async with uow:
+        await uow.outbox.add(messages)
+        await uow.commit()
+
+
+async def list_messages(uow: SQLAlchemyOutboxUnitOfWork) -> list[OutboxMessage]:
+    async with uow:
+        return await uow.outbox.list(limit=100)
+
+
+async def test_relay_publishes_messages_by_topics_and_deletes_them(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    uow: SQLAlchemyOutboxUnitOfWork = SQLAlchemyOutboxUnitOfWork(session_factory=session_maker)
+    publisher: RecordingPublisher = RecordingPublisher()
+    await add_messages(
+        uow,
+        [
+            OutboxMessage(topic="created", payload={"number": 1}),
+            OutboxMessage(topic="deleted", payload={"number": 2}),
+            OutboxMessage(topic="created", payload={"number": 3}),
+        ],
+    )
+
+    relayed: int = await OutboxRelay(uow=uow, broker=publisher).relay_batch()
+
+    assert relayed == 3
+    assert publisher.sent == {"created": [{"number": 1}, {"number": 3}], "deleted": [{"number": 2}]}
+    assert await list_messages(uow) == []
+
+
+async def test_messages_stay_in_outbox_after_failed_publish(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    uow: SQLAlchemyOutboxUnitOfWork = SQLAlchemyOutboxUnitOfWork(session_factory=session_maker)
+    await add_messages(uow, [OutboxMessage(topic="created", payload={"number": 1})])
+    relay: OutboxRelay = OutboxRelay(uow=uow, broker=RecordingPublisher(fail=True))
+
+    with pytest.raises(ConnectionError):
+        await relay.relay_batch()
+
+    assert len(await list_messages(uow)) == 1
+    assert relay.metrics.relayed == 0
+
+
+async def test_relay_observes_lag_of_messages(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    uow: SQLAlchemyOutboxUnitOfWork = SQLAlchemyOutboxUnitOfWork(session_factory=session_maker)
+    now: datetime = datetime.now(UTC)
+    await add_messages(
+        uow,
+        [
+            OutboxMessage(topic="created", payload={}, created_at=now - timedelta(seconds=20)),
+            OutboxMessage(topic="created", payload={}, created_at=now - timedelta(seconds=2)),
+        ],
+    )
+    relay: OutboxRelay = OutboxRelay(uow=uow, broker=RecordingPublisher())
+
+    await relay.relay_batch()
+
+    assert relay.metrics.relayed == 2
+    assert relay.metrics.batches == 1
+    assert relay.metrics.lag.count == 2
+    assert 20 <= relay.metrics.last_lag_seconds < 30
+
+
+async def test_empty_outbox_isnt_published(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    relay: OutboxRelay = OutboxRelay(
+        uow=SQLAlchemyOutboxUnitOfWork(session_factory=session_maker), broker=RecordingPublisher()
+    )
+
+    assert await relay.relay_batch() == 0
+    assert relay.metrics.batches == 0
+
+
+def test_factory_rejects_batched_event_in_create() -> None:
+    factory: OutboxMessageFactory = OutboxMessageFactory(
+        mapping={UsersImportEvent: ("created", UserCreateSchema.from_import_event)}
+    )
+    event: UsersImportEvent = UsersImportEvent(users=(UserCreateEvent(oid=uuid4(), name="Ivan", surname="Ivanov"),))
+
+    with pytest.raises(BatchedEventError):
+        factory.create(event)
+
+    assert len(factory.create_batch(event)) == 1
@@ -0,0 +1,42 @@
+import asyncio
+
+import bcrypt
+import pytest
+
+from app.infrastructure.security.executor import ExecutorPasswordHasher
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_batch_is_hashed_in_order_of_passwords() -> None:
+    hasher: ExecutorPasswordHasher = ExecutorPasswordHasher(max_workers=4, rounds=4)
+    passwords: list[str] = [f"password{number}" for number in range(9)]
+
+    try:
+        hashed_passwords: list[bytes] = await hasher.hash_passwords(passwords)
+    finally:
+        await hasher.shutdown()
+
+    assert len(hashed_passwords) == len(passwords)
+    assert all(bcrypt.checkpw(password.encode(), hashed) for password, hashed in zip(passwords, hashed_passwords))
+
+
+async def test_batch_leaves_workers_for_single_passwords() -> None:
+    # Without free workers every single password would be rejected, as nothing may wait in the queue
+    hasher: ExecutorPasswordHasher = ExecutorPasswordHasher(
+        max_workers=2, max_queue_size=0, rounds=6, max_batch_workers=1
+    )
+
+    try:
+        batch: asyncio.Task[list[bytes]] = asyncio.create_task(hasher.hash_passwords(["password"] * 20))
+
+        while hasher.metrics.in_flight == 0:  # noqa: ASYNC110
+            await asyncio.sleep(0.001)
+
+        await hasher.hash_password("password")
+
+        assert not batch.done()
+        assert hasher.metrics.rejected == 0
+        await batch
+    finally:
+        await hasher.shutdown()
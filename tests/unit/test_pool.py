@@ -0,0 +1,131 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.infrastructure.adapters.alchemy.pool import (
+    DatabasePoolsMetrics,
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolMetrics,
+    instrument_engine,
+)
+from app.logic.container import DatabaseProvider
+from app.settings.configs.app import Settings, SQLAlchemySettings
+
+pytestmark = pytest.mark.anyio
+
+
+def create_engine(tmp_path: Path, metrics: PoolMetrics, pool_timeout: float = 30) -> AsyncEngine:
+    engine: AsyncEngine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=pool_timeout,
+    )
+    instrument_engine(engine, metrics)
+    return engine
+
+
+async def test_checkouts_of_connections_are_counted(tmp_path: Path) -> None:
+    metrics: PoolMetrics = PoolMetrics()
+    engine: AsyncEngine = create_engine(tmp_path, metrics)
+
+    try:
+        for _ in range(2):
+            async with engine.connect():
+                pass
+
+        assert metrics.as_dict() | {"wait_time": None} == {
+            "size": 1,
+            "checked_out": 0,
+            "checked_in": 1,
+            "overflow": 0,
+            "checkouts": 2,
+            "checkins": 2,
+            "connects": 1,
+            "invalidations": 0,
+            "timeouts": 0,
+            "wait_time": None,
+        }
+        assert metrics.wait_time.count == 2
+    finally:
+        await engine.dispose()
+
+
+async def test_wait_for_returned_connection_is_measured(tmp_path: Path) -> None:
+    metrics: PoolMetrics = PoolMetrics()
+    engine: AsyncEngine = create_engine(tmp_path, metrics)
+
+    async def hold() -> None:
+        async with engine.connect():
+            await asyncio.sleep(0.1)
+
+    try:
+        holder: asyncio.Task[None] = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+
+        async with engine.connect():
+            pass
+
+        await holder
+
+        # Opening of the first connection isn't waiting for the pool
+        assert metrics.wait_time.count == 2
+        assert 0.05 < metrics.wait_time.max < 1
+    finally:
+        await engine.dispose()
+
+
+async def test_checkout_timeouts_are_counted(tmp_path: Path) -> None:
+    metrics: PoolMetrics = PoolMetrics()
+    engine: AsyncEngine = create_engine(tmp_path, metrics, pool_timeout=0.01)
+
+    try:
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                await engine.connect().start()
+
+        assert metrics.timeouts == 1
+    finally:
+        await engine.dispose()
+
+
+async def test_metrics_are_kept_by_recreated_pool(tmp_path: Path) -> None:
+    metrics: PoolMetrics = PoolMetrics()
+    engine: AsyncEngine = create_engine(tmp_path, metrics)
+
+    try:
+        await engine.dispose()
+
+        async with engine.connect():
+            pass
+
+        assert metrics.checkouts == 1
+        assert metrics.wait_time.count == 1
+    finally:
+        await engine.dispose()
+
+
+async def test_engine_pool_is_configured_by_settings(tmp_path: Path) -> None:
+    settings: Settings = Settings(
+        alchemy=SQLAlchemySettings(DATABASE_POOL_SIZE=3, DATABASE_MAX_OVERFLOW=2, DATABASE_POOL_TIMEOUT=7)
+    )
+    pools_metrics: DatabasePoolsMetrics = DatabasePoolsMetrics()
+
+    engine: AsyncEngine = DatabaseProvider._create_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", settings, pools_metrics, name="primary"
+    )
+
+    try:
+        pool: InstrumentedAsyncAdaptedQueuePool = engine.sync_engine.pool  # type: ignore[assignment]
+        assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+        assert pool.size() == 3
+        assert pool._max_overflow == 2
+        assert pool.timeout() == 7
+        assert pool.metrics is pools_metrics.pools["primary"]
+        assert pools_metrics.as_dict()["primary"]["size"] == 3
+    finally:
+        await engine.dispose()
@@ -0,0 +1,82 @@
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.litestar import setup_dishka
+from litestar import Litestar, get, post
+from litestar.testing import AsyncTestClient
+
+from app.application.api.utils.middlewares import ReadYourWritesMiddleware
+from app.infrastructure.adapters.alchemy.routing import ReadYourWrites, pinned_until
+
+if TYPE_CHECKING:
+    from contextvars import Token
+
+    from httpx import Response
+
+pytestmark = pytest.mark.anyio
+
+
+def is_pinned_until(read_your_writes: ReadYourWrites, deadline: float) -> bool:
+    token: Token[float] = pinned_until.set(deadline)
+
+    try:
+        return read_your_writes.is_pinned()
+    finally:
+        pinned_until.reset(token)
+
+
+def test_client_is_pinned_until_end_of_window() -> None:
+    read_your_writes: ReadYourWrites = ReadYourWrites(window=60)
+
+    assert is_pinned_until(read_your_writes, read_your_writes.pin())
+    assert not is_pinned_until(read_your_writes, time.time() - 1)
+    assert not is_pinned_until(read_your_writes, 0.0)
+
+
+def test_pin_further_than_window_is_ignored() -> None:
+    read_your_writes: ReadYourWrites = ReadYourWrites(window=60)
+
+    assert not is_pinned_until(read_your_writes, time.time() + 3600)
+
+
+def create_client(window: float) -> AsyncTestClient[Litestar]:
+    @post("/write")
+    async def write() -> None: ...
+
+    @get("/read")
+    async def read() -> bool:
+        return read_your_writes.is_pinned()
+
+    read_your_writes: ReadYourWrites = ReadYourWrites(window=window)
+    provider: Provider = Provider(scope=Scope.APP)
+    provider.provide(lambda: read_your_writes, provides=ReadYourWrites)
+    app: Litestar = Litestar(route_handlers=[write, read], middleware=[ReadYourWritesMiddleware(cookie="pinned")])
+    setup_dishka(container=make_async_container(provider), app=app)
+
+    return AsyncTestClient(app=app)
+
+
+async def test_write_pins_client_by_cookie() -> None:
+    async with create_client(window=60) as client:
+        assert (await client.get("/read")).json() is False
+
+        response: Response = await client.post("/write")
+
+        assert "pinned" in response.cookies
+        assert (await client.get("/read")).json() is True
+
+
+async def test_pin_is_honoured_by_another_process() -> None:
+    async with create_client(window=60) as writer, create_client(window=60) as reader:
+        response: Response = await writer.post("/write")
+
+        assert (await reader.get("/read", cookies={"pinned": response.cookies["pinned"]})).json() is True
+
+
+async def test_write_doesnt_pin_client_if_read_your_writes_is_disabled() -> None:
+    async with create_client(window=0) as client:
+        response: Response = await client.post("/write")
+
+        assert "pinned" not in response.cookies
@@ -0,0 +1,72 @@
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import Any
+
+from app.domain.entities.user import UserEntity
+from app.domain.serializers import get_serializer
+from app.logic.commands.users import UpdateUserCommand
+from app.logic.events.users import UserCreateEvent, UsersImportEvent
+
+
+def test_entity_is_serialized_with_values_of_value_objects(create_user: Callable[..., UserEntity]) -> None:
+    user: UserEntity = create_user()
+
+    assert user.to_dict() == {
+        "oid": user.oid,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+        "name": "Ivan",
+        "surname": "Ivanov",
+        "password": b"hash",
+    }
+
+
+def test_entity_is_serialized_with_value_objects_themselves(create_user: Callable[..., UserEntity]) -> None:
+    user: UserEntity = create_user()
+
+    data: dict[str, Any] = user.to_dict(save_classes_value_objects=True)
+
+    assert data["name"] is user.name
+    assert data["password"] is user.password
+
+
+def test_excluded_fields_are_skipped_and_included_are_added(create_user: Callable[..., UserEntity]) -> None:
+    user: UserEntity = create_user()
+
+    data: dict[str, Any] = user.to_dict(exclude={"oid", "created_at"}, include={"extra": 1})
+
+    assert "oid" not in data
+    assert "created_at" not in data
+    assert data["extra"] == 1
+
+
+def test_serialization_doesnt_change_entity(create_user: Callable[..., UserEntity]) -> None:
+    user: UserEntity = create_user()
+    fields_before: dict[str, Any] = dict(vars(user))
+
+    user.to_dict(exclude={"oid"})["name"] = "Petr"
+
+    assert vars(user) == fields_before
+
+
+def test_nested_models_are_kept_as_they_are(create_user: Callable[..., UserEntity]) -> None:
+    created: UserCreateEvent = UserCreateEvent(oid=create_user().oid, name="Ivan", surname="Ivanov")
+    event: UsersImportEvent = UsersImportEvent(users=(created,))
+
+    assert event.to_dict()["users"][0] is created
+
+
+def test_flat_models_are_serialized_as_by_asdict(create_user: Callable[..., UserEntity]) -> None:
+    command: UpdateUserCommand = UpdateUserCommand(
+        oid=create_user().oid, surname="Ivanov", name="Ivan", password="password"
+    )
+    event: UserCreateEvent = UserCreateEvent(oid=command.oid, name="Ivan", surname="Ivanov")
+
+    assert command.to_dict() == asdict(command)
+    assert event.to_dict() == asdict(event)
+
+
+def test_serializer_is_generated_once_for_class_and_options() -> None:
+    assert get_serializer(UserEntity) is get_serializer(UserEntity)
+    assert get_serializer(UserEntity) is not get_serializer(UserEntity, unwrap_value_objects=True)
+    assert get_serializer(UserEntity, frozenset({"oid"})) is get_serializer(UserEntity, frozenset({"oid"}))
@@ -0,0 +1,16 @@
+import pytest
+from pydantic import ValidationError
+
+from app.settings.configs.app import BrokerKafkaSettings
+
+
+def test_idempotence_requires_acks_all() -> None:
+    with pytest.raises(ValidationError, match="BROKER_ACKS=all"):
+        BrokerKafkaSettings(BROKER_ENABLE_IDEMPOTENCE=True, BROKER_ACKS=1)
+
+
+def test_idempotence_with_acks_all() -> None:
+    settings: BrokerKafkaSettings = BrokerKafkaSettings(BROKER_ENABLE_IDEMPOTENCE=True, BROKER_ACKS="all")
+
+    assert settings.enable_idempotence
+    assert settings.acks == "all"
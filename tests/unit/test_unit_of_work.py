@@ -0,0 +1,112 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.user import UserEntity
+from app.exceptions.infrastructure import UnitOfWorkNotStartedError
+from app.infrastructure.uow.users.alchemy import SQLAlchemyUsersUnitOfWork
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_commit_of_nested_level_is_deferred_until_outermost_exit(
+    session_maker: async_sessionmaker[AsyncSession],
+    create_user: Callable[..., UserEntity],
+    count_users: Callable[[], Awaitable[int]],
+) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+
+    async with uow:
+        async with uow:
+            await uow.users.add(create_user())
+            await uow.commit()
+
+        assert await count_users() == 0
+
+    assert await count_users() == 1
+
+
+async def test_nested_levels_share_session(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+
+    async with uow:
+        outer_session: AsyncSession = uow._session
+
+        async with uow:
+            assert uow._session is outer_session
+
+
+async def test_error_after_nested_commit_rolls_back_everything(
+    session_maker: async_sessionmaker[AsyncSession],
+    create_user: Callable[..., UserEntity],
+    count_users: Callable[[], Awaitable[int]],
+) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+
+    async def add_and_fail() -> None:
+        async with uow:
+            async with uow:
+                await uow.users.add(create_user())
+                await uow.commit()
+
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await add_and_fail()
+
+    assert await count_users() == 0
+
+
+async def test_changes_without_commit_are_rolled_back(
+    session_maker: async_sessionmaker[AsyncSession],
+    create_user: Callable[..., UserEntity],
+    count_users: Callable[[], Awaitable[int]],
+) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+
+    async with uow:
+        await uow.users.add(create_user())
+
+    assert await count_users() == 0
+
+
+async def test_commit_of_outermost_level_is_immediate(
+    session_maker: async_sessionmaker[AsyncSession],
+    create_user: Callable[..., UserEntity],
+    count_users: Callable[[], Awaitable[int]],
+) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+
+    async with uow:
+        await uow.users.add(create_user())
+        await uow.commit()
+
+        assert await count_users() == 1
+
+
+async def test_concurrent_tasks_get_own_sessions(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+    entered: asyncio.Event = asyncio.Event()
+    sessions: list[AsyncSession] = []
+
+    async def use() -> None:
+        async with uow:
+            sessions.append(uow._session)
+
+            if len(sessions) == 2:
+                entered.set()
+
+            await entered.wait()
+
+    await asyncio.gather(use(), use())
+
+    assert sessions[0] is not sessions[1]
+
+
+async def test_use_outside_of_block_raises(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+
+    with pytest.raises(UnitOfWorkNotStartedError):
+        await uow.commit()
@@ -0,0 +1,108 @@
+from collections.abc import Sequence
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.user import UserEntity
+from app.domain.values.user import Password, UserName, UserSurname
+from app.exceptions.infrastructure import UserNotFoundError
+from app.infrastructure.brokers.schemas.users import UserCreateSchema, UserUpdateSchema
+from app.infrastructure.outbox.factory import OutboxMessageFactory
+from app.infrastructure.security.base import BasePasswordHasher
+from app.infrastructure.services.users import UsersService
+from app.infrastructure.uow.users.alchemy import SQLAlchemyUsersUnitOfWork
+from app.logic.commands.users import CreateUserCommand, ImportUsersCommand, UpdateUserCommand
+from app.logic.event_buffer import EventBuffer
+from app.logic.events.users import UsersImportEvent, UserUpdateEvent
+from app.logic.handlers.users.commands import ImportUsersCommandHandler, UpdateUserCommandHandler
+
+pytestmark = pytest.mark.anyio
+
+
+class CountingPasswordHasher(BasePasswordHasher):
+    def __init__(self) -> None:
+        self.hashed: int = 0
+
+    async def hash_password(self, password: str) -> bytes:
+        self.hashed += 1
+        return b"hash"
+
+    async def hash_passwords(self, passwords: Sequence[str]) -> list[bytes]:
+        return [await self.hash_password(password) for password in passwords]
+
+    async def validate_password(self, password: str, hashed_password: bytes) -> bool:
+        return True
+
+    async def shutdown(self) -> None: ...
+
+
+def create_handler(
+    session_maker: async_sessionmaker[AsyncSession], hasher: BasePasswordHasher
+) -> UpdateUserCommandHandler:
+    return UpdateUserCommandHandler(
+        event_buffer=EventBuffer(),
+        users_uow=SQLAlchemyUsersUnitOfWork(session_factory=session_maker),
+        password_hasher=hasher,
+        outbox_message_factory=OutboxMessageFactory(
+            mapping={UserUpdateEvent: ("user-update", UserUpdateSchema.from_event)}
+        ),
+    )
+
+
+async def test_update_of_unknown_user_doesnt_hash_password(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    hasher: CountingPasswordHasher = CountingPasswordHasher()
+
+    with pytest.raises(UserNotFoundError):
+        await create_handler(session_maker, hasher)(
+            UpdateUserCommand(oid=uuid4(), surname="Ivanov", name="Ivan", password="password")
+        )
+
+    assert hasher.hashed == 0
+
+
+async def test_update_of_stored_user_hashes_password(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    user: UserEntity = UserEntity(name=UserName("Ivan"), surname=UserSurname("Ivanov"), password=Password(b"old"))
+    await UsersService(SQLAlchemyUsersUnitOfWork(session_factory=session_maker)).add(user)
+    hasher: CountingPasswordHasher = CountingPasswordHasher()
+
+    updated_user: UserEntity = await create_handler(session_maker, hasher)(
+        UpdateUserCommand(oid=user.oid, surname="Petrov", name="Petr", password="password")
+    )
+
+    assert hasher.hashed == 1
+    assert updated_user.name.as_generic_type() == "Petr"
+
+
+async def test_import_reports_rows_of_chunk_which_couldnt_be_saved(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    event_buffer: EventBuffer = EventBuffer()
+    handler: ImportUsersCommandHandler = ImportUsersCommandHandler(
+        event_buffer=event_buffer,
+        users_uow=SQLAlchemyUsersUnitOfWork(session_factory=session_maker),
+        password_hasher=CountingPasswordHasher(),
+        outbox_message_factory=OutboxMessageFactory(
+            mapping={UsersImportEvent: ("user-create", UserCreateSchema.from_import_event)}
+        ),
+    )
+
+    async with session_maker() as session:
+        await session.execute(text("DROP TABLE users"))
+        await session.commit()
+
+    errors: dict[int, str] = await handler(
+        ImportUsersCommand(
+            users=(
+                CreateUserCommand(surname="Ivanov", name="Ivan", password="password"),
+                CreateUserCommand(surname="Ivanov", name="", password="password"),
+                CreateUserCommand(surname="Petrov", name="Petr", password="password"),
+            )
+        )
+    )
+
+    assert sorted(errors) == [0, 1, 2]
+    assert errors[0].startswith("Couldn't save chunk of rows")
+    assert not errors[1].startswith("Couldn't save chunk of rows")
+    assert list(event_buffer.get_events()) == []
@@ -0,0 +1,100 @@
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+import pytest
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.integrations.litestar import setup_dishka
+from litestar import Litestar
+from litestar.testing import AsyncTestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.api.utils.exception_handlers import application_error_handler
+from app.application.api.v1.users.handlers import UserController
+from app.domain.entities.user import UserEntity
+from app.exceptions.base import BaseAppError
+from app.infrastructure.brokers.schemas.users import UserDeleteSchema
+from app.infrastructure.outbox.factory import OutboxMessageFactory
+from app.infrastructure.services.users import UsersService
+from app.infrastructure.uow.users.alchemy import SQLAlchemyUsersUnitOfWork
+from app.logic.commands.users import DeleteUsersCommand
+from app.logic.event_buffer import EventBuffer
+from app.logic.events.users import UsersDeleteEvent
+from app.logic.handlers.users.commands import DeleteUsersCommandHandler
+from app.logic.message_bus import MessageBus
+from app.settings.configs.app import PaginationSettings, Settings
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+pytestmark = pytest.mark.anyio
+
+
+class UsersProvider(Provider):
+    """
+    Provides message bus with handler of bulk delete over the test database.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        super().__init__()
+        self._session_maker: async_sessionmaker[AsyncSession] = session_maker
+
+    @provide(scope=Scope.APP)
+    def get_settings(self) -> Settings:
+        return Settings(pagination=PaginationSettings(PAGINATION_MAX_PAGE_SIZE=3))
+
+    @provide(scope=Scope.REQUEST)
+    def get_message_bus(self) -> MessageBus:
+        event_buffer: EventBuffer = EventBuffer()
+        handler: DeleteUsersCommandHandler = DeleteUsersCommandHandler(
+            event_buffer=event_buffer,
+            users_uow=SQLAlchemyUsersUnitOfWork(session_factory=self._session_maker),
+            # Passwords aren't hashed by bulk delete
+            password_hasher=None,  # type: ignore[arg-type]
+            outbox_message_factory=OutboxMessageFactory(
+                mapping={UsersDeleteEvent: ("user-delete", UserDeleteSchema.from_bulk_delete_event)}
+            ),
+        )
+        return MessageBus(
+            event_buffer=event_buffer,
+            event_handlers={UsersDeleteEvent: []},
+            command_handlers={DeleteUsersCommand: handler},  # type: ignore[dict-item]
+        )
+
+
+@pytest.fixture
+async def client(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[AsyncTestClient[Litestar]]:
+    app: Litestar = Litestar(
+        route_handlers=[UserController],
+        exception_handlers={BaseAppError: application_error_handler},
+    )
+    setup_dishka(container=make_async_container(UsersProvider(session_maker)), app=app)
+
+    async with AsyncTestClient(app=app) as test_client:
+        yield test_client
+
+
+async def test_bulk_delete_returns_deleted_and_missing_ids(
+    client: AsyncTestClient[Litestar],
+    session_maker: async_sessionmaker[AsyncSession],
+    create_user: Callable[..., UserEntity],
+) -> None:
+    users_service: UsersService = UsersService(SQLAlchemyUsersUnitOfWork(session_factory=session_maker))
+    user: UserEntity = create_user()
+    await users_service.add(user)
+    missing_id: UUID = uuid4()
+
+    response: Response = await client.delete("/user/", params={"ids": [str(user.oid), str(missing_id), str(user.oid)]})
+
+    assert response.status_code == 200
+    assert response.json() == {"deleted": [str(user.oid)], "missing": [str(missing_id)]}
+    assert await users_service.get_read_model(user.oid) is None
+
+
+async def test_bulk_delete_of_too_many_ids_is_rejected(client: AsyncTestClient[Litestar]) -> None:
+    response: Response = await client.delete("/user/", params={"ids": [str(uuid4()) for _ in range(4)]})
+
+    assert response.status_code == 400
+    assert response.text == "Please delete at most 3 users at once"
@@ -0,0 +1,124 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.user import UserEntity
+from app.domain.values.user import Password, UserName, UserSurname
+from app.infrastructure.repositories.users.alchemy import SQLAlchemyUsersRepository, _as_utc
+from app.infrastructure.services.users import UsersService
+from app.infrastructure.uow.users.alchemy import SQLAlchemyUsersUnitOfWork
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass
+class FakeDriverConnection:
+    """
+    Connection of asyncpg, which records COPY instead of executing it.
+    """
+
+    in_transaction: bool = False
+    copies: list[dict[str, Any]] = field(default_factory=list)
+
+    def is_in_transaction(self) -> bool:
+        return self.in_transaction
+
+    async def copy_records_to_table(
+        self, table_name: str, *, schema_name: Optional[str], columns: Sequence[str], records: Sequence[tuple]
+    ) -> None:
+        self.copies.append(
+            {
+                "table_name": table_name,
+                "schema_name": schema_name,
+                "columns": list(columns),
+                "records": list(records),
+                "in_transaction": self.in_transaction,
+            }
+        )
+
+
+@dataclass
+class FakeRawConnection:
+    driver_connection: FakeDriverConnection
+
+
+@dataclass
+class FakeConnection:
+    """
+    AsyncConnection of SQLAlchemy, statements of which start transaction of the driver connection.
+    """
+
+    driver_connection: FakeDriverConnection
+    statements: list[str] = field(default_factory=list)
+
+    async def get_raw_connection(self) -> FakeRawConnection:
+        return FakeRawConnection(self.driver_connection)
+
+    async def exec_driver_sql(self, statement: str) -> None:
+        self.statements.append(statement)
+        self.driver_connection.in_transaction = True
+
+
+async def test_copy_converts_users_to_records_in_order_of_columns(create_user: Callable[..., UserEntity]) -> None:
+    connection: FakeConnection = FakeConnection(FakeDriverConnection(in_transaction=True))
+    users: list[UserEntity] = [create_user("Ivan"), create_user("Petr")]
+
+    await SQLAlchemyUsersRepository._copy_many(connection, users)  # type: ignore[arg-type]
+
+    [copy] = connection.driver_connection.copies
+    assert copy["table_name"] == "users"
+    assert copy["columns"] == ["id", "surname", "name", "password", "created_at", "updated_at"]
+    assert copy["records"] == [
+        (user.oid, "Ivanov", user.name.as_generic_type(), b"hash", user.created_at, user.updated_at) for user in users
+    ]
+
+
+async def test_copy_starts_transaction_of_driver_connection_first(create_user: Callable[..., UserEntity]) -> None:
+    connection: FakeConnection = FakeConnection(FakeDriverConnection(in_transaction=False))
+
+    await SQLAlchemyUsersRepository._copy_many(connection, [create_user()])  # type: ignore[arg-type]
+
+    assert connection.statements == ["SELECT 1"]
+    assert connection.driver_connection.copies[0]["in_transaction"]
+
+
+async def test_copy_reuses_started_transaction(create_user: Callable[..., UserEntity]) -> None:
+    connection: FakeConnection = FakeConnection(FakeDriverConnection(in_transaction=True))
+
+    await SQLAlchemyUsersRepository._copy_many(connection, [create_user()])  # type: ignore[arg-type]
+
+    assert connection.statements == []
+
+
+async def test_upsert_of_new_user_is_detected_as_insert(
+    session_maker: async_sessionmaker[AsyncSession], create_user: Callable[..., UserEntity]
+) -> None:
+    users_service: UsersService = UsersService(SQLAlchemyUsersUnitOfWork(session_factory=session_maker))
+    user: UserEntity = create_user()
+
+    stored_user, created = await users_service.upsert(user)
+
+    assert created
+    assert stored_user.oid == user.oid
+
+
+async def test_upsert_of_stored_user_is_detected_as_update(
+    session_maker: async_sessionmaker[AsyncSession], create_user: Callable[..., UserEntity]
+) -> None:
+    users_service: UsersService = UsersService(SQLAlchemyUsersUnitOfWork(session_factory=session_maker))
+    user: UserEntity = create_user("Ivan")
+    await users_service.upsert(user)
+
+    replacement: UserEntity = UserEntity(
+        oid=user.oid, name=UserName("Petr"), surname=UserSurname("Petrov"), password=Password(b"new hash")
+    )
+    stored_user, created = await users_service.upsert(replacement)
+
+    assert not created
+    assert stored_user.name.as_generic_type() == "Petr"
+    # SQLite returns naive datetimes, so they are compared in UTC as the repository does
+    assert _as_utc(stored_user.created_at) == _as_utc(user.created_at)
+    assert (await users_service.get_by_id(user.oid)).surname.as_generic_type() == "Petrov"
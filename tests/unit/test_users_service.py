@@ -0,0 +1,62 @@
+import asyncio
+from contextlib import aclosing
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.user import UserEntity
+from app.domain.values.user import Password, UserName, UserSurname
+from app.infrastructure.repositories.users.base import UserReadModel
+from app.infrastructure.services.users import UsersService
+from app.infrastructure.uow.users.alchemy import SQLAlchemyUsersUnitOfWork
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+pytestmark = pytest.mark.anyio
+
+
+async def create_users(uow: SQLAlchemyUsersUnitOfWork, count: int) -> list[UserEntity]:
+    users: list[UserEntity] = [
+        UserEntity(name=UserName(f"Ivan{number}"), surname=UserSurname("Ivanov"), password=Password(b"hash"))
+        for number in range(count)
+    ]
+    await UsersService(uow).add_many(users)
+    return users
+
+
+async def test_stream_returns_all_users_in_order_of_creation(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+    users: list[UserEntity] = await create_users(uow, 5)
+
+    rows: list[UserReadModel] = [row async for row in UsersService(uow).stream(fetch_size=2)]
+
+    assert [row.oid for row in rows] == [user.oid for user in users]
+
+
+async def test_stream_doesnt_open_unit_of_work_in_iterating_task(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+    await create_users(uow, 3)
+
+    async with aclosing(UsersService(uow).stream(fetch_size=1)) as rows:
+        await rows.__anext__()
+        assert uow._state.get() is None
+
+    assert uow._state.get() is None
+
+
+async def test_stream_is_closed_by_other_task(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+    await create_users(uow, 3)
+    rows: AsyncGenerator[UserReadModel, None] = UsersService(uow).stream(fetch_size=1)
+
+    async def read_first_row() -> UserReadModel:
+        return await rows.__anext__()
+
+    await asyncio.create_task(read_first_row())
+    await rows.aclose()
+
+    # Unit of work is free for the next use after the stream is closed
+    assert len([row async for row in UsersService(uow).stream(fetch_size=1)]) == 3
@@ -0,0 +1,100 @@
+import asyncio
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.user import UserEntity
+from app.domain.values.user import Password, UserName, UserSurname
+from app.infrastructure.adapters.alchemy.orm import users_table
+from app.infrastructure.adapters.alchemy.routing import ReadYourWrites, pinned_until
+from app.infrastructure.cache.users import UsersCache
+from app.infrastructure.repositories.users.base import UserReadModel
+from app.infrastructure.services.users import UsersService
+from app.infrastructure.uow.users.alchemy import SQLAlchemyUsersUnitOfWork
+from app.logic.views.users import UsersViews
+
+if TYPE_CHECKING:
+    from contextvars import Token
+
+pytestmark = pytest.mark.anyio
+
+
+class PausedUsersViews(UsersViews):
+    """
+    Views, which hold loaded users until release is set, so cache can be invalidated while a load is in flight.
+    """
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.loaded: asyncio.Event = asyncio.Event()
+        self.release: asyncio.Event = asyncio.Event()
+
+    async def _load_users(self, user_ids: list[UUID]) -> dict[UUID, UserReadModel]:
+        users: dict[UUID, UserReadModel] = await super()._load_users(user_ids)
+        self.loaded.set()
+        await self.release.wait()
+        return users
+
+
+async def test_lookup_after_invalidation_doesnt_join_stale_load(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+    user: UserEntity = UserEntity(name=UserName("Ivan"), surname=UserSurname("Ivanov"), password=Password(b"hash"))
+    await UsersService(uow).add(user)
+    cache: UsersCache = UsersCache()
+    views: PausedUsersViews = PausedUsersViews(uow, cache=cache)
+
+    stale_lookup: asyncio.Task[UserReadModel] = asyncio.create_task(views.get_user_by_id(user.oid))
+    await views.loaded.wait()
+
+    async with session_maker() as session:
+        await session.execute(update(users_table).where(users_table.c.oid == user.oid).values(name=UserName("Petr")))
+        await session.commit()
+
+    cache.invalidate(user.oid)
+    fresh_lookup: asyncio.Task[UserReadModel] = asyncio.create_task(views.get_user_by_id(user.oid))
+    await asyncio.sleep(0)
+    views.release.set()
+
+    assert (await stale_lookup).name == "Ivan"
+    assert (await fresh_lookup).name == "Petr"
+    assert cache.get(user.oid)[1].name == "Petr"  # type: ignore[union-attr]
+
+
+async def test_pinned_client_doesnt_read_cached_user(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+    user: UserEntity = UserEntity(name=UserName("Ivan"), surname=UserSurname("Ivanov"), password=Password(b"hash"))
+    await UsersService(uow).add(user)
+    cache: UsersCache = UsersCache()
+    read_your_writes: ReadYourWrites = ReadYourWrites(window=60)
+    views: UsersViews = UsersViews(uow, cache=cache, read_your_writes=read_your_writes)
+
+    # Cached before the write of the client, e.g. read from a lagging replica
+    stale_user: UserReadModel = (await views.get_user_by_id(user.oid))._replace(name="Petr")
+    cache.set(user.oid, stale_user)
+    token: Token[float] = pinned_until.set(read_your_writes.pin())
+
+    try:
+        assert (await views.get_user_by_id(user.oid)).name == "Ivan"
+        assert [found.name for found in await views.get_users_by_ids([user.oid])] == ["Ivan"]
+    finally:
+        pinned_until.reset(token)
+
+    assert (await views.get_user_by_id(user.oid)).name == "Petr"
+
+
+async def test_users_are_cached_at_most_for_max_cache_ttl(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_maker)
+    user: UserEntity = UserEntity(name=UserName("Ivan"), surname=UserSurname("Ivanov"), password=Password(b"hash"))
+    await UsersService(uow).add(user)
+    cache: UsersCache = UsersCache(ttl=60, negative_ttl=5)
+    views: UsersViews = UsersViews(uow, cache=cache, max_cache_ttl=0)
+
+    await views.get_user_by_id(user.oid)
+    await views.get_users_by_ids([user.oid, uuid4()])
+
+    assert cache.metrics.size == 0
@@ -0,0 +1,75 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from app.domain.values.base import BaseValueObject
+from app.domain.values.user import Password, UserName, UserSurname
+from app.exceptions.domain import CantBeNumberError, EmptyFieldError, EmptyPasswordError
+from app.infrastructure.adapters.alchemy.type_decorators import (
+    PasswordTypeDecorator,
+    UserNameTypeDecorator,
+    UserSurnameTypeDecorator,
+)
+
+
+@pytest.mark.parametrize("value_object", [UserName("Ivan"), UserSurname("Ivanov"), Password(b"hash")])
+def test_value_object_has_no_dict(value_object: BaseValueObject) -> None:
+    assert not hasattr(value_object, "__dict__")
+
+    # Frozen check is bypassed, so only slots prevent new attribute
+    with pytest.raises(AttributeError):
+        object.__setattr__(value_object, "extra", 1)
+
+
+@pytest.mark.parametrize("value_object", [UserName("Ivan"), UserSurname("Ivanov"), Password(b"hash")])
+def test_value_object_rejects_assignment(value_object: BaseValueObject) -> None:
+    with pytest.raises(FrozenInstanceError):
+        value_object.value = "Petr"  # type: ignore[misc]
+
+
+def test_value_objects_are_compared_and_hashed_by_value() -> None:
+    assert UserName("Ivan") == UserName("Ivan")
+    assert len({UserName("Ivan"), UserName("Ivan"), UserName("Petr")}) == 2
+
+
+def test_trusted_value_isnt_validated() -> None:
+    assert UserName.from_trusted("123").value == "123"
+    assert Password.from_trusted(b"").value == b""
+
+
+def test_trusted_value_object_is_the_same_as_validated() -> None:
+    trusted: UserSurname = UserSurname.from_trusted("Ivanov")
+
+    assert type(trusted) is UserSurname
+    assert trusted == UserSurname("Ivanov")
+    assert not hasattr(trusted, "__dict__")
+
+
+def test_input_passed_to_constructor_is_validated() -> None:
+    with pytest.raises(CantBeNumberError):
+        UserName("123")
+
+    with pytest.raises(EmptyFieldError):
+        UserSurname(" ")
+
+    with pytest.raises(EmptyPasswordError):
+        Password(b"")
+
+
+@pytest.mark.parametrize(
+    ("type_decorator", "value", "value_object_class"),
+    [
+        (UserNameTypeDecorator(), "123", UserName),
+        (UserSurnameTypeDecorator(), "", UserSurname),
+        (PasswordTypeDecorator(), b"", Password),
+    ],
+)
+def test_values_read_from_database_arent_validated(
+    type_decorator: UserNameTypeDecorator | UserSurnameTypeDecorator | PasswordTypeDecorator,
+    value: str | bytes,
+    value_object_class: type[BaseValueObject],
+) -> None:
+    value_object: BaseValueObject = type_decorator.process_result_value(value, dialect=None)  # type: ignore[arg-type]
+
+    assert type(value_object) is value_object_class
+    assert value_object.value == value
@@ -0,0 +1,84 @@
+import asyncio
+from collections.abc import Sequence
+from typing import Optional
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.security.base import BasePasswordHasher
+from app.infrastructure.services.warmup import Warmup, WarmupReport, get_warmup_connections
+
+pytestmark = pytest.mark.anyio
+
+
+class PausedPasswordHasher(BasePasswordHasher):
+    """
+    Hasher, which holds the first step of warm-up until release is set.
+    """
+
+    def __init__(self) -> None:
+        self.release: asyncio.Event = asyncio.Event()
+
+    async def hash_password(self, password: str) -> bytes:
+        await self.release.wait()
+        return b"hash"
+
+    async def hash_passwords(self, passwords: Sequence[str]) -> list[bytes]:
+        return [await self.hash_password(password) for password in passwords]
+
+    async def validate_password(self, password: str, hashed_password: bytes) -> bool:
+        return True
+
+    async def shutdown(self) -> None: ...
+
+
+class FakePublisher:
+    async def warm_up(self) -> None: ...
+
+
+def create_warmup(session_maker: async_sessionmaker[AsyncSession], hasher: BasePasswordHasher) -> Warmup:
+    return Warmup(
+        engine=session_maker.kw["bind"],
+        password_hasher=hasher,
+        publisher=FakePublisher(),  # type: ignore[arg-type]
+        connections=1,
+        report=WarmupReport(),
+    )
+
+
+async def test_application_is_ready_only_after_warm_up_in_background(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    hasher: PausedPasswordHasher = PausedPasswordHasher()
+    warmup: Warmup = create_warmup(session_maker, hasher)
+
+    await warmup.start()
+    await asyncio.sleep(0)
+
+    assert not warmup.report.ready
+
+    hasher.release.set()
+    await warmup._task  # type: ignore[misc]
+
+    assert warmup.report.ready
+    assert warmup.report.steps == {"password_hasher": "ok", "database_primary": "ok", "kafka": "ok"}
+
+
+async def test_stop_cancels_unfinished_warm_up(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    warmup: Warmup = create_warmup(session_maker, PausedPasswordHasher())
+
+    await warmup.start()
+    await asyncio.sleep(0)
+    await warmup.stop()
+
+    assert not warmup.report.ready
+
+
+@pytest.mark.parametrize(
+    ("pool_size", "connections", "expected"),
+    [(10, None, 5), (1, None, 1), (2, None, 1), (10, 3, 3), (10, 20, 9), (1, 5, 1)],
+)
+def test_warm_up_leaves_connections_of_pool_for_requests(
+    pool_size: int, connections: Optional[int], expected: int
+) -> None:
+    assert get_warmup_connections(pool_size, connections) == expected